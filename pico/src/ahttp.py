@@ -0,0 +1,87 @@
+# ahttp.py
+"""
+Minimal HTTP/1.0 client on asyncio streams (uasyncio on the Pico), so a
+request waits for the network without holding up the other tasks, unlike
+urequests. Responses have the urequests interface: status_code, content,
+text, json() and close().
+"""
+import aio
+import config
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+
+class Response:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode()
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        pass # Body already read, connection closed
+
+
+def split_url(url):
+    """Returns (host, port, path, tls) of an http or https URL."""
+    parts = url.split("/", 3)
+    tls = parts[0] == "https:"
+    host = parts[2]
+    path = "/" + (parts[3] if len(parts) > 3 else "")
+    port = 443 if tls else 80
+    if ":" in host:
+        host, port = host.split(":")
+        port = int(port)
+    return host, port, path, tls
+
+
+async def request(method, url, headers=None, body=None, timeout_ms=None):
+    """
+    Sends a request and returns its Response. Raises OSError on network
+    errors and aio.TimeoutError if it takes longer than timeout_ms
+    (config.HTTP_TIMEOUT_MS by default).
+    """
+    if timeout_ms is None:
+        timeout_ms = config.HTTP_TIMEOUT_MS
+    return await aio.wait_for_ms(_request(method, url, headers, body), timeout_ms)
+
+
+async def _request(method, url, headers, body):
+    host, port, path, tls = split_url(url)
+    reader, writer = await aio.open_connection(host, port, tls)
+    try:
+        head = f"{method} {path} HTTP/1.0\r\nHost: {host}\r\n"
+        for name in headers or ():
+            head += f"{name}: {headers[name]}\r\n"
+        if body is not None:
+            head += f"Content-Length: {len(body)}\r\n"
+        writer.write((head + "\r\n").encode())
+        if body:
+            writer.write(body)
+        await writer.drain()
+
+        status = int((await reader.readline()).split(None, 2)[1])
+        length = None
+        while True:
+            line = await reader.readline()
+            if not line or line == b"\r\n":
+                break
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value)
+        if length is None:
+            content = await reader.read(-1) # HTTP/1.0: body ends with the connection
+        else:
+            content = await reader.readexactly(length)
+        return Response(status, content)
+    finally:
+        writer.close()
+        await writer.wait_closed()
@@ -0,0 +1,84 @@
+# aio.py
+"""
+Cooperative runtime for the app tasks.
+
+Runs on uasyncio on the Pico and on CPython's asyncio on the host, so the
+same task graph runs in both places. Tasks talk through an EventQueue.
+
+Nothing blocks the loop: HTTP is awaited on streams (ahttp.py), the same
+code on both ports, so the host runs the tasks the way the Pico does.
+"""
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+IS_UASYNCIO = hasattr(asyncio, "sleep_ms")
+
+create_task = asyncio.create_task
+Event = asyncio.Event
+TimeoutError = asyncio.TimeoutError
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+if IS_UASYNCIO:
+    sleep_ms = asyncio.sleep_ms
+    wait_for_ms = asyncio.wait_for_ms
+else:
+    def sleep_ms(ms):
+        return asyncio.sleep(ms / 1000)
+
+    def wait_for_ms(aw, ms):
+        return asyncio.wait_for(aw, ms / 1000)
+
+
+def open_connection(host, port, tls=False):
+    """Opens a TCP (or TLS) connection, returns (reader, writer) streams."""
+    return asyncio.open_connection(host, port, ssl=True if tls else None)
+
+
+class EventQueue:
+    """
+    Fixed-size FIFO of events between tasks. put() never blocks and never
+    allocates; it returns False and drops the event when the queue is full.
+    """
+    def __init__(self, size=8):
+        self._items = [None] * size
+        self._head = 0
+        self._count = 0
+        self._event = Event()
+        self.dropped = 0
+
+    def __len__(self):
+        return self._count
+
+    def put(self, item):
+        size = len(self._items)
+        if self._count == size:
+            self.dropped += 1
+            return False
+        self._items[(self._head + self._count) % size] = item
+        self._count += 1
+        self._event.set()
+        return True
+
+    def get_nowait(self):
+        """Returns the oldest event, or None if the queue is empty."""
+        if not self._count:
+            return None
+        item = self._items[self._head]
+        self._items[self._head] = None
+        self._head = (self._head + 1) % len(self._items)
+        self._count -= 1
+        return item
+
+    async def get(self):
+        """Waits for and returns the oldest event."""
+        while not self._count:
+            self._event.clear()
+            await self._event.wait()
+        return self.get_nowait()
@@ -0,0 +1,128 @@
+# AUTOGENERATED by tools/build_assets.py – DO NOT EDIT
+FW_VERSION = "0.0.11"
+ROTATION = 180
+DIGEST = 0x4f5f2d2e
+
+# PackBits frame
+DATA = (
+    b'\xcf\xff\x00\xc0\xea\x00\x01\x03\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x06\xfb\xdf\xc1\x04\xc6c\xe7\xef\xff\x06'
+    b'\xfb\xdf\xe7\x9c\x92I\xc3\xef\xff\x06\xfb\xdf\xe7\x9f\x93\xc9'
+    b'\xdb\xef\xff\x06\xfb\xdf\xe7\x9f\x93\xc9\x9b\xef\xff\x06\xfb\xdf'
+    b'\xe7\x9f\x93\xc9\x9b\xef\xff\x05\xfb\xdf\xe7\x9f\x93\xc9\xee\xff'
+    b'\x05\xfb\xdf\xe1\x87\xc7\xe3\xee\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xf9\xff\x10\xf0'
+    b'|\x1f\x07\x81\xf8?\xe0\x1f\xff\x80\x7f\xff\x80\x0f\xfb\xdf'
+    b'\xf9\xff\x10\xf0|\x1f\x07\xc1\xf8?\x80\x07\xfe\x00\x1f\xfc'
+    b'\x00\x0f\xfb\xdf\xf9\xff\x10\xf0|\x1f\x07\xc0\xf8?\x00\x03'
+    b'\xfc\x00\x0f\xf8\x00\x0f\xfb\xdf\xf9\xff\x10\xf0|\x1f\x07\xc0'
+    b'\xf8>\x07\x81\xf8\x1e\x07\xf0>\x0f\xfb\xdf\xf9\xff\x10\xf0'
+    b'|\x1f\x07\xe0\xf8<\x0f\xc0\xf0?\x03\xe0~\x0f\xfb\xdf'
+    b'\xf5\xff\x0c\xe0x<\x1f\xe0\xf0\x7f\x83\xe0\xfe\x0f\xfb\xdf'
+    b'\xf5\xff\x00\xf0\xff8\x03?\xf0`\xff\xff\xc1\x03\xfe\x0f'
+    b'\xfb\xdf\xf5\xff\x06\xf8\x008?\xf0`\xff\xff\xc1\x03\xfe'
+    b'\x0f\xfb\xdf\xf5\xff\x06\xfe\x008?\xf0`\xff\xff\xc1\x03'
+    b'\xfe\x0f\xfb\xdf\xf5\xff\x06\xf8\x008?\xf0`\xff\xff\xc1'
+    b'\x03\xfe\x0f\xfb\xdf\xf5\xff\x06\xf0x8?\xf0`\xff\xff'
+    b'\xc1\x03\xfe\x0f\xfb\xdf\xf5\xff\x06\xe0\xf88?\xf0`\xff'
+    b'\xff\xc1\x03\xfe\x0f\xfb\xdf\xf5\xff\x0c\xe0\xf88?\xf0`'
+    b'\xff\xc1\xc0\xfe\x0f\xfb\xdf\xf5\xff\x0c\xe0\xf8<\x1f\xe0\xf0'
+    b'\x7f\x83\xe0\xfe\x0f\xfb\xdf\xf5\xff\x0c\xe0\xf8<\x0f\xc0\xf0'
+    b'?\x03\xe0~\x0f\xfb\xdf\xf5\xff\x0c\xe0x>\x07\x81\xf8'
+    b'\x1e\x07\xf0>\x0f\xfb\xdf\xf5\xff\x0c\xf0\x00?\x00\x03\xfc'
+    b'\x00\x0f\xf8\x00\x0f\xfb\xdf\xf5\xff\x0c\xf8\x00?\x80\x07\xfe'
+    b'\x00\x1f\xfc\x00\x0f\xfb\xdf\xf5\xff\x0c\xfc\x00?\xe0\x1f\xff'
+    b'\x80\x7f\xff\x80\x0f\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xfb\xff\x12\xf8\x03\xff\x03\xf0|\x1f\x03\xf0|\x00\x1f\xff'
+    b'\x83\xfe\x01\xff\xfb\xdf\xfb\xff\x12\xc0\x00\xff\x03\xf0|\x1f'
+    b'\x03\xf0|\x00\x1f\xff\x83\xf8\x00\x7f\xfb\xdf\xfb\xff\x12\xc0'
+    b'\x00\x7f\x01\xf0|\x1f\x01\xf0|\x00\x1f\xff\x83\xf0\x00?'
+    b'\xfb\xdf\xfb\xff\x12\xc1\xf0?\x01\xf0|\x1f\x01\xf0\x7f\xfc'
+    b'\x1f\xff\x83\xe0x\x1f\xfb\xdf\xfb\xff\x12\xc1\xf8\x1f\x00\xf0'
+    b'|\x1f\x00\xf0\x7f\xfc\x1f\xff\x83\xc0\xfc\x0f\xfb\xdf\xfb\xff'
+    b'\x12\xc1\xfc\x1f\x00\xf0|\x1f\x00\xf0\x7f\xfc\x1f\xff\x83\xc1'
+    b'\xfe\x0f\xfb\xdf\xfb\xff\x0c\xc1\xfe\x0f\x04p|\x1f\x04p'
+    b'\x7f\xfc\x1f\xff\xff\x83\x03\xff\x07\xfb\xdf\xfb\xff\x12\xc1\xfe'
+    b'\x0f\x04p|\x1f\x04p\x7f\xfc\x1f\xc0\x03\x83\xff\x07\xfb'
+    b'\xdf\xfb\xff\x12\xc0>\x0f\x040|\x1f\x040\x7f\xfc\x1f'
+    b'\x00\x03\x83\xff\x07\xfb\xdf\xfb\xff\x12\xc0>\x0f\x060|'
+    b'\x1f\x060~\x00\x1e\x00\x03\x83\xff\x07\xfb\xdf\xfb\xff\x0c'
+    b'\xc0>\x0f\x06\x10|\x1f\x06\x10~\x00\x1c\x0f\xff\x83\x03'
+    b'\xff\x07\xfb\xdf\xfa\xff\x0b\xfe\x0f\x07\x10|\x1f\x07\x10~'
+    b'\x00\x1c\x1f\xff\x83\x03\xff\x07\xfb\xdf\xfa\xff\x0b\xfe\x0f\x07'
+    b'\x00|\x1f\x07\x00\x7f\xfc\x1c\x1f\xff\x83\x03\xff\x07\xfb\xdf'
+    b'\xfa\xff\x11\xfc\x1f\x07\x80|\x1f\x07\x80\x7f\xfc\x1c\x1f\x83'
+    b'\xc1\xfe\x0f\xfb\xdf\xfb\xff\x12\xef\xf8\x1f\x07\x80|\x1f\x07'
+    b'\x80\x7f\xfc\x1c\x1f\x83\xc0\xfc\x0f\xfb\xdf\xfb\xff\x12\xe3\xf0'
+    b'?\x07\xc0|\x1f\x07\xc0\x7f\xfc\x1c\x0f\x83\xe0x\x1f\xfb'
+    b'\xdf\xfb\xff\x12\xe0\x00\x7f\x07\xc0|\x1f\x07\xc0|\x00\x1e'
+    b'\x00\x03\xf0\x00?\xfb\xdf\xfb\xff\x12\xe0\x00\xff\x07\xe0|'
+    b'\x1f\x07\xe0|\x00\x1f\x00\x03\xf8\x00\x7f\xfb\xdf\xfb\xff\x12'
+    b'\xf8\x03\xff\x07\xe0|\x1f\x07\xe0|\x00\x1f\xc0\x03\xfe\x01'
+    b'\xff\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xfc\xff\x13\xc0\x01\xe0\x00'
+    b'\xf8\x00?\xc0\x03\xfe\x01\xff\xc0?\xf0\x7f\xfe\x0f\xfb\xdf'
+    b'\xfc\xff\x13\xc0\x01\xe0\x00\xf8\x00?\x00\x03\xf8\x00\x7f\x00'
+    b'\x0f\xf0\x7f\xfe\x0f\xfb\xdf\xfc\xff\x13\xc0\x01\xe0\x00\xf8\x00'
+    b'>\x00\x03\xf0\x00?\x00\x07\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff'
+    b'\t\xc1\xff\xe0\xff\xf8<\x0f\x83\xe0x\xff\x1f\x06\x03\xf0'
+    b'\x7f\xfe\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xff\xf8<\x1f\x83'
+    b'\xc0\xfc\x0f\x7f\x81\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff\x12\xc1\xff'
+    b'\xe0\xff\xf8<\x1f\x83\xc1\xfe\x0f\xff\xc1\xf0\x7f\xfe\x0f\xfb'
+    b'\xdf\xfb\xff\x06\xc1\xff\xe0\xff\xf8<\x1f\xff\x83\t\xff\x07'
+    b'\xff\xe0\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff\x06\xc1\xff\xe0\xff\xf8'
+    b'<\x1f\xff\x83\t\xff\x07\xff\xe0\xf0\x7f\x00\x0f\xfb\xdf\xfb'
+    b'\xff\x06\xc1\xff\xe0\xff\xf8>\x0f\xff\x83\t\xff\x07\xff\xe0'
+    b'\xf0|\x00\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xfc\x00>\x00'
+    b'\x03\x83\xff\x07\xff\xe0\xf0x\x00\x0f\xfb\xdf\xfb\xff\x12\xc1'
+    b'\xff\xe0\xfc\x00?\x80\x03\x83\xff\x07\xff\xe0\xf0p>\x0f'
+    b'\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xfc\x00?\x00\x03\x83\xff\x07'
+    b'\xff\xe0\xf0p~\x0f\xfb\xdf\xfb\xff\x06\xc1\xff\xe0\xff\xf8'
+    b'>\x07\xff\x83\t\xff\x07\xff\xe0\xf0p~\x0f\xfb\xdf\xfb'
+    b'\xff\x12\xc1\xff\xe0\xff\xf8>\x0f\x83\xc1\xfe\x0f\xff\xc1\xf0'
+    b'p~\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xff\xf8>\x0f\x83'
+    b'\xc0\xfc\x0f\x7f\x81\xf0p~\x0f\xfb\xdf\xfb\xff\t\xc1\xff'
+    b'\xe0\xff\xf8>\x07\x83\xe0x\xff\x1f\x06\x03\xf0p>\x0f'
+    b'\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xf8\x00>\x00\x03\xf0\x00?'
+    b'\x00\x07\xf0x\x00\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xf8\x00'
+    b'?\x00\x03\xf8\x00\x7f\x00\x0f\xf0|\x00\x0f\xfb\xdf\xfb\xff'
+    b'\x12\xc1\xff\xe0\xf8\x00?\xc0\x03\xfe\x01\xff\xc0?\xf0\x7f'
+    b'\x00\x0f\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xc0'
+    b'\xea\x00\x00\x03\xcf\xff'
+)
@@ -0,0 +1,127 @@
+# AUTOGENERATED by tools/build_assets.py – DO NOT EDIT
+FW_VERSION = "0.0.11"
+ROTATION = 180
+DIGEST = 0x750c2837
+
+# PackBits frame
+DATA = (
+    b'\xcf\xff\x00\xc0\xea\x00\x01\x03\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x06\xfb\xdf\xc1\x04\xc6c\xe7\xef\xff\x06'
+    b'\xfb\xdf\xe7\x9c\x92I\xc3\xef\xff\x06\xfb\xdf\xe7\x9f\x93\xc9'
+    b'\xdb\xef\xff\x06\xfb\xdf\xe7\x9f\x93\xc9\x9b\xef\xff\x06\xfb\xdf'
+    b'\xe7\x9f\x93\xc9\x9b\xef\xff\x05\xfb\xdf\xe7\x9f\x93\xc9\xee\xff'
+    b'\x05\xfb\xdf\xe1\x87\xc7\xe3\xee\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x02\xfb\xdf\xc0'
+    b'\xec\x00\x01\x03\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff'
+    b'\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec'
+    b'\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff'
+    b'\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff'
+    b'\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xf7'
+    b'\xff\n\xfe\x03\xf1\xf3\x9f\xcf\xcc\xff<|\x7f\xff\xfb\xff'
+    b'\xdf\xf7\xff\x07\xfc\x01\xf0\xf3\x9f\xcf\xce~\xff|\x00\x7f'
+    b'\xff\xfb\xff\xdf\xf7\xff\n\xfc\xf8\xf0\xf3\x9f\xcf\xce~y'
+    b'9?\xff\xfb\xff\xdf\xf7\xff\xff\xfc\x08ps\x9f\xcf\xce'
+    b'\x00y9?\xff\xfb\xff\xdf\xf7\xff\x04\xfc>rs\x9f'
+    b'\xff\xcf\x03\x00\xf99?\xff\xfb\xff\xdf\xf7\xff\x04\xfc>'
+    b's3\x9f\xff\xcf\x03<\xf99?\xff\xfb\xff\xdf\xf6\xff'
+    b'\x03\xfes3\x9f\xff\xcf\x03\x18\xf3\x93\x9f\xff\xfb\xff\xdf'
+    b'\xf6\xff\x03\xfes\x93\x9f\xff\xcf\x03\x99\xf3\x93\x9f\xff\xfb'
+    b'\xff\xdf\xf6\xff\x03\xfcs\x83\x9f\xff\xcf\x03\x99\xf3\x93\x9f'
+    b'\xff\xfb\xff\xdf\xf7\xff\x04\xfe\xf8\xf3\xc3\x9f\xff\xcf\x03\xc3'
+    b'\xf3\x83\x9f\xff\xfb\xff\xdf\xf7\xff\n\xfe\x01\xf3\xc3\x9c\x00'
+    b'\xcf\xc3\xe7\xc7\xcf\xff\xfb\xff\xdf\xf6\xff\t\x03\xf3\xe3\x9c'
+    b'\x00\xcf\xc3\xe7\xc7\xcf\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf'
+    b'\xec\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb'
+    b'\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff'
+    b'\xff\xfb\xff\xdf\xec\xff\xff\xfb\xff\xdf\xec\xff\xff\xfb\x01\xdf'
+    b'\xc0\xec\x00\x02\x03\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xf2\xff\x01\xcc8\xff3\x05'
+    b'8a\xf9\x87\xfb\xdf\xf2\xff\x01\xcd\x9f\xfe3\x04,\xf9'
+    b'?\xfb\xdf\xf2\xff\xff\xcf\xff1\x053>\x7f?\xfb\xdf'
+    b'\xf2\xff\x01\xcf\xc8\xff1\x053>\x7f\x8f\xfb\xdf\xf2\xff'
+    b'\xff\xcf\xff2\x053>\x7f?\xfb\xdf\xf2\xff\x01\xcd\x9f'
+    b'\xff2\x053,\xff?\xfb\xdf\xf2\xff\x01\x008\xff3'
+    b'\x058a\xff\x87\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xf1\xff\x00\xfb\xfb\xff\x01\xfb\xdf\xf2\xff\t\xf3'
+    b'8~d\xe0xy\x07\xfb\xdf\xf2\xff\t\xf93>f'
+    b'\x0b3y\xe7\xfb\xdf\xf2\xff\t\xf93>&O\x93\xff'
+    b'\xcf\xfb\xdf\xf2\xff\t\xfc3>&O\x98\xff\x9f\xfb\xdf'
+    b'\xf2\xff\t\xf93>G\x1f\x9e\x7f?\xfb\xdf\xf2\xff\t'
+    b'\xf93>G\x1b6\x7f?\xfb\xdf\xf2\xff\t\xfc8~'
+    b'g\x18p\xff\x87\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b"\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xf2\xff\t\x9f'<\xc8>"
+    b'p\xf9\x07\xfb\xdf\xf2\xff\t\x9f0|\xcf>fy\x9f'
+    b'\xfb\xdf\xf2\xff\t\x9f2|O>f\x7f\x9f\xfb\xdf\xf3'
+    b'\xff\n\xfe\x1c2|H8f\x7f\x9f\xfb\xdf\xf3\xff\n'
+    b'\xfc\x998\xfc\x8f2f\x7f\x9f\xfb\xdf\xf3\xff\n\xfc\x99'
+    b'8\xfc\x8f2f\x7f\x9f\xfb\xdf\xf3\xff\n\xfe\x1c8\xfc'
+    b'\xc88p\xff\x87\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xf9\xff\x10\x80~\x03\xe0~\x7f\xcf\xff\xf3\xe0\x7f\x9f'
+    b'\x80|\x0f\xfb\xdf\xf9\xff\x10\x80x\x03\xc0>\x7f\xcf\xff'
+    b'\xf3\xc0?\x9f\x80x\x07\xfb\xdf\xf9\xff\x10\xfeq\xf3\x8f'
+    b'\x1eq\xcf\xff\xf3\x8f\x1f\x9f\xfes\xf7\xfb\xdf\xf9\xff\x08'
+    b'\xfec\xf3\x1f\x8eq\xcf\xff\xf3\xfe\x9f\x04\xfes\xff\xfb'
+    b'\xdf\xf9\xff\x08\xfeg\xf3?\xced\xcf\xfc\x03\xfe\x9f\x04'
+    b'\xfep\xff\xfb\xdf\xf9\xff\x08\x80g\xf3?\xced\xcf\xf8'
+    b'\x03\xfe\x9f\x04\x80x?\xfb\xdf\xf9\xff\x08\x80g\xf3?'
+    b'\xceNO\xf1\xf3\xfe\x9f\x04\x80~\x0f\xfb\xdf\xf9\xff\x06'
+    b'\xfeg\xf3?\xceNO\xff\xf3\xfe\x9f\x04\xfe\x7f\x87\xfb'
+    b'\xdf\xf9\xff\x06\xfec\xf3\x1f\x8e\x1f\x0f\xff\xf3\xfe\x9f\x04'
+    b'\xfe\x7f\xe7\xfb\xdf\xf9\xff\x08\xfeq\xf3\x8f\x1e\x1f\x0f\xf1'
+    b'\xf3\xfe\x9f\x04\xfe{\xe7\xfb\xdf\xf9\xff\x10\x80x\x03\xc0'
+    b'>?\x8f\xf8\x03\x9f\x98\x01\x80x\x0f\xfb\xdf\xf9\xff\x10'
+    b'\x80~\x03\xe0~?\x8f\xfc\x03\x9f\x98\x01\x80x\x1f\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xfc\xff\x13\xc0\x01\xe0'
+    b'\x00\xf8\x00?\xc0\x03\xfe\x01\xff\xc0?\xf0\x7f\xfe\x0f\xfb'
+    b'\xdf\xfc\xff\x13\xc0\x01\xe0\x00\xf8\x00?\x00\x03\xf8\x00\x7f'
+    b'\x00\x0f\xf0\x7f\xfe\x0f\xfb\xdf\xfc\xff\x13\xc0\x01\xe0\x00\xf8'
+    b'\x00>\x00\x03\xf0\x00?\x00\x07\xf0\x7f\xfe\x0f\xfb\xdf\xfb'
+    b'\xff\t\xc1\xff\xe0\xff\xf8<\x0f\x83\xe0x\xff\x1f\x06\x03'
+    b'\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xff\xf8<\x1f'
+    b'\x83\xc0\xfc\x0f\x7f\x81\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff\x12\xc1'
+    b'\xff\xe0\xff\xf8<\x1f\x83\xc1\xfe\x0f\xff\xc1\xf0\x7f\xfe\x0f'
+    b'\xfb\xdf\xfb\xff\x06\xc1\xff\xe0\xff\xf8<\x1f\xff\x83\t\xff'
+    b'\x07\xff\xe0\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff\x06\xc1\xff\xe0\xff'
+    b'\xf8<\x1f\xff\x83\t\xff\x07\xff\xe0\xf0\x7f\x00\x0f\xfb\xdf'
+    b'\xfb\xff\x06\xc1\xff\xe0\xff\xf8>\x0f\xff\x83\t\xff\x07\xff'
+    b'\xe0\xf0|\x00\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xfc\x00>'
+    b'\x00\x03\x83\xff\x07\xff\xe0\xf0x\x00\x0f\xfb\xdf\xfb\xff\x12'
+    b'\xc1\xff\xe0\xfc\x00?\x80\x03\x83\xff\x07\xff\xe0\xf0p>'
+    b'\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xfc\x00?\x00\x03\x83\xff'
+    b'\x07\xff\xe0\xf0p~\x0f\xfb\xdf\xfb\xff\x06\xc1\xff\xe0\xff'
+    b'\xf8>\x07\xff\x83\t\xff\x07\xff\xe0\xf0p~\x0f\xfb\xdf'
+    b'\xfb\xff\x12\xc1\xff\xe0\xff\xf8>\x0f\x83\xc1\xfe\x0f\xff\xc1'
+    b'\xf0p~\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xff\xf8>\x0f'
+    b'\x83\xc0\xfc\x0f\x7f\x81\xf0p~\x0f\xfb\xdf\xfb\xff\t\xc1'
+    b'\xff\xe0\xff\xf8>\x07\x83\xe0x\xff\x1f\x06\x03\xf0p>'
+    b'\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xf8\x00>\x00\x03\xf0\x00'
+    b'?\x00\x07\xf0x\x00\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xf8'
+    b'\x00?\x00\x03\xf8\x00\x7f\x00\x0f\xf0|\x00\x0f\xfb\xdf\xfb'
+    b'\xff\x12\xc1\xff\xe0\xf8\x00?\xc0\x03\xfe\x01\xff\xc0?\xf0'
+    b'\x7f\x00\x0f\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xc0\xea\x00\x00\x03\xcf\xff'
+)
@@ -0,0 +1,101 @@
+# AUTOGENERATED by tools/build_assets.py – DO NOT EDIT
+FW_VERSION = "0.0.11"
+ROTATION = 180
+DIGEST = 0xd9144a75
+
+# PackBits frame
+DATA = (
+    b'\xcf\xff\x00\xc0\xea\x00\x01\x03\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x06\xfb\xdf\xc1\x04\xc6c\xe7\xef\xff\x06'
+    b'\xfb\xdf\xe7\x9c\x92I\xc3\xef\xff\x06\xfb\xdf\xe7\x9f\x93\xc9'
+    b'\xdb\xef\xff\x06\xfb\xdf\xe7\x9f\x93\xc9\x9b\xef\xff\x06\xfb\xdf'
+    b'\xe7\x9f\x93\xc9\x9b\xef\xff\x05\xfb\xdf\xe7\x9f\x93\xc9\xee\xff'
+    b'\x05\xfb\xdf\xe1\x87\xc7\xe3\xee\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xf7\xff\x0e\xf3\xcf8\x0f\xc7\xce'
+    b'\x7f?\xc0\xff\x03\xf8\x07\xfb\xdf\xf7\xff\x0e\xf3\xcf0\x07'
+    b'\xc3\xce\x7f?\x80~\x01\xe0\x07\xfb\xdf\xf7\xff\n\xf3\xcf'
+    b'3\xe3\xc3\xce\x7f?\x1e<x\xff\xe7\x01\xfb\xdf\xf5\xff'
+    b'\x0c\xf3\xf1\xc1\xce\x7f>?\x18\xfcg\xe7\xfb\xdf\xf5\xff'
+    b'\x0c\xf0\xf9\xc9\xce\x7f>\x7f\x99\xfeg\xe7\xfb\xdf\xf5\xff'
+    b'\x0c\xf0\xf9\xcc\xce\x7f>\x7f\x99\xfep\x07\xfb\xdf\xf4\xff'
+    b'\x0b\xf9\xcc\xce\x7f>\x7f\x99\xfep\x07\xfb\xdf\xf4\xff\x0b'
+    b'\xf9\xceN\x7f>\x7f\x99\xfec\xe7\xfb\xdf\xf4\xff\x0b\xf1'
+    b'\xce\x0e\x7f>?\x18\xfcg\xe7\xfb\xdf\xf5\xff\x0c\xfb\xe3'
+    b'\xcf\x0e\x7f?\x1e<x\xe3\xe7\xfb\xdf\xf5\xff\x0c\xf8\x07'
+    b'\xcf\x0ep\x03\x80~\x01\xe0\x07\xfb\xdf\xf5\xff\x0c\xfc\x0f'
+    b'\xcf\x8ep\x03\xc0\xff\x03\xf8\x07\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01'
+    b'\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xfc\xff\x13\xc0\x01\xe0\x00\xf8\x00?\xc0\x03\xfe\x01\xff'
+    b'\xc0?\xf0\x7f\xfe\x0f\xfb\xdf\xfc\xff\x13\xc0\x01\xe0\x00\xf8'
+    b'\x00?\x00\x03\xf8\x00\x7f\x00\x0f\xf0\x7f\xfe\x0f\xfb\xdf\xfc'
+    b'\xff\x13\xc0\x01\xe0\x00\xf8\x00>\x00\x03\xf0\x00?\x00\x07'
+    b'\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff\t\xc1\xff\xe0\xff\xf8<\x0f'
+    b'\x83\xe0x\xff\x1f\x06\x03\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff\x12'
+    b'\xc1\xff\xe0\xff\xf8<\x1f\x83\xc0\xfc\x0f\x7f\x81\xf0\x7f\xfe'
+    b'\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xff\xf8<\x1f\x83\xc1\xfe'
+    b'\x0f\xff\xc1\xf0\x7f\xfe\x0f\xfb\xdf\xfb\xff\x06\xc1\xff\xe0\xff'
+    b'\xf8<\x1f\xff\x83\t\xff\x07\xff\xe0\xf0\x7f\xfe\x0f\xfb\xdf'
+    b'\xfb\xff\x06\xc1\xff\xe0\xff\xf8<\x1f\xff\x83\t\xff\x07\xff'
+    b'\xe0\xf0\x7f\x00\x0f\xfb\xdf\xfb\xff\x06\xc1\xff\xe0\xff\xf8>'
+    b'\x0f\xff\x83\t\xff\x07\xff\xe0\xf0|\x00\x0f\xfb\xdf\xfb\xff'
+    b'\x12\xc1\xff\xe0\xfc\x00>\x00\x03\x83\xff\x07\xff\xe0\xf0x'
+    b'\x00\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xfc\x00?\x80\x03\x83'
+    b'\xff\x07\xff\xe0\xf0p>\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0'
+    b'\xfc\x00?\x00\x03\x83\xff\x07\xff\xe0\xf0p~\x0f\xfb\xdf'
+    b'\xfb\xff\x06\xc1\xff\xe0\xff\xf8>\x07\xff\x83\t\xff\x07\xff'
+    b'\xe0\xf0p~\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xff\xf8>'
+    b'\x0f\x83\xc1\xfe\x0f\xff\xc1\xf0p~\x0f\xfb\xdf\xfb\xff\x12'
+    b'\xc1\xff\xe0\xff\xf8>\x0f\x83\xc0\xfc\x0f\x7f\x81\xf0p~'
+    b'\x0f\xfb\xdf\xfb\xff\t\xc1\xff\xe0\xff\xf8>\x07\x83\xe0x'
+    b'\xff\x1f\x06\x03\xf0p>\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0'
+    b'\xf8\x00>\x00\x03\xf0\x00?\x00\x07\xf0x\x00\x0f\xfb\xdf'
+    b'\xfb\xff\x12\xc1\xff\xe0\xf8\x00?\x00\x03\xf8\x00\x7f\x00\x0f'
+    b'\xf0|\x00\x0f\xfb\xdf\xfb\xff\x12\xc1\xff\xe0\xf8\x00?\xc0'
+    b'\x03\xfe\x01\xff\xc0?\xf0\x7f\x00\x0f\xfb\xdf\xea\xff\x01\xfb'
+    b'\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf'
+    b'\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea'
+    b'\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff\x01\xfb\xdf\xea\xff'
+    b'\x01\xfb\xdf\xea\xff\x01\xfb\xc0\xea\x00\x00\x03\xcf\xff'
+)
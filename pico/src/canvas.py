@@ -0,0 +1,204 @@
+# canvas.py
+"""
+Drawing surface used by the UI.
+
+Wraps a MONO_HLSB framebuf.FrameBuffer and keeps a handle on the raw
+buffer, so that fast byte-level operations (glyph blits, rotation) can work
+on the same pixels as the regular framebuf primitives.
+
+With rotation=180 all drawing happens directly in rotated coordinates: the
+caller uses the logical (upright) layout and the buffer ends up in panel
+orientation, so no rotation pass or second buffer is needed.
+"""
+
+import framebuf
+
+import stats
+
+try:
+    from binascii import crc32
+except ImportError:
+    crc32 = None
+
+
+def _bit_reverse_table():
+    table = bytearray(256)
+    for i in range(256):
+        r = 0
+        for b in range(8):
+            if i & (1 << b):
+                r |= 0x80 >> b
+        table[i] = r
+    return bytes(table)
+
+# BIT_REVERSE[b] is b with its bit order mirrored (MSB <-> LSB)
+BIT_REVERSE = _bit_reverse_table()
+
+
+def rotate180(buf, width, height):
+    """
+    Rotates a MONO_HLSB buffer by 180 degrees in place.
+    With whole-byte rows this is just the byte order reversed and every byte
+    bit-reversed, so it runs on bytes instead of pixels.
+    """
+    rev = BIT_REVERSE
+    i = 0
+    j = (width >> 3) * height - 1
+    while i < j:
+        a = buf[i]
+        buf[i] = rev[buf[j]]
+        buf[j] = rev[a]
+        i += 1
+        j -= 1
+    if i == j:
+        buf[i] = rev[buf[i]]
+
+
+def frame_digest(buf):
+    """Cheap digest of a frame, used to detect unchanged frames."""
+    if crc32:
+        return crc32(buf)
+    # Fletcher-32 fallback for ports built without binascii.crc32
+    a = b = 0
+    for v in buf:
+        a = (a + v) % 65535
+        b = (b + a) % 65535
+    return (b << 16) | a
+
+
+def dirty_rects(new, old, width, height, gap=8):
+    """
+    Compares two MONO_HLSB frames and returns the changed areas as byte-aligned
+    (x, y, w, h) rectangles. Changed rows less than gap rows apart are merged
+    into one band, spanning the union of the changed byte columns.
+    """
+    stride = width >> 3
+    rects = []
+    top = bottom = -1
+    lo = hi = 0
+    off = 0
+    for y in range(height):
+        first = -1
+        for k in range(stride):
+            if new[off + k] != old[off + k]:
+                first = k
+                break
+        if first >= 0:
+            last = first
+            for k in range(stride - 1, first, -1):
+                if new[off + k] != old[off + k]:
+                    last = k
+                    break
+
+            if top >= 0 and y - bottom > gap:
+                rects.append((lo << 3, top, (hi - lo + 1) << 3, bottom - top + 1))
+                top = -1
+            if top < 0:
+                top = y
+                lo, hi = first, last
+            else:
+                lo = min(lo, first)
+                hi = max(hi, last)
+            bottom = y
+        off += stride
+
+    if top >= 0:
+        rects.append((lo << 3, top, (hi - lo + 1) << 3, bottom - top + 1))
+    return rects
+
+
+class Canvas:
+    def __init__(self, buf, width, height, rotation=0):
+        self.buf = buf
+        self.width = width
+        self.height = height
+        self.fb = framebuf.FrameBuffer(buf, width, height, framebuf.MONO_HLSB)
+        self.rotation = rotation
+
+    # --- framebuf primitives ---
+    def fill(self, c):
+        if stats.ENABLED:
+            stats.add("draw_calls")
+        self.fb.fill(c)
+
+    def pixel(self, x, y, c=None):
+        if stats.ENABLED:
+            stats.add("draw_calls")
+        if self.rotation == 180:
+            x = self.width - 1 - x
+            y = self.height - 1 - y
+        if c is None:
+            return self.fb.pixel(x, y)
+        self.fb.pixel(x, y, c)
+
+    def rect(self, x, y, w, h, c):
+        if stats.ENABLED:
+            stats.add("draw_calls")
+        if self.rotation == 180:
+            x = self.width - x - w
+            y = self.height - y - h
+        self.fb.rect(x, y, w, h, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        if stats.ENABLED:
+            stats.add("draw_calls")
+        if self.rotation == 180:
+            x = self.width - x - w
+            y = self.height - y - h
+        self.fb.fill_rect(x, y, w, h, c)
+
+    # --- Extensions ---
+    def write(self, text, x, y, font, c=0):
+        """Draws text in a fonts.Font and returns the x after it."""
+        if stats.ENABLED:
+            stats.add("draw_calls")
+        return font.draw(self.buf, self.width, self.height, text, x, y, c,
+                         rotated=(self.rotation == 180))
+
+    def restore(self, frame, x, y, w, h):
+        """Copies the area (x, y, w, h) from frame, a buffer of the same layout. x and w must be multiples of 8."""
+        if stats.ENABLED:
+            stats.add("draw_calls")
+        if self.rotation == 180:
+            x = self.width - x - w
+            y = self.height - y - h
+        stride = self.width >> 3
+        src = memoryview(frame)
+        buf = self.buf
+        start = y * stride + (x >> 3)
+        end = start + (w >> 3)
+        for _ in range(h):
+            buf[start:end] = src[start:end]
+            start += stride
+            end += stride
+
+    def rotate180(self):
+        """Rotates the current content in place."""
+        rotate180(self.buf, self.width, self.height)
+
+
+class FrameBufferPool:
+    """
+    Two frames allocated once at boot and reused for every redraw.
+    front holds what the panel currently shows, back is the one being drawn.
+    """
+    def __init__(self, width, height, rotation=0):
+        size = (width >> 3) * height
+        self.front = Canvas(bytearray(size), width, height, rotation)
+        self.back = Canvas(bytearray(size), width, height, rotation)
+        self.front_valid = False # True once front matches the panel
+
+    def acquire(self, rotation=0, template=None):
+        """Returns the back canvas, cleared to white or copied from a template frame."""
+        back = self.back
+        back.rotation = rotation
+        if template is None:
+            back.fill(1)
+        else:
+            back.buf[:] = template
+        return back
+
+    def swap(self):
+        """Call after back has been pushed to the panel."""
+        self.front, self.back = self.back, self.front
+        self.front_valid = True
@@ -25,11 +25,21 @@ PIN_EPD_BUSY = 10      # Busy Signal (GP10)
 FILE_WIFI = "/flash/wifi.json"
 
 # Timing
-RING_DEBOUNCE_MS = 300
+RING_DEBOUNCE_MS = 300        # A ring ends once the input has been idle this long
+BTN_DEBOUNCE_MS = 50
 DOOR_PULSE_S = 0.3
+HTTP_TIMEOUT_MS = 10000       # A request that takes longer fails, see ahttp.py
 STATUS_CHECK_INTERVAL_S = 10  # Check for open status every 10s after ring
 STATUS_CHECK_DURATION_S = 300 # Keep checking for 5 minutes
 
+# Display
+EPD_MAX_PARTIALS = 20         # Full refresh after this many partial refreshes
+EPD_FULL_REFRESH_S = 3600     # ...or when the last full refresh is older than this
+EPD_LOW_TEMP_C = 5            # Below this, partial refreshes use the slower low-temp waveform
+EPD_TEMP_INTERVAL_S = 600     # Panel temperature is measured at wake-up, at most this often
+DISPLAY_MIN_DWELL_MS = 1500   # Requested screens replaced sooner than this are not drawn
+STATS_ENABLED = False         # Display instrumentation counters, see stats.py
+
 # --- Load Configuration ---
 
 def load_config(file_wifi):
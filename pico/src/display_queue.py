@@ -0,0 +1,100 @@
+# display_queue.py
+"""
+Display request queue.
+
+Callers post the screen they want, now or after a delay, instead of
+refreshing in line. The renderer asks next() for the screen to draw once the
+panel is free. A screen that is superseded before it is drawn, or that
+would be replaced by the next request within the minimum dwell time, is
+dropped: an e-paper refresh takes longer than such a screen stays useful.
+A screen posted with hold=True is never dropped; once it is drawn, the
+requests after it wait until it has been shown for the minimum dwell time.
+"""
+
+import config
+
+
+class DisplayQueue:
+    def __init__(self, hal, min_dwell_ms=None, size=8):
+        self.hal = hal
+        self.min_dwell_ms = config.DISPLAY_MIN_DWELL_MS if min_dwell_ms is None else min_dwell_ms
+        # Requests in order: mode, time posted, delay and hold flag, allocated once
+        self._modes = [None] * size
+        self._t0 = [0] * size
+        self._delay = [0] * size
+        self._hold = bytearray(size)
+        self._count = 0
+        self.collapsed = 0 # Requests dropped without a refresh
+
+    def __len__(self):
+        return self._count
+
+    def last(self):
+        """The most recently requested mode, or None."""
+        return self._modes[self._count - 1] if self._count else None
+
+    def post(self, mode, delay_ms=0, hold=False):
+        """
+        Requests mode, delay_ms from now. Requests must be posted in the order
+        they are due. With hold=True the screen is shown for at least
+        min_dwell_ms, however soon other requests follow.
+        """
+        if self._count == len(self._modes):
+            self._pop(1) # Full: the oldest request is the least relevant
+            self.collapsed += 1
+        i = self._count
+        self._modes[i] = mode
+        self._t0[i] = self.hal.get_time_ms()
+        self._delay[i] = delay_ms
+        self._hold[i] = hold
+        self._count = i + 1
+
+    def _due_in(self, i):
+        """Milliseconds until request i is due, <= 0 once it is."""
+        return self._delay[i] - self.hal.time_diff(self._t0[i])
+
+    def _pop(self, n):
+        modes, t0, delay, hold = self._modes, self._t0, self._delay, self._hold
+        for i in range(n, self._count):
+            modes[i - n] = modes[i]
+            t0[i - n] = t0[i]
+            delay[i - n] = delay[i]
+            hold[i - n] = hold[i]
+        self._count -= n
+        for i in range(self._count, self._count + n):
+            modes[i] = None
+
+    def next(self):
+        """
+        Returns the mode to draw now, or None. Of the requests that are due,
+        only the last counts; it is dropped as well if the following request
+        is due within min_dwell_ms. A held request due is drawn instead, and
+        the requests after it are put back to min_dwell_ms from now.
+        """
+        n = 0
+        held = -1
+        while n < self._count and self._due_in(n) <= 0:
+            if self._hold[n]:
+                held = n
+            n += 1
+        if n == 0:
+            return None
+
+        if held >= 0:
+            mode = self._modes[held]
+            self._pop(held + 1)
+            self.collapsed += held
+            now = self.hal.get_time_ms()
+            for i in range(self._count):
+                self._delay[i] = max(self._due_in(i), self.min_dwell_ms)
+                self._t0[i] = now
+            return mode
+
+        mode = self._modes[n - 1]
+        short = n < self._count and self._due_in(n) < self.min_dwell_ms
+        self._pop(n)
+        if short:
+            self.collapsed += n
+            return None
+        self.collapsed += n - 1
+        return mode
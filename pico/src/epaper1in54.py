@@ -15,55 +15,346 @@ This driver uses 4-wire SPI:
 3. DIN/MOSI: The data being sent from the Pico to the Screen.
 4. DC (Data/Command): Tells the screen if the incoming byte is a code (LOW)
    or image data (HIGH).
+The controller answers reads on the same data line (SDA is bidirectional),
+so reading registers needs a read function from the board (see Transport).
+
+--- ASYNCHRONOUS REFRESH ---
+A refresh keeps the BUSY pin HIGH for hundreds of milliseconds up to
+seconds. With wait=False, display()/display_partial() start the refresh and
+return immediately. The falling edge of BUSY (pin IRQ) marks completion;
+poll is_busy() or pass a callback. Any further command first waits for a
+running refresh to finish. The refresh is armed only once it has been
+activated, and only a falling edge after BUSY was seen high completes it:
+a late edge of an earlier operation (reset, a previous refresh) does not.
+
+--- WAVEFORMS (LUTs) AND PROFILES ---
+The waveform (LUT) decides which voltages drive the pixels, and for how
+long. The OTP waveform used by a full refresh is slow but clean. Partial
+refreshes can use a short custom LUT uploaded with command 0x32 together
+with the gate/source/VCOM voltage registers. Named profiles in PROFILES
+bundle a LUT (None = OTP) with the Display Update Control 2 value.
+
+--- DIFFERENTIAL PARTIAL REFRESH ---
+The controller has two RAM banks: 0x24 holds the new image, 0x26 the
+previous one. A partial refresh only drives pixels that differ between the
+two. Once a refresh has completed, the written area is copied into 0x26
+too, so the next partial refresh diffs against what is really on the
+panel. The image passed to display()/display_partial() must therefore stay
+unchanged until the refresh has completed (is_busy() returns False).
 """
 
 import time
 
+import stats
+
 # Display resolution
 EPD_WIDTH       = 200
 EPD_HEIGHT      = 200
 
+BUSY_TIMEOUT_MS = 5000
+
+# Init sequence, packed as: command, data length, data bytes...
+_INIT_SEQUENCE = bytes((
+    0x01, 3, 0xC7, 0x00, 0x00,       # Driver output control: sets mux and scan direction
+    0x11, 1, 0x03,                   # Data entry mode: X-increment, Y-increment
+    0x44, 2, 0x00, 0x18,             # RAM X range: 0 to 24 (25*8=200px)
+    0x45, 4, 0x00, 0x00, 0xC7, 0x00, # RAM Y range: 0 to 199
+    0x3C, 1, 0x01,                   # Border waveform
+    0x18, 1, 0x80,                   # Internal temp sensor
+    0x4E, 1, 0x00,                   # RAM address X = 0
+    0x4F, 2, 0x00, 0x00,             # RAM address Y = 0
+))
+
+# Static white chunk (8 rows) for clearing the RAM banks
+_WHITE_CHUNK = b"\xff" * 200
+
+# Partial refresh waveform from the vendor's reference driver for this panel.
+# 153 bytes LUT (5x12 voltage selects, 12 groups of phase timings, frame rates,
+# gate scan), then EOPT, gate voltage, source voltages (3) and VCOM.
+LUT_PARTIAL = bytes((
+    0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x80, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x40, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x22, 0x22, 0x22, 0x22, 0x22, 0x22, 0x00, 0x00, 0x00,
+    0x22, 0x17, 0x41, 0xB0, 0x32, 0x36,
+))
+
+# Same waveform with the main drive phase (group 0, TP A) doubled: pigments
+# move slower in the cold, so a longer pulse is needed to avoid faint pixels.
+LUT_PARTIAL_LOW_TEMP = LUT_PARTIAL[:60] + bytes((0x1E,)) + LUT_PARTIAL[61:]
+
+# name: (LUT or None for the OTP waveform, Display Update Control 2 value)
+PROFILES = {
+    "quality-full": (None, 0xF7),         # OTP waveform, temperature compensated
+    "builtin-partial": (None, 0xFF),      # OTP DISPLAY Mode 2
+    "fast-partial": (LUT_PARTIAL, 0xCF),  # Custom LUT, Mode 2
+    "low-temp": (LUT_PARTIAL_LOW_TEMP, 0xCF),
+}
+
+def _lut_sequence(lut):
+    """Packs LUT and voltage registers into one command sequence."""
+    return (bytes((0x32, 153)) + lut[:153] +
+            bytes((0x3F, 1, lut[153],                       # EOPT
+                   0x03, 1, lut[154],                       # Gate voltage
+                   0x04, 3, lut[155], lut[156], lut[157],   # Source voltages
+                   0x2C, 1, lut[158],                       # VCOM
+                   0x3C, 1, 0x80)))                         # Border follows LUT
+
+def _ticks_ms():
+    if hasattr(time, 'ticks_ms'):
+        return time.ticks_ms()
+    return int(time.time() * 1000)
+
+def _ticks_diff(end, start):
+    if hasattr(time, 'ticks_diff'):
+        return time.ticks_diff(end, start)
+    return end - start
+
+class Transport:
+    """
+    4-wire SPI link to the controller.
+    Commands and their data go out in a single CS transaction, and the scratch
+    buffers are preallocated, so sending commands does not allocate.
+    read(n), if given, clocks n bytes in from the controller's data line;
+    without it registers cannot be read.
+    """
+    def __init__(self, spi, cs, dc, read=None):
+        self.spi = spi
+        self.cs = cs
+        self.dc = dc
+        self._read = read
+        self._byte = bytearray(1)
+
+    @property
+    def can_read(self):
+        return self._read is not None
+
+    def read(self, command, n):
+        """Sends command and returns the n data bytes the controller answers with."""
+        self.cs.off()
+        self._write_command(command)
+        self.dc.on()
+        data = self._read(n)
+        self.cs.on()
+        if stats.ENABLED:
+            stats.add("spi_bytes") # The command; the answer is not written
+        return data
+
+    def command(self, command, data=None):
+        """Sends a command byte, optionally followed by data (int or buffer)."""
+        self.cs.off()
+        self._write_command(command)
+        if data is not None:
+            self.dc.on()
+            if isinstance(data, int):
+                self._byte[0] = data
+                self.spi.write(self._byte)
+            else:
+                self.spi.write(data)
+        self.cs.on()
+        if stats.ENABLED:
+            stats.add("spi_bytes", 1 if data is None else 2 if isinstance(data, int) else 1 + len(data))
+
+    def data(self, data):
+        """Sends data bytes (int or buffer)."""
+        self.dc.on()
+        self.cs.off()
+        if isinstance(data, int):
+            self._byte[0] = data
+            self.spi.write(self._byte)
+        else:
+            self.spi.write(data)
+        self.cs.on()
+        if stats.ENABLED:
+            stats.add("spi_bytes", 1 if isinstance(data, int) else len(data))
+
+    def sequence(self, seq):
+        """Sends a packed sequence (command, length, data...) in one CS transaction."""
+        mv = memoryview(seq)
+        i = 0
+        n = len(seq)
+        commands = 0
+        self.cs.off()
+        while i < n:
+            commands += 1
+            self._write_command(seq[i])
+            count = seq[i + 1]
+            i += 2
+            if count:
+                self.dc.on()
+                if count == 1:
+                    self._byte[0] = seq[i]
+                    self.spi.write(self._byte)
+                else:
+                    self.spi.write(mv[i:i + count])
+                i += count
+        self.cs.on()
+        if stats.ENABLED:
+            stats.add("spi_bytes", n - commands) # Without the length bytes
+
+    def begin_data(self, command):
+        """Sends command and leaves CS low for streaming data with write()."""
+        self.cs.off()
+        self._write_command(command)
+        self.dc.on()
+        if stats.ENABLED:
+            stats.add("spi_bytes")
+
+    def write(self, buf):
+        self.spi.write(buf)
+        if stats.ENABLED:
+            stats.add("spi_bytes", len(buf))
+
+    def end(self):
+        self.cs.on()
+
+    def _write_command(self, command):
+        self.dc.off()
+        self._byte[0] = command
+        self.spi.write(self._byte)
+
+
 class EPD:
-    def __init__(self, spi, cs, dc, rst, busy):
+    def __init__(self, spi, cs, dc, rst, busy, read=None):
         self.spi = spi
         self.cs = cs
         self.dc = dc
+        self.transport = Transport(spi, cs, dc, read)
         self.rst = rst
         self.busy = busy
         self.width = EPD_WIDTH
         self.height = EPD_HEIGHT
         self.is_functional = True
+        self.asleep = False # In deep sleep: only a reset (init) wakes it up
+
+        # Asynchronous refresh state
+        self.refreshing = False
+        self._refresh_t0 = 0
+        self._busy_seen = False # BUSY seen high since the refresh was activated
+        self._on_done = None
+        falling = getattr(busy, "IRQ_FALLING", None)
+        if falling is not None and hasattr(busy, "irq"):
+            busy.irq(handler=self._busy_edge, trigger=falling | getattr(busy, "IRQ_RISING", 0))
+
+        # Preallocated parameter sequences, patched in place before sending
+        self._window_seq = bytearray((0x44, 2, 0, 0, 0x45, 4, 0, 0, 0, 0))
+        self._address_seq = bytearray((0x4E, 1, 0, 0x4F, 2, 0, 0))
+        self._refresh_seq = bytearray((0x22, 1, 0, 0x20, 0))
+
+        # Name of the custom LUT currently in the controller (None = OTP)
+        self.lut_loaded = None
+        self._lut_sequences = {}
+
+        # Frame to copy into the previous-image bank (0x26) after the refresh
+        self._sync_image = None
+        self._sync_rects = None
+        self._previous_valid = False # False until 0x26 was written in full
+        self._scratch = None # Decode buffer for streamed (RLE) images
 
     def _command(self, command, data=None):
         """Sends a command byte, optionally followed by data bytes."""
-        self.dc.off()
-        self.cs.off()
-        self.spi.write(bytearray([command]))
-        self.cs.on()
-        if data is not None:
-            self._data(data)
+        self.transport.command(command, data)
 
     def _data(self, data):
         """Sends one or more data bytes."""
-        self.dc.on()
-        self.cs.off()
-        if isinstance(data, int):
-            self.spi.write(bytearray([data]))
-        else:
-            self.spi.write(data)
-        self.cs.on()
+        self.transport.data(data)
 
     def wait_until_idle(self):
         """Busy pin is HIGH when screen is processing. We wait a bit for it to transition."""
+        t_wait = stats.ticks_us() if stats.ENABLED else 0
         time.sleep(0.1)
-        t0 = time.ticks_ms() if hasattr(time, 'ticks_ms') else (time.time() * 1000)
+        t0 = _ticks_ms()
         while self.busy.value() == 1:
             time.sleep(0.01)
-            # 5 second timeout
-            t_now = time.ticks_ms() if hasattr(time, 'ticks_ms') else (time.time() * 1000)
-            if t_now - t0 > 5000:
+            if _ticks_diff(_ticks_ms(), t0) > BUSY_TIMEOUT_MS:
                 print("[EPD] Timeout waiting for idle (5s) - Is the display connected?")
                 break
+        if stats.ENABLED:
+            stats.add_since("epd_wait_us", t_wait)
+
+    def _busy_edge(self, pin):
+        """BUSY pin IRQ handler: the controller started or finished its refresh."""
+        if not self.refreshing:
+            return # Not armed: an edge of an earlier operation
+        if self.busy.value():
+            self._busy_seen = True
+        elif self._busy_seen:
+            self._refresh_done()
+
+    def _refresh_done(self):
+        self.refreshing = False
+        callback = self._on_done
+        self._on_done = None
+        if callback:
+            callback(self)
+
+    def is_busy(self):
+        """True while an asynchronous refresh is still running."""
+        if self.refreshing:
+            level = self.busy.value()
+            if level:
+                self._busy_seen = True
+            elapsed = _ticks_diff(_ticks_ms(), self._refresh_t0)
+            if elapsed > BUSY_TIMEOUT_MS:
+                print("[EPD] Timeout waiting for refresh (5s) - Is the display connected?")
+                self._refresh_done()
+            elif not level and (self._busy_seen or elapsed >= 100):
+                # Missed edge or no IRQ on this pin: BUSY low after it was
+                # high, or it never rose (refresh over before it was armed)
+                self._refresh_done()
+        if not self.refreshing and self._sync_image is not None:
+            # Not from the IRQ handler: this needs the SPI bus
+            self._sync_previous()
+        return self.refreshing
+
+    def wait_refresh(self):
+        """Blocks until a running asynchronous refresh has completed."""
+        t_wait = stats.ticks_us() if stats.ENABLED else 0
+        while self.is_busy():
+            time.sleep(0.005)
+        if stats.ENABLED:
+            stats.add_since("epd_wait_us", t_wait)
+
+    def _refresh(self, mode, wait=True, callback=None):
+        """Runs Display Update Control 2 sequence `mode` and activates it."""
+        if mode & 0x10 and self.lut_loaded is not None:
+            # Mode loads the OTP LUT, replacing the custom one
+            self._command(0x3C, 0x01) # Border waveform for the OTP LUT
+            self.lut_loaded = None
+
+        if stats.ENABLED:
+            stats.add("refresh_partial" if mode & 0x08 else "refresh_full") # DISPLAY Mode 2 or 1
+
+        self._refresh_seq[2] = mode
+        self.transport.sequence(self._refresh_seq)
+
+        if not wait:
+            # Armed after activation, so no edge from before it counts
+            self._on_done = callback
+            self._refresh_t0 = _ticks_ms()
+            self._busy_seen = self.busy.value() == 1
+            self.refreshing = True
+
+        if wait:
+            self.wait_until_idle()
+            if self._sync_image is not None:
+                self._sync_previous()
+            if callback:
+                callback(self)
 
     def reset(self):
         """Hardware reset pulse."""
@@ -75,88 +366,176 @@ class EPD:
         time.sleep(0.1)
 
     def set_ram_address(self, x, y):
-        """Sets the internal memory pointer to (x, y)."""
-        self._command(0x4E, x & 0xFF)
-        self._command(0x4F)
-        self._data(bytearray([y & 0xFF, (y >> 8) & 0xFF]))
+        """Sets the internal memory pointer to (x, y). x is in bytes (8px units)."""
+        seq = self._address_seq
+        seq[2] = x & 0xFF
+        seq[5] = y & 0xFF
+        seq[6] = (y >> 8) & 0xFF
+        self.transport.sequence(seq)
+
+    def set_window(self, x_start, y_start, x_end, y_end):
+        """Sets the RAM window (inclusive, in pixels). X bounds are rounded down to bytes."""
+        seq = self._window_seq
+        seq[2] = (x_start >> 3) & 0xFF
+        seq[3] = (x_end >> 3) & 0xFF
+        seq[6] = y_start & 0xFF
+        seq[7] = (y_start >> 8) & 0xFF
+        seq[8] = y_end & 0xFF
+        seq[9] = (y_end >> 8) & 0xFF
+        self.transport.sequence(seq)
 
     def init(self):
         """Standard V2 Initialization sequence."""
+        self.wait_refresh()
         self.reset()
         self.wait_until_idle()
 
         self._command(0x12) # Soft Reset
         self.wait_until_idle()
+        self.lut_loaded = None
+        self.asleep = False
 
-        # Driver output control: Sets mux and scan direction
-        self._command(0x01, bytearray([0xC7, 0x00, 0x00]))
+        self.transport.sequence(_INIT_SEQUENCE)
+        self.wait_until_idle()
 
-        # Data entry mode: 0x03 = X-increment, Y-increment
-        self._command(0x11, 0x03)
+    def load_profile(self, name):
+        """Uploads the LUT of a refresh profile (if any) and returns its update mode."""
+        lut, mode = PROFILES[name]
+        if lut is not None and self.lut_loaded != name:
+            seq = self._lut_sequences.get(name)
+            if seq is None:
+                seq = _lut_sequence(lut)
+                self._lut_sequences[name] = seq
+            self.transport.sequence(seq)
+            self.lut_loaded = name
+            if stats.ENABLED:
+                stats.add("lut_uploads")
+        if stats.ENABLED:
+            stats.add("profile_" + name)
+        return mode
 
-        # RAM Ranges
-        self._command(0x44, bytearray([0x00, 0x18])) # X: 0 to 24 (25*8=200px)
-        self._command(0x45, bytearray([0x00, 0x00, 0xC7, 0x00])) # Y: 0 to 199
+    def display(self, image, rects=None, wait=True, callback=None):
+        """
+        Pushes a framebuffer to the screen and triggers a full refresh.
+        If rects is given, only those byte-aligned (x, y, w, h) areas are written.
+        With wait=False the refresh runs in the background, see is_busy().
+        """
+        if image is None: return
+        self.wait_refresh()
+        self._write_ram(0x24, image, rects)
+        self._sync_image = image
+        self._sync_rects = rects
+        self._refresh(self.load_profile("quality-full"), wait, callback)
 
-        self._command(0x3C, 0x01) # Border waveform
-        self._command(0x18, 0x80) # Internal temp sensor
+    def display_partial(self, image, rects=None, wait=True, callback=None, profile="builtin-partial"):
+        """
+        Triggers a partial refresh (SSD1681 DISPLAY Mode 2) with the given
+        refresh profile. See display() for the other arguments.
+        """
+        if image is None: return
+        self.wait_refresh()
+        self._write_ram(0x24, image, rects)
+        self._sync_image = image
+        self._sync_rects = rects
+        self._refresh(self.load_profile(profile), wait, callback)
 
-        self.set_ram_address(0, 0)
-        self.wait_until_idle()
+    def _sync_previous(self):
+        """Copies the frame just shown into the previous-image bank (0x26)."""
+        image = self._sync_image
+        rects = self._sync_rects if self._previous_valid else None
+        self._sync_image = None
+        self._sync_rects = None
+        self._write_ram(0x26, image, rects)
+        self._previous_valid = True
 
-    def display(self, image):
-        """Pushes a full framebuffer to the screen and triggers a full refresh."""
-        if image is None: return
-        self.set_ram_address(0, 0)
-        self._command(0x24, image)
+    def _write_ram(self, bank, image, rects=None):
+        """
+        Writes image into a RAM bank, either whole or only the given rectangles.
+        Images with a stream(write, scratch) method (see rle.RLEImage) are
+        decoded on the fly and always written whole.
+        """
+        if hasattr(image, "stream"):
+            if self._scratch is None:
+                self._scratch = bytearray(self.width)
+            self.set_ram_address(0, 0)
+            self.transport.begin_data(bank)
+            image.stream(self.transport.write, self._scratch)
+            self.transport.end()
+            return
 
-        self._command(0x22, 0xF7)
-        self._command(0x20)
-        self.wait_until_idle()
+        if rects is None:
+            self.set_ram_address(0, 0)
+            self._command(bank, image)
+            return
 
-    def display_partial(self, image):
-        """Triggers a partial refresh (SSD1681 DISPLAY Mode 2)."""
-        if image is None: return
-        self.set_ram_address(0, 0)
-        self._command(0x24, image)
+        stride = self.width >> 3
+        mv = memoryview(image)
+        for x, y, w, h in rects:
+            self.set_window(x, y, x + w - 1, y + h - 1)
+            self.set_ram_address(x >> 3, y)
+            # One CS transaction for the whole window, row slices without copying
+            start = y * stride + (x >> 3)
+            end = start + (w >> 3)
+            self.transport.begin_data(bank)
+            if w == self.width:
+                self.transport.write(mv[start:start + h * stride])
+            else:
+                for _ in range(h):
+                    self.transport.write(mv[start:end])
+                    start += stride
+                    end += stride
+            self.transport.end()
 
-        # 0xFF = DISPLAY Mode 2 (Partial/Fast Update)
-        self._command(0x22, 0xFF)
-        self._command(0x20)
-        self.wait_until_idle()
+        # Restore the full-screen window for subsequent full writes
+        self.set_window(0, 0, self.width - 1, self.height - 1)
 
     def _write_ram_all(self, value):
         """Helper to fill both RAM banks with a single value."""
-        self.set_ram_address(0, 0)
-        self._command(0x24)
-        chunk = bytearray([value] * 200)
-        self.dc.on()
-        self.cs.off()
-        for _ in range(25 * 200 // 200):
-            self.spi.write(chunk)
-        self.cs.on()
+        chunk = _WHITE_CHUNK if value == 0xFF else bytes([value]) * len(_WHITE_CHUNK)
+        count = (self.width >> 3) * self.height // len(chunk)
 
         # Some displays need the second RAM bank (0x26) cleared to avoid red tints
-        self.set_ram_address(0, 0)
-        self._command(0x26)
-        self.dc.on()
-        self.cs.off()
-        for _ in range(25 * 200 // 200):
-            self.spi.write(chunk)
-        self.cs.on()
+        for bank in (0x24, 0x26):
+            self.set_ram_address(0, 0)
+            # One transaction per bank, streamed from the static chunk
+            self.transport.begin_data(bank)
+            for _ in range(count):
+                self.transport.write(chunk)
+            self.transport.end()
+        self._sync_image = None
+        self._previous_valid = True
 
     def clear(self, fast=False):
         """Clears display. Set fast=True for partial/no-flicker update."""
+        self.wait_refresh()
         self._write_ram_all(0xFF) # Fill with White
 
         if fast:
-            self._command(0x22, 0xFF) # Partial Update Mode
+            self._refresh(0xFF) # Partial Update Mode
         else:
-            self._command(0x22, 0xF7) # Full Update Mode
-
-        self._command(0x20)
-        self.wait_until_idle()
+            self._refresh(0xF7) # Full Update Mode
 
     def sleep(self):
         """Enters Deep Sleep mode to save power."""
+        self.wait_refresh()
         self._command(0x10, 0x01)
+        self.asleep = True
+
+    def read_temperature(self):
+        """
+        Measures the panel temperature with the controller's built-in sensor
+        (selected by 0x18 in the init sequence) and returns it in °C. Returns
+        None if registers cannot be read or the panel is in deep sleep.
+        """
+        if not self.transport.can_read or self.asleep:
+            return None
+        self.wait_refresh()
+        self._command(0x22, 0xA1) # Clock on, load temperature, clock off
+        self._command(0x20)
+        self.wait_until_idle() # Not armed as a refresh: its BUSY edges are ignored
+        raw = self.transport.read(0x1B, 2)
+        # 12 bit two's complement in 1/16 °C, left aligned in two bytes
+        t = (raw[0] << 4) | (raw[1] >> 4)
+        if t & 0x800:
+            t -= 0x1000
+        return t / 16
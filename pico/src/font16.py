@@ -0,0 +1,193 @@
+# AUTOGENERATED by tools/build_fonts.py – DO NOT EDIT
+# DejaVuSans-Bold.ttf at 16 px
+HEIGHT = 16
+CHARS = ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~'
+WIDTHS = (
+    b'\x06\x07\x08\r\x0b\x10\x0e\x05\x07\x07\x08\r\x06\x07\x06\x06'
+    b'\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x06\x06\r\r\r\t'
+    b'\x10\x0c\x0c\x0c\r\x0b\x0b\r\r\x06\x06\x0c\n\x10\r\x0e'
+    b'\x0c\x0e\x0c\x0c\x0b\r\x0c\x12\x0c\x0c\x0c\x07\x06\x07\r\x08'
+    b'\x08\x0b\x0b\t\x0b\x0b\x07\x0b\x0b\x05\x05\x0b\x05\x11\x0b\x0b'
+    b'\x0b\x0b\x08\n\x08\x0b\n\x0f\n\n\t\x0b\x06\x0b\r'
+)
+OFFSETS = (
+    b'\x00\x00\x10\x00 \x000\x00P\x00p\x00\x90\x00\xb0\x00'
+    b'\xc0\x00\xd0\x00\xe0\x00\xf0\x00\x10\x01 \x010\x01@\x01'
+    b'P\x01p\x01\x90\x01\xb0\x01\xd0\x01\xf0\x01\x10\x020\x02'
+    b'P\x02p\x02\x90\x02\xa0\x02\xb0\x02\xd0\x02\xf0\x02\x10\x03'
+    b'0\x03P\x03p\x03\x90\x03\xb0\x03\xd0\x03\xf0\x03\x10\x04'
+    b'0\x04P\x04`\x04p\x04\x90\x04\xb0\x04\xd0\x04\xf0\x04'
+    b'\x10\x050\x05P\x05p\x05\x90\x05\xb0\x05\xd0\x05\xf0\x05'
+    b' \x06@\x06`\x06\x80\x06\x90\x06\xa0\x06\xb0\x06\xd0\x06'
+    b'\xe0\x06\xf0\x06\x10\x070\x07P\x07p\x07\x90\x07\xa0\x07'
+    b'\xc0\x07\xe0\x07\xf0\x07\x00\x08 \x080\x08`\x08\x80\x08'
+    b'\xa0\x08\xc0\x08\xe0\x08\xf0\x08\x10\t \t@\t`\t'
+    b'\x80\t\xa0\t\xc0\t\xe0\t\x00\n\x10\n0\n'
+)
+DATA = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'00000000\x00000\x00\x00\x00\x00'
+    b'ffff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x06`\x06@\x04\xc0?\xf0?\xf0\x0c\x80\t\x80\x7f\xe0'
+    b'\x7f\xe0\x19\x00\x13\x00\x13\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x02\x00\x02\x00\x0f\x00\x1f\x80\x1a\x80\x1a\x00\x1f\x00\x07\xc0'
+    b'\x02\xc0\x12\xc0\x1f\xc0\x0f\x80\x02\x00\x02\x00\x00\x00\x00\x00'
+    b'<\x18f8f0f`f\xe0<\xc0\x01\x9e\x03\xb3'
+    b'\x033\x063\x0e3\x0c\x1e\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0f\x80\x1f\xc0\x18@\x18\x00\x1c\x00>0w\xb0a\xf0'
+    b'`\xe0q\xe0?\xf0\x1f\xb8\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x1800p``````p00\x18\x00\x00'
+    b'`008\x18\x18\x18\x18\x18\x18800`\x00\x00'
+    b'\x08I>\x1c>I\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x03\x00\x03\x00\x03\x00\x03\x00?\xf0?\xf0'
+    b'\x03\x00\x03\x00\x03\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00````\xc0\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00||\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00```\x00\x00\x00\x00'
+    b'\x0c\x0c\x18\x18\x18000```\xc0\xc0\x00\x00\x00'
+    b'\x1f\x00?\x801\x80`\xc0`\xc0`\xc0`\xc0`\xc0'
+    b'`\xc01\x80?\x80\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x1e\x00>\x006\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00'
+    b'\x06\x00\x06\x00?\xc0?\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'>\x00\x7f\x00C\x80\x01\x80\x01\x80\x03\x80\x07\x00\x0e\x00'
+    b'\x1c\x008\x00\x7f\x80\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'?\x00\x7f\xc0@\xc0\x00\xc0\x1f\x80\x1f\x80\x01\xc0\x00\xc0'
+    b'\x00\xc0A\xc0\x7f\x80?\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x07\x80\x07\x80\r\x80\x1d\x80\x19\x809\x801\x80a\x80'
+    b'\x7f\xe0\x7f\xe0\x01\x80\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\x80\x7f\x80`\x00`\x00\x7f\x00\x7f\x80A\xc0\x00\xc0'
+    b'\x00\xc0A\xc0\x7f\x80?\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0f\x00?\x800\x80`\x00\x7f\x00\x7f\x80q\xc0`\xc0'
+    b'`\xc01\xc0?\x80\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\xc0\x7f\xc0\x01\xc0\x01\x80\x01\x80\x03\x00\x03\x00\x06\x00'
+    b'\x06\x00\x0c\x00\x0c\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'?\x80\x7f\xc0`\xc0`\xc0?\x80?\x80q\xc0`\xc0'
+    b'`\xc0q\xc0?\x80\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x1f\x00?\x80q\x80`\xc0`\xc0q\xc0?\xc0\x1f\xc0'
+    b'\x00\xc0!\x80?\x80\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00```\x00\x00\x00```\x00\x00\x00\x00'
+    b'\x00\x00\x00```\x00\x00\x00````\xc0\x00\x00'
+    b'\x00\x00\x00\x00\x00\x10\x00\xf0\x07\xc0>\x000\x00>\x00'
+    b'\x07\xc0\x00\xf0\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00?\xf0?\xf0\x00\x00\x00\x00'
+    b'?\xf0?\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00 \x00<\x00\x0f\x80\x01\xf0\x000\x01\xf0'
+    b'\x0f\x80<\x00 \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'>\x00\x7f\x00C\x00\x03\x00\x07\x00\x0e\x00\x1c\x00\x18\x00'
+    b'\x00\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x07\xe0\x0c\x18\x10\x0c#\xf4frL2L2L2'
+    b'L2ft#\xf8\x10\x00\x0c\x18\x03\xf0\x00\x00\x00\x00'
+    b'\x0f\x00\x0f\x00\x0f\x00\x19\x80\x19\x809\xc00\xc0?\xc0'
+    b'\x7f\xe0````\xc00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\x80\x7f\xe0`\xe0```\xe0\x7f\xc0\x7f\xc0``'
+    b'````\x7f\xe0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0f\xc0\x1f\xe08 p\x00`\x00`\x00`\x00`\x00'
+    b'p\x008 \x1f\xe0\x0f\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\x00\x7f\xc0`\xe0`p`0`0`0`0'
+    b'`p`\xe0\x7f\xc0\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\x80\x7f\x80`\x00`\x00`\x00\x7f\x80\x7f\x80`\x00'
+    b'`\x00`\x00\x7f\x80\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\x80\x7f\x80`\x00`\x00`\x00\x7f\x80\x7f\x80`\x00'
+    b'`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0f\xc0\x1f\xe08 p\x00`\x00`\x00`\xf0`\xf0'
+    b'p080\x1f\xf0\x0f\xe0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'``````````\x7f\xe0\x7f\xe0``'
+    b'````````\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'000000000000\x00\x00\x00\x00'
+    b'0000000000000\xe0\xe0\x00'
+    b'`\xc0a\x80c\x00f\x00l\x00x\x00l\x00f\x00'
+    b'c\x00a\x80`\xc0``\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00'
+    b'`\x00`\x00\x7f\x80\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'p\x1cp\x1cx<x<llllf\xccf\xcc'
+    b'c\x8cc\x8c`\x0c`\x0c\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'p`x`x`|`l`f`f`c`'
+    b'c\xe0a\xe0a\xe0`\xe0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0f\xc0\x1f\xe08pp8`\x18`\x18`\x18`\x18'
+    b'p88p\x1f\xe0\x0f\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\x80\x7f\xc0`\xe0`````\xe0\x7f\xc0\x7f\x80'
+    b'`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0f\xc0\x1f\xe08pp8`\x18`\x18`\x18`\x18'
+    b'p88p\x1f\xe0\x0f\xc0\x00\xe0\x00p\x00\x00\x00\x00'
+    b'\x7f\x80\x7f\xc0`\xc0`\xc0`\xc0\x7f\x80\x7f\x80a\xc0'
+    b'`\xc0`\xc0`\xe0``\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x1f\x80?\x80`\x80`\x00x\x00>\x00\x0f\x80\x03\xc0'
+    b'\x00\xc0@\xc0\x7f\x80?\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xff\xc0\xff\xc0\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00'
+    b'\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'````````````````'
+    b'``p\xe0?\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xc00``````0\xc00\xc00\xc0\x19\x80'
+    b'\x19\x80\x19\x80\x0f\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xc1\xc1\x80\xc1\xc1\x80c\xe3\x00cc\x00cc\x00c'
+    b'c\x0066\x0066\x0066\x0066\x00\x1c\x1c'
+    b'\x00\x1c\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xe0p``0\xc09\xc0\x1f\x80\x0f\x00\x0f\x00\x19\x80'
+    b'9\xc00\xc0``\xe0p\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xe1\xc0a\x80s\x803\x00\x1e\x00\x1e\x00\x0c\x00\x0c\x00'
+    b'\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\xe0\x7f\xe0\x00\xc0\x01\xc0\x03\x80\x07\x00\x0e\x00\x1c\x00'
+    b'8\x000\x00\x7f\xe0\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'xx``````````xx\x00\x00'
+    b'\xc0\xc0```000\x18\x18\x18\x0c\x0c\x00\x00\x00'
+    b'xx\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18xx\x00\x00'
+    b'\x03\x00\x07\x80\x0c\xc0\x18`\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff'
+    b'0\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x1f\x00?\x80\x01\x80?\x80\x7f\x80'
+    b'a\x80c\x80\x7f\x80=\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'`\x00`\x00`\x00o\x00\x7f\x80q\xc0`\xc0`\xc0'
+    b'`\xc0q\xc0\x7f\x80o\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x1f\x00?\x80p\x80`\x00`\x00'
+    b'`\x00p\x80?\x80\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\xc0\x00\xc0\x00\xc0\x1e\xc0?\xc0q\xc0`\xc0`\xc0'
+    b'`\xc0q\xc0?\xc0\x1e\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x1f\x00?\x80`\xc0\x7f\xc0\x7f\xc0'
+    b'`\x00p@?\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x1e>0||0000000\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x1e\xc0?\xc0q\xc0`\xc0`\xc0'
+    b'`\xc0q\xc0?\xc0\x1e\xc0!\xc0?\x80\x1f\x00\x00\x00'
+    b'`\x00`\x00`\x00o\x80\x7f\xc0p\xc0`\xc0`\xc0'
+    b'`\xc0`\xc0`\xc0`\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'``\x00`````````\x00\x00\x00\x00'
+    b'``\x00``````````\xe0\xc0\x00'
+    b'`\x00`\x00`\x00a\xc0c\x80g\x00n\x00|\x00'
+    b'n\x00g\x00c\x80a\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'````````````\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00o<\x00\x7f\xfe\x00q'
+    b'\xc6\x00a\x86\x00a\x86\x00a\x86\x00a\x86\x00a\x86'
+    b'\x00a\x86\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00o\x80\x7f\xc0p\xc0`\xc0`\xc0'
+    b'`\xc0`\xc0`\xc0`\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x1f\x00?\x80q\xc0`\xc0`\xc0'
+    b'`\xc0q\xc0?\x80\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00o\x00\x7f\x80q\xc0`\xc0`\xc0'
+    b'`\xc0q\xc0\x7f\x80o\x00`\x00`\x00`\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x1e\xc0?\xc0q\xc0`\xc0`\xc0'
+    b'`\xc0q\xc0?\xc0\x1e\xc0\x00\xc0\x00\xc0\x00\xc0\x00\x00'
+    b'\x00\x00\x00g\x7fp``````\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00?\x00\x7f\x80`\x80|\x00?\x00'
+    b'\x03\x80A\x80\x7f\x80?\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0000~~00000>\x1e\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00`\xc0`\xc0`\xc0`\xc0`\xc0'
+    b'`\xc0a\xc0\x7f\xc0>\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\xc0\xc0a\x80a\x80a\x803\x00'
+    b'3\x00\x1e\x00\x1e\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00a\x0cc\x8c3\x982\x986\xd8'
+    b'6\xd8\x14P\x1cp\x1cp\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\xe1\xc0a\x803\x00\x1e\x00\x1e\x00'
+    b'\x1e\x003\x00a\x80\xe1\xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\xc0\xc0a\x80a\x801\x803\x00'
+    b'3\x00\x1e\x00\x1e\x00\x0e\x00\x0c\x00|\x00x\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x7f\x80\x7f\x80\x03\x00\x06\x00\x0c\x00'
+    b'\x18\x000\x00\x7f\x80\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x07\x00\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00<\x00'
+    b'<\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0f\x00\x07\x00\x00\x00'
+    b'0000000000000000'
+    b'8\x00<\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0f\x00'
+    b'\x0f\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00<\x008\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x10?\xf0!\xe0'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
@@ -0,0 +1,273 @@
+# AUTOGENERATED by tools/build_fonts.py – DO NOT EDIT
+# DejaVuSans-Bold.ttf at 26 px
+HEIGHT = 24
+CHARS = ' !"#%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[]_'
+WIDTHS = (
+    b'\t\x0c\x0e\x16\x1a\x17\x08\x0c\x0c\x0e\x16\n\x0b\n\n\x12'
+    b'\x12\x12\x12\x12\x12\x12\x12\x12\x12\n\n\x16\x16\x16\x0f\x1a'
+    b'\x14\x14\x13\x16\x12\x12\x15\x16\n\n\x14\x11\x1a\x16\x16\x13'
+    b'\x16\x14\x13\x12\x15\x14\x1d\x14\x13\x13\x0c\x0c\r'
+)
+OFFSETS = (
+    b'\x00\x000\x00`\x00\x90\x00\xd8\x008\x01\x80\x01\x98\x01'
+    b'\xc8\x01\xf8\x01(\x02p\x02\xa0\x02\xd0\x02\x00\x030\x03'
+    b'x\x03\xc0\x03\x08\x04P\x04\x98\x04\xe0\x04(\x05p\x05'
+    b'\xb8\x05\x00\x060\x06`\x06\xa8\x06\xf0\x068\x07h\x07'
+    b'\xc8\x07\x10\x08X\x08\xa0\x08\xe8\x080\tx\t\xc0\t'
+    b'\x08\n8\nh\n\xb0\n\xf8\nX\x0b\xa0\x0b\xe8\x0b'
+    b'0\x0cx\x0c\xc0\x0c\x08\rP\r\x98\r\xe0\r@\x0e'
+    b'\x88\x0e\xd0\x0e\x18\x0fH\x0fx\x0f'
+)
+DATA = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0f\x80\x0f\x80\x0f\x80\x0f\x80\x0f\x80\x0f\x80\x0f\x80\x0f\x80'
+    b'\x0f\x80\x0f\x80\x0f\x80\x07\x00\x00\x00\x00\x00\x0f\x80\x0f\x80'
+    b'\x0f\x80\x0f\x80\x0f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'8\xe08\xe08\xe08\xe08\xe08\xe08\xe0\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00q\xc0\x00\xe1\x80\x00\xe3\x80\x00\xe3\x80\x00\xe3\x80\x1f'
+    b'\xff\xf0\x1f\xff\xf0\x1f\xff\xf0\x01\xc7\x00\x01\x86\x00\x03\x8e'
+    b'\x00?\xff\xe0?\xff\xe0?\xff\xe0\x07\x1c\x00\x07\x1c\x00'
+    b'\x07\x1c\x00\x06\x1c\x00\x0e8\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00p\x00?\xc0`\x00'
+    b'y\xc0\xc0\x00p\xe1\xc0\x00p\xe1\x80\x00p\xe3\x80\x00'
+    b'p\xe3\x00\x00y\xe6\x00\x00?\xce\x00\x00\x1f\x8c>\x00'
+    b'\x00\x1c\xff\x00\x00\x18\xe7\x00\x001\xc3\x80\x00q\xc3\x80'
+    b'\x00a\xc3\x80\x00\xe1\xc3\x80\x00\xc1\xe7\x80\x01\x80\xff\x00'
+    b'\x03\x80~\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\xf8\x00\x07\xfe\x00\x07\xfe'
+    b'\x00\x0f\x86\x00\x0f\x82\x00\x0f\x80\x00\x07\xc0\x00\x07\xe0\x00'
+    b'\x0f\xf0\xf0\x1f\xf0\xf0>\xf8\xf0|}\xe0|?\xe0|'
+    b'\x1f\xc0~\x0f\x80?\x0f\xc0?\xff\xe0\x1f\xff\xf0\x07\xf1'
+    b'\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'8888888\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x0f\x00\x0f\x00\x1e\x00'
+    b'\x1e\x00\x1e\x00<\x00<\x00<\x00<\x00<\x00<\x00'
+    b'<\x00<\x00<\x00\x1e\x00\x1e\x00\x1e\x00\x0e\x00\x0f\x00'
+    b'\x07\x00\x07\x80\x00\x00\x00\x00\x1c\x00\x1e\x00\x1e\x00\x0f\x00'
+    b'\x0f\x00\x0f\x00\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80'
+    b'\x07\x80\x07\x80\x07\x80\x0f\x00\x0f\x00\x0f\x00\x0e\x00\x1e\x00'
+    b'\x1c\x00<\x00\x00\x00\x00\x00\x03\x00\x03\x00#\x10{x'
+    b'?\xf0\x0f\xc0\x0f\xc0?\xf0{x#\x10\x03\x00\x03\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00p'
+    b'\x00\x00p\x00\x00p\x00\x00p\x00\x00p\x00\x00p\x00'
+    b'\x00p\x00?\xff\xe0?\xff\xe0?\xff\xe0\x00p\x00\x00'
+    b'p\x00\x00p\x00\x00p\x00\x00p\x00\x00p\x00\x00p'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x1f\x00'
+    b'\x1f\x00\x1f\x00\x1f\x00\x1e\x00>\x00<\x008\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x7f\x80\x7f\x80\x7f\x80\x7f\x80\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x1f\x00'
+    b'\x1f\x00\x1f\x00\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x01\xc0\x01\xc0\x03\x80\x03\x80\x03\x80\x07\x00\x07\x00\x06\x00'
+    b'\x0e\x00\x0e\x00\x0c\x00\x1c\x00\x1c\x008\x008\x008\x00'
+    b'p\x00p\x00p\x00\xe0\x00\xe0\x00\x00\x00\x00\x00\x00\x00'
+    b'\x03\xf0\x00\x0f\xfc\x00\x1f\xfe\x00>\x1f\x00>\x1f\x00<'
+    b'\x0f\x00|\x0f\x80|\x0f\x80|\x0f\x80|\x0f\x80|\x0f'
+    b'\x80|\x0f\x80|\x0f\x80|\x0f\x80>\x1f\x00>\x1f\x00'
+    b'\x1f\xfe\x00\x0f\xfc\x00\x03\xf0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x07\xf0\x00\x1f\xf0\x00\x1f\xf0'
+    b'\x00\x19\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00'
+    b'\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01'
+    b'\xf0\x00\x01\xf0\x00\x01\xf0\x00\x1f\xff\x00\x1f\xff\x00\x1f\xff'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x0f\xf0\x00?\xfc\x00?\xfe\x008?\x00 \x1f\x00\x00'
+    b'\x1f\x00\x00\x1f\x00\x00\x1f\x00\x00?\x00\x00\x7f\x00\x00\xfe'
+    b'\x00\x01\xfc\x00\x03\xf8\x00\x07\xf0\x00\x0f\xe0\x00\x1f\xc0\x00'
+    b'?\xff\x00?\xff\x00?\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x07\xf8\x00\x1f\xfe\x00\x1f\xfe'
+    b'\x00\x10?\x00\x00\x1f\x00\x00\x1f\x00\x00\x1f\x00\x00>\x00'
+    b'\x07\xfc\x00\x07\xf8\x00\x07\xfe\x00\x00?\x00\x00\x1f\x00\x00'
+    b'\x1f\x00\x00\x1f\x000?\x00?\xfe\x00?\xfc\x00\x0f\xf0'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\xfc\x00\x00\xfc\x00\x01\xfc\x00\x03\xfc\x00\x07\xfc\x00\x07'
+    b'|\x00\x0f|\x00\x1e|\x00\x1c|\x00<|\x00x|'
+    b'\x00p|\x00\x7f\xff\x80\x7f\xff\x80\x7f\xff\x80\x00|\x00'
+    b'\x00|\x00\x00|\x00\x00|\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xfe\x00\x1f\xfe\x00\x1f\xfe'
+    b'\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00\x1f\xf0\x00\x1f\xfc\x00'
+    b'\x1f\xfe\x00\x18~\x00\x00?\x00\x00\x1f\x00\x00\x1f\x00\x00'
+    b'\x1f\x00\x00?\x000~\x00?\xfe\x00?\xfc\x00\x0f\xf0'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x01\xfc\x00\x07\xfe\x00\x1f\xfe\x00\x1f\x02\x00>\x00\x00<'
+    b'\x00\x00}\xf8\x00\x7f\xfc\x00\x7f\xfe\x00~>\x00|\x1f'
+    b'\x00|\x1f\x00|\x1f\x00|\x1f\x00<\x1f\x00>>\x00'
+    b'\x1f\xfe\x00\x0f\xfc\x00\x03\xf0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00?\xff\x00?\xff\x00?\xff'
+    b'\x00\x00?\x00\x00>\x00\x00~\x00\x00|\x00\x00\xfc\x00'
+    b'\x00\xf8\x00\x01\xf8\x00\x01\xf8\x00\x01\xf0\x00\x03\xf0\x00\x03'
+    b'\xe0\x00\x07\xe0\x00\x07\xc0\x00\x0f\xc0\x00\x0f\x80\x00\x1f\x80'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x07\xf0\x00\x1f\xfc\x00?\xfe\x00~?\x00|\x1f\x00|'
+    b'\x1f\x00|\x1f\x00>>\x00\x1f\xfc\x00\x07\xf0\x00\x1f\xfc'
+    b'\x00>>\x00|\x1f\x00|\x1f\x00|\x1f\x00~?\x00'
+    b'?\xfe\x00\x1f\xfc\x00\x07\xf0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x1f\xf8\x00?\xfc'
+    b'\x00>>\x00|\x1e\x00|\x1f\x00|\x1f\x00|\x1f\x00'
+    b'|\x1f\x00~?\x00?\xff\x00\x1f\xff\x00\x0f\xdf\x00\x00'
+    b'\x1e\x00\x00>\x00 |\x00?\xf8\x00?\xf0\x00\x1f\xc0'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x1f\x00\x1f\x00'
+    b'\x1f\x00\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x1f\x00'
+    b'\x1f\x00\x1f\x00\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x1f\x00\x1f\x00'
+    b'\x1f\x00\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x1f\x00'
+    b'\x1f\x00\x1f\x00\x1f\x00\x1e\x00>\x00<\x008\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 \x00\x01\xe0\x00'
+    b'\x0f\xe0\x00?\xc0\x01\xfe\x00\x0f\xf8\x00\x1f\xc0\x00\x1e\x00'
+    b'\x00\x1f\xc0\x00\x0f\xf8\x00\x01\xfe\x00\x00?\xc0\x00\x0f\xe0'
+    b'\x00\x01\xe0\x00\x00 \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xe0\x1f\xff\xe0'
+    b'\x1f\xff\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xe0\x1f'
+    b'\xff\xe0\x1f\xff\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x1e\x00\x00\x1f'
+    b'\xc0\x00\x0f\xf0\x00\x01\xfe\x00\x00\x7f\xc0\x00\x0f\xe0\x00\x01'
+    b'\xe0\x00\x0f\xe0\x00\x7f\xc0\x01\xfe\x00\x0f\xf0\x00\x1f\xc0\x00'
+    b'\x1e\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xc0\x7f\xf0\x7f\xf8A\xf8'
+    b'\x00\xf8\x00\xf8\x01\xf8\x03\xf0\x07\xe0\x0f\xc0\x0f\x80\x0f\x80'
+    b'\x00\x00\x00\x00\x0f\x80\x0f\x80\x0f\x80\x0f\x80\x0f\x80\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x80\x00\x00\xff\xe0\x00'
+    b'\x03\xc0\xf8\x00\x07\x00<\x00\x0e\x00\x0c\x00\x0c\x00\x06\x00'
+    b'\x18=\xc6\x00\x18\x7f\xc3\x000s\xc3\x000\xe1\xc3\x00'
+    b'0\xe1\xc3\x000\xe1\xc3\x000\xe1\xc7\x000\xe1\xc6\x00'
+    b'0s\xcc\x00\x18\x7f\xf8\x00\x18=\xe0\x00\x0c\x00\x00\x00'
+    b'\x0e\x00\x00\x00\x07\x000\x00\x03\xc0\xf8\x00\x00\xff\xf0\x00'
+    b'\x00?\x80\x00\x00\x00\x00\x00\x01\xf8\x00\x03\xfc\x00\x03\xfc'
+    b'\x00\x03\xfc\x00\x07\xfe\x00\x07\xfe\x00\x07\xfe\x00\x0f\xff\x00'
+    b'\x0f\x9f\x00\x0f\x9f\x00\x1f\x8f\x80\x1f\x0f\x80?\xff\xc0?'
+    b'\xff\xc0?\xff\xc0~\x07\xe0|\x03\xe0|\x03\xe0\xfc\x03'
+    b'\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'?\xfc\x00?\xff\x00?\xff\x80>\x1f\x80>\x0f\x80>'
+    b'\x0f\x80>\x1f\x80?\xff\x00?\xfe\x00?\xff\x80>\x0f'
+    b'\x80>\x07\xc0>\x07\xc0>\x07\xc0>\x07\xc0>\x0f\xc0'
+    b'?\xff\x80?\xff\x00?\xfc\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\xfe\x00\x07\xff\x80\x0f\xff'
+    b'\x80\x1f\x83\x80?\x00\x80>\x00\x00|\x00\x00|\x00\x00'
+    b'|\x00\x00|\x00\x00|\x00\x00|\x00\x00|\x00\x00>'
+    b'\x00\x00?\x00\x80\x1f\x83\x80\x0f\xff\x80\x07\xff\x80\x01\xfe'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'?\xf8\x00?\xff\x00?\xff\x80>\x0f\xc0>\x07\xe0>'
+    b'\x03\xe0>\x03\xf0>\x01\xf0>\x01\xf0>\x01\xf0>\x01'
+    b'\xf0>\x01\xf0>\x01\xf0>\x03\xe0>\x07\xe0>\x0f\xc0'
+    b'?\xff\x80?\xff\x00?\xf8\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00?\xfe\x00?\xfe\x00?\xfe'
+    b'\x00>\x00\x00>\x00\x00>\x00\x00>\x00\x00?\xfc\x00'
+    b'?\xfc\x00?\xfc\x00>\x00\x00>\x00\x00>\x00\x00>'
+    b'\x00\x00>\x00\x00>\x00\x00?\xfe\x00?\xfe\x00?\xfe'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'?\xfe\x00?\xfe\x00?\xfe\x00>\x00\x00>\x00\x00>'
+    b'\x00\x00>\x00\x00?\xfc\x00?\xfc\x00?\xfc\x00>\x00'
+    b'\x00>\x00\x00>\x00\x00>\x00\x00>\x00\x00>\x00\x00'
+    b'>\x00\x00>\x00\x00>\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\x00\x07\xff\xc0\x0f\xff'
+    b'\xc0\x1f\x81\xc0?\x00@>\x00\x00|\x00\x00|\x00\x00'
+    b'|\x1f\xe0|\x1f\xe0|\x1f\xe0|\x03\xe0|\x03\xe0>'
+    b'\x03\xe0?\x03\xe0\x1f\x83\xe0\x0f\xff\xe0\x07\xff\xe0\x01\xff'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'>\x03\xe0>\x03\xe0>\x03\xe0>\x03\xe0>\x03\xe0>'
+    b'\x03\xe0>\x03\xe0?\xff\xe0?\xff\xe0?\xff\xe0>\x03'
+    b'\xe0>\x03\xe0>\x03\xe0>\x03\xe0>\x03\xe0>\x03\xe0'
+    b'>\x03\xe0>\x03\xe0>\x03\xe0\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00>\x00>\x00>\x00>\x00'
+    b'>\x00>\x00>\x00>\x00>\x00>\x00>\x00>\x00'
+    b'>\x00>\x00>\x00>\x00>\x00>\x00>\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00>\x00>\x00>\x00>\x00'
+    b'>\x00>\x00>\x00>\x00>\x00>\x00>\x00>\x00'
+    b'>\x00>\x00>\x00>\x00>\x00>\x00>\x00>\x00'
+    b'|\x00\xfc\x00\xf8\x00\xe0\x00>\x03\xe0>\x07\xc0>\x0f'
+    b'\x80>\x1f\x00>>\x00>\xfc\x00?\xf8\x00?\xf0\x00'
+    b'?\xe0\x00?\xe0\x00?\xf0\x00?\xf8\x00>\xfc\x00>'
+    b'~\x00>?\x00>\x1f\x80>\x0f\xc0>\x07\xe0>\x03'
+    b'\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'>\x00\x00>\x00\x00>\x00\x00>\x00\x00>\x00\x00>'
+    b'\x00\x00>\x00\x00>\x00\x00>\x00\x00>\x00\x00>\x00'
+    b'\x00>\x00\x00>\x00\x00>\x00\x00>\x00\x00>\x00\x00'
+    b'?\xfe\x00?\xfe\x00?\xfe\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00?\x00~\x00?\x80\xfe\x00'
+    b'?\x80\xfe\x00?\xc1\xfe\x00?\xc1\xfe\x00?\xc1\xfe\x00'
+    b'>\xe3\xbe\x00>\xe3\xbe\x00>\xf7\xbe\x00>w>\x00'
+    b'>w>\x00>>>\x00>>>\x00>>>\x00'
+    b'>\x1c>\x00>\x00>\x00>\x00>\x00>\x00>\x00'
+    b'>\x00>\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00?\x03\xe0?\x03\xe0?\x83'
+    b'\xe0?\x83\xe0?\xc3\xe0?\xc3\xe0?\xe3\xe0>\xe3\xe0'
+    b'>\xf3\xe0>s\xe0>{\xe0>;\xe0>;\xe0>'
+    b'\x1f\xe0>\x1f\xe0>\x0f\xe0>\x0f\xe0>\x07\xe0>\x07'
+    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x01\xfe\x00\x07\xff\x80\x0f\xff\xc0\x1f\x87\xe0?\x03\xf0>'
+    b'\x01\xf0|\x00\xf8|\x00\xf8|\x00\xf8|\x00\xf8|\x00'
+    b'\xf8|\x00\xf8|\x00\xf8>\x01\xf0?\x03\xf0\x1f\x87\xe0'
+    b'\x0f\xff\xc0\x07\xff\x80\x01\xfe\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00?\xfc\x00?\xff\x00?\xff'
+    b'\x80>\x0f\xc0>\x07\xc0>\x07\xc0>\x07\xc0>\x07\xc0'
+    b'>\x0f\xc0?\xff\x80?\xff\x00?\xfc\x00>\x00\x00>'
+    b'\x00\x00>\x00\x00>\x00\x00>\x00\x00>\x00\x00>\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x01\xfe\x00\x07\xff\x80\x0f\xff\xc0\x1f\x87\xe0?\x03\xf0>'
+    b'\x01\xf0|\x00\xf8|\x00\xf8|\x00\xf8|\x00\xf8|\x00'
+    b'\xf8|\x00\xf8|\x00\xf8>\x01\xf0>\x03\xf0\x1f\x87\xe0'
+    b'\x0f\xff\xc0\x07\xff\x80\x01\xff\x00\x00\x0f\x80\x00\x07\xc0\x00'
+    b'\x03\xc0\x00\x03\xe0\x00\x00\x00?\xfc\x00?\xfe\x00?\xff'
+    b'\x00>\x1f\x80>\x0f\x80>\x0f\x80>\x0f\x80>\x0f\x80'
+    b'>\x1f\x00?\xfe\x00?\xf8\x00?\xfe\x00>?\x00>'
+    b'\x1f\x80>\x0f\x80>\x0f\xc0>\x0f\xc0>\x07\xc0>\x07'
+    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x03\xfe\x00\x0f\xff\x00\x1f\xff\x00?\x07\x00>\x01\x00>'
+    b'\x00\x00>\x00\x00?\xc0\x00\x1f\xfc\x00\x0f\xfe\x00\x07\xff'
+    b'\x00\x00\x7f\x80\x00\x1f\x80\x00\x0f\x80 \x0f\x808\x1f\x80'
+    b'?\xff\x00?\xfe\x00\x0f\xf8\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x80\xff\xff\x80\xff\xff'
+    b'\x80\x03\xe0\x00\x03\xe0\x00\x03\xe0\x00\x03\xe0\x00\x03\xe0\x00'
+    b'\x03\xe0\x00\x03\xe0\x00\x03\xe0\x00\x03\xe0\x00\x03\xe0\x00\x03'
+    b'\xe0\x00\x03\xe0\x00\x03\xe0\x00\x03\xe0\x00\x03\xe0\x00\x03\xe0'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'>\x07\xc0>\x07\xc0>\x07\xc0>\x07\xc0>\x07\xc0>'
+    b'\x07\xc0>\x07\xc0>\x07\xc0>\x07\xc0>\x07\xc0>\x07'
+    b'\xc0>\x07\xc0>\x07\xc0>\x07\xc0>\x07\xc0\x1f\x0f\x80'
+    b'\x1f\xff\x80\x0f\xff\x00\x03\xfc\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xfc\x03\xf0|\x03\xe0|\x03'
+    b'\xe0~\x07\xe0>\x07\xc0>\x07\xc0?\x0f\xc0\x1f\x0f\x80'
+    b'\x1f\x9f\x80\x0f\x9f\x00\x0f\x9f\x00\x0f\xff\x00\x07\xfe\x00\x07'
+    b'\xfe\x00\x07\xfe\x00\x03\xfc\x00\x03\xfc\x00\x03\xfc\x00\x01\xf8'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'|\x0f\x81\xf0|\x0f\x83\xf0>\x0f\x83\xe0>\x1d\xc3\xe0'
+    b'>\x1d\xc3\xe0>\x1d\xc3\xe0\x1f\x1d\xc7\xc0\x1f<\xe7\xc0'
+    b'\x1f8\xe7\xc0\x1f8\xe7\xc0\x1f\xb8\xef\xc0\x0f\xf8\xff\x80'
+    b'\x0f\xf0\x7f\x80\x0f\xf0\x7f\x80\x0f\xf0\x7f\x80\x07\xf0\x7f\x00'
+    b'\x07\xe0?\x00\x07\xe0?\x00\x07\xe0?\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'~\x03\xf0?\x07\xe0\x1f\x8f\xc0\x1f\xdf\xc0\x0f\xdf\x80\x07'
+    b'\xff\x00\x03\xfe\x00\x03\xfe\x00\x01\xfc\x00\x01\xfc\x00\x01\xfc'
+    b'\x00\x03\xfe\x00\x07\xff\x00\x07\xff\x00\x0f\xdf\x80\x1f\x8f\xc0'
+    b'\x1f\x8f\xc0?\x07\xe0~\x03\xf0\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xfc\x07\xe0~\x0f\xc0?\x1f'
+    b'\x80?\x1f\x80\x1f\xbf\x00\x1f\xbf\x00\x0f\xfe\x00\x07\xfc\x00'
+    b'\x07\xfc\x00\x03\xf8\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01'
+    b'\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x7f\xff\xc0\x7f\xff\xc0\x7f\xff\xc0\x00\x1f\xc0\x00?\x80\x00'
+    b'\x7f\x00\x00~\x00\x00\xfc\x00\x01\xfc\x00\x03\xf8\x00\x07\xf0'
+    b'\x00\x07\xe0\x00\x0f\xc0\x00\x1f\x80\x00?\x80\x00\x7f\x00\x00'
+    b'\x7f\xff\xc0\x7f\xff\xc0\x7f\xff\xc0\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00?\xc0?\xc0<\x00<\x00'
+    b'<\x00<\x00<\x00<\x00<\x00<\x00<\x00<\x00'
+    b'<\x00<\x00<\x00<\x00<\x00<\x00<\x00?\xc0'
+    b'?\xc0?\xc0\x00\x00\x00\x00\x7f\x80\x7f\x80\x07\x80\x07\x80'
+    b'\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80'
+    b'\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80\x07\x80\x7f\x80'
+    b'\x7f\x80\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\xff\xf8'
+)
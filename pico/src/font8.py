@@ -0,0 +1,78 @@
+# AUTOGENERATED by tools/build_fonts.py – DO NOT EDIT
+# DejaVuSans-Bold.ttf at 9 px
+HEIGHT = 8
+CHARS = ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~'
+WIDTHS = (
+    b'\x03\x04\x05\x08\x06\t\x08\x03\x04\x04\x05\x08\x03\x04\x03\x03'
+    b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x04\x04\x08\x08\x08\x05'
+    b'\t\x07\x07\x07\x07\x06\x06\x07\x08\x03\x03\x07\x06\t\x08\x08'
+    b'\x07\x08\x07\x06\x06\x07\x07\n\x07\x07\x07\x04\x03\x04\x08\x05'
+    b'\x05\x06\x06\x05\x06\x06\x04\x06\x06\x03\x03\x06\x03\t\x06\x06'
+    b'\x06\x06\x04\x05\x04\x06\x06\x08\x06\x06\x05\x06\x03\x06\x08'
+)
+OFFSETS = (
+    b'\x00\x00\x08\x00\x10\x00\x18\x00 \x00(\x008\x00@\x00'
+    b'H\x00P\x00X\x00`\x00h\x00p\x00x\x00\x80\x00'
+    b'\x88\x00\x90\x00\x98\x00\xa0\x00\xa8\x00\xb0\x00\xb8\x00\xc0\x00'
+    b'\xc8\x00\xd0\x00\xd8\x00\xe0\x00\xe8\x00\xf0\x00\xf8\x00\x00\x01'
+    b'\x08\x01\x18\x01 \x01(\x010\x018\x01@\x01H\x01'
+    b'P\x01X\x01`\x01h\x01p\x01x\x01\x88\x01\x90\x01'
+    b'\x98\x01\xa0\x01\xa8\x01\xb0\x01\xb8\x01\xc0\x01\xc8\x01\xd0\x01'
+    b'\xe0\x01\xe8\x01\xf0\x01\xf8\x01\x00\x02\x08\x02\x10\x02\x18\x02'
+    b' \x02(\x020\x028\x02@\x02H\x02P\x02X\x02'
+    b'`\x02h\x02p\x02x\x02\x80\x02\x88\x02\x98\x02\xa0\x02'
+    b'\xa8\x02\xb0\x02\xb8\x02\xc0\x02\xc8\x02\xd0\x02\xd8\x02\xe0\x02'
+    b'\xe8\x02\xf0\x02\xf8\x02\x00\x03\x08\x03\x10\x03\x18\x03'
+)
+DATA = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00````\x00``\x00'
+    b'PP\x00\x00\x00\x00\x00\x00\x14\x14~(~((\x00'
+    b'\x10<Px<\x14x\x102\x00J\x00L\x00?\x00'
+    b'\x0c\x80\x1c\x80\x13\x00\x00\x00\x1c009of;\x00'
+    b'@@\x00\x00\x00\x00\x00\x00 ```` 0\x00'
+    b' 0000 `\x00 \xa8p\xf8 \x00\x00\x00'
+    b'\x00\x00\x10\x10|\x10\x10\x00\x00\x00\x00\x00\x00``@'
+    b'\x00\x00\x00\x00\xe0\x00\x00\x00\x00\x00\x00\x00\x00``\x00'
+    b'  @@@\x80\x80\x008lllll8\x00'
+    b'x\x18\x18\x18\x18\x18|\x00x\x0c\x0c\x180`|\x00'
+    b'x\x0c\x0c8\x0c\x0cx\x00\x0c\x1c,,L|\x0c\x00'
+    b'|``x\x0c\x0cx\x00<p`xll8\x00'
+    b'|\x0c\x18\x1800`\x008ll\x10ll8\x00'
+    b'8ll<\x0c\x1cx\x00\x00\x00``\x00``\x00'
+    b'\x00\x00``\x00``@\x00\x00\x06<@<\x06\x00'
+    b'\x00\x00\x00~\x00~\x00\x00\x00\x00`<\x02<`\x00'
+    b'x\x1880\x0000\x00\x1e\x00!\x00N\x80R\x80'
+    b'R\x80O\x00"\x00\x1c\x00888ll|\xc6\x00'
+    b'xllxllx\x00\x1e2```2\x1e\x00'
+    b'|fffff|\x00|``|``|\x00'
+    b'|``|```\x00\x1e2`nff>\x00'
+    b'ccc\x7fccc\x00```````\x00'
+    b'````````flxpxlf\x00'
+    b'``````|\x00c\x00w\x00w\x00k\x00'
+    b'k\x00c\x00c\x00\x00\x00fvvnnff\x00'
+    b'<fffff<\x00xllx```\x00'
+    b'<fffff<\x04xllxllf\x00'
+    b'<d`8\x0cLx\x00\xfc000000\x00'
+    b'ffffff<\x00\xc6Dll(88\x00'
+    b'd\xc0n\xc0j\xc0*\x80;\x801\x801\x80\x00\x00'
+    b'\xc6l(8(l\xc6\x00ff<\x18\x18\x18\x18\x00'
+    b'~\x06\x0c\x180`~\x00``````p\x00'
+    b'\x80\x80@@@  \x00000000p\x00'
+    b'\x18$\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b' \x00\x00\x00\x00\x00\x00\x00\x00\x00x\x0c|l|\x00'
+    b'``xlllx\x00\x00\x008```8\x00'
+    b'\x0c\x0c<lll<\x00\x00\x008l|`<\x00'
+    b'``\xf0````\x00\x00\x00<lll<\x0c'
+    b'``|llll\x00`\x00`````\x00'
+    b'`\x00````````lxpxl\x00'
+    b'```````\x00\x00\x00\x00\x00\x7f\x80m\x80'
+    b'm\x80m\x80m\x80\x00\x00\x00\x00|llll\x00'
+    b'\x00\x008lll8\x00\x00\x00xlllx`'
+    b'\x00\x00<lll<\x0c\x00\x00p````\x00'
+    b'\x00\x008`x\x18p\x00\x00`p```p\x00'
+    b'\x00\x00llll|\x00\x00\x00\x98\x98\x90\xf0`\x00'
+    b'\x00\x00\xdb\xdb~ff\x00\x00\x00\xccx0x\xcc\x00'
+    b'\x00\x00\xccHx00 \x00\x00x\x180`x\x00'
+    b'00`0008\x00@@@@@@@@'
+    b'00\x18000p\x00\x00\x002L\x00\x00\x00\x00'
+)
@@ -0,0 +1,93 @@
+# fonts.py
+"""
+Proportional 1bpp bitmap fonts.
+
+tools/build_fonts.py pre-renders each size into a font<size>.py module:
+every glyph is a packed MONO_HLSB bitmap of HEIGHT rows and its own width,
+found in DATA through OFFSETS. Glyphs are blitted row by row as bytes.
+A font module is only imported the first time its size is drawn, so unused
+sizes cost no RAM.
+"""
+
+from canvas import rotate180
+from glyphs import blit
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict
+
+SIZES = (8, 16, 24)
+ROTATED_CACHE = 32 # Rotated glyphs kept per font, least recently used evicted
+
+_loaded = {}
+
+
+def get(size):
+    """Returns the font of the given height, loading it on first use."""
+    font = _loaded.get(size)
+    if font is None:
+        font = Font(__import__(f"font{size}"))
+        _loaded[size] = font
+    return font
+
+
+class Font:
+    def __init__(self, module):
+        self.height = module.HEIGHT
+        self.chars = module.CHARS
+        self.widths = module.WIDTHS
+        self.offsets = module.OFFSETS
+        self.data = module.DATA
+        self._fallback = max(0, self.chars.find("?"))
+        self._rotated = OrderedDict() # glyph index -> bitmap rotated by 180 degrees
+
+    def _index(self, char):
+        i = self.chars.find(char)
+        return i if i >= 0 else self._fallback
+
+    def measure(self, text):
+        """Returns the width of text in pixels."""
+        w = 0
+        for char in text:
+            w += self.widths[self._index(char)]
+        return w
+
+    def draw(self, buf, width, height, text, x, y, c=0, rotated=False):
+        """
+        Draws text into a MONO_HLSB buffer with its top left corner at (x, y)
+        and returns the x after the last glyph. With rotated=True, (x, y) are
+        upright coordinates and the text lands rotated by 180 degrees.
+        """
+        h = self.height
+        offsets = self.offsets
+        for char in text:
+            i = self._index(char)
+            w = self.widths[i]
+            if char != " ":
+                if rotated:
+                    gw = (w + 7) & ~7 # Rotated bitmaps are padded on the left
+                    blit(buf, width, height, self._rotated_glyph(i), gw, h,
+                         width - x - gw, height - y - h, c)
+                else:
+                    off = offsets[2 * i] | (offsets[2 * i + 1] << 8)
+                    blit(buf, width, height, self.data, w, h, x, y, c, off)
+            x += w
+        return x
+
+    def _rotated_glyph(self, i):
+        cache = self._rotated
+        glyph = cache.get(i)
+        if glyph is not None:
+            # Re-insert to mark as most recently used
+            del cache[i]
+            cache[i] = glyph
+            return glyph
+        w = (self.widths[i] + 7) & ~7
+        off = self.offsets[2 * i] | (self.offsets[2 * i + 1] << 8)
+        glyph = bytearray(self.data[off:off + (w >> 3) * self.height])
+        rotate180(glyph, w, self.height)
+        if len(cache) >= ROTATED_CACHE:
+            del cache[next(iter(cache))]
+        cache[i] = glyph
+        return glyph
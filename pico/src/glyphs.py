@@ -0,0 +1,47 @@
+# glyphs.py
+"""
+Byte-level glyph blitting.
+
+Glyphs are packed 1bpp bitmaps (MONO_HLSB layout, set bit = ink). blit()
+patches whole glyph rows into the target buffer byte by byte instead of
+calling pixel()/fill_rect() per font pixel.
+"""
+
+
+def blit(buf, width, height, glyph, w, h, x, y, c=0, offset=0):
+    """
+    Copies the ink of a packed w x h glyph (rows of (w + 7) // 8 bytes,
+    starting at glyph[offset]) into buf at (x, y). Ink pixels are set to
+    colour c, everything else is left untouched. Glyphs are clipped to the
+    buffer.
+    """
+    stride = width >> 3
+    gstride = (w + 7) >> 3
+    col = x >> 3
+    shift = x & 7
+    span = gstride + 1 if shift else gstride
+    pad = 8 - shift if shift else 0
+
+    for gy in range(h):
+        dy = y + gy
+        if dy < 0 or dy >= height:
+            continue
+        base = offset + gy * gstride
+        row = 0
+        for k in range(gstride):
+            row = (row << 8) | glyph[base + k]
+        if not row:
+            continue
+        row <<= pad
+
+        off = dy * stride + col
+        for k in range(span):
+            if col + k < 0 or col + k >= stride:
+                continue
+            b = (row >> (8 * (span - 1 - k))) & 0xFF
+            if not b:
+                continue
+            if c:
+                buf[off + k] |= b
+            else:
+                buf[off + k] &= ~b
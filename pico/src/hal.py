@@ -1,7 +1,10 @@
 # hal.py
 import sys
 import time
+import ahttp
 import config
+import inputs
+import stats
 from version import FW_VERSION
 
 
@@ -10,7 +13,6 @@ IS_MICROPYTHON = False
 try:
     import machine
     import network
-    import urequests
     import ujson
     import utime
     import framebuf
@@ -19,7 +21,6 @@ except ImportError:
     # Minimal mocks for host testing context
     machine = None
     network = None
-    urequests = None
     ujson = None
 
     # Use our local mock for framebuf
@@ -30,10 +31,16 @@ except ImportError:
         import framebuf
     except ImportError:
         framebuf = None
+    # Emulated e-paper controller, so host runs go through the real driver
+    try:
+        import ssd1681
+    except ImportError:
+        ssd1681 = None
 
 class HardwareAbstractionLayer:
     def __init__(self):
         self._wlan = None
+        self._adc = None # RP2040 temperature sensor, created on first read
 
     def get_time_ms(self):
         """Returns current time in milliseconds."""
@@ -84,12 +91,23 @@ class HardwareAbstractionLayer:
             print("[HAL] Reset device triggered")
 
     # --- Pin Management ---
-    def create_pin_in(self, pin_id, pull_up=True):
+    def create_pin_in(self, pin_id, pull_up=True, edges=None):
+        """
+        Creates an input pin. With edges (an inputs.EdgeQueue), every edge is
+        pushed to it from a hard pin IRQ as (pin_id, level, ticks_us).
+        """
         if IS_MICROPYTHON:
             pull = machine.Pin.PULL_UP if pull_up else None
-            return machine.Pin(pin_id, machine.Pin.IN, pull)
-        else:
-            return MockPin(pin_id, 0 if pull_up else 1)
+            pin = machine.Pin(pin_id, machine.Pin.IN, pull)
+            if edges is not None:
+                pin.irq(lambda p: edges.push_irq(pin_id, p.irq().flags(), p.value(), time.ticks_us()),
+                        machine.Pin.IRQ_FALLING | machine.Pin.IRQ_RISING, hard=True)
+            return pin
+        pin = MockPin(pin_id, 0 if pull_up else 1)
+        if edges is not None:
+            pin.irq(lambda p: edges.push_irq(pin_id, p.irq().flags(), p.value(), p.ticks_us()),
+                    MockPin.IRQ_FALLING | MockPin.IRQ_RISING, hard=True)
+        return pin
 
     def create_pin_out(self, pin_id):
         if IS_MICROPYTHON:
@@ -97,6 +115,20 @@ class HardwareAbstractionLayer:
         else:
             return MockPin(pin_id, 0)
 
+    def pulse_pin(self, pin, duration_ms):
+        """
+        Drives pin high for duration_ms and returns at once; a one-shot timer
+        drives it low again.
+        """
+        pin.on()
+        if IS_MICROPYTHON:
+            self._pulse_timer = machine.Timer(mode=machine.Timer.ONE_SHOT, period=duration_ms,
+                                              callback=lambda t: pin.off())
+        else:
+            import threading
+            self._pulse_timer = threading.Timer(duration_ms / 1000, pin.off)
+            self._pulse_timer.start()
+
     # --- SPI Management ---
     def create_spi(self, spi_id, baudrate, sck_pin, mosi_pin, miso_pin=None):
         if IS_MICROPYTHON:
@@ -115,12 +147,13 @@ class HardwareAbstractionLayer:
                 spi = self.create_spi(0, baudrate=4000000,
                                      sck_pin=config.PIN_EPD_CLK,
                                      mosi_pin=config.PIN_EPD_DIN)
+                self._epd_spi = spi
                 cs = self.create_pin_out(config.PIN_EPD_CS)
                 dc = self.create_pin_out(config.PIN_EPD_DC)
                 rst = self.create_pin_out(config.PIN_EPD_RST)
                 busy = self.create_pin_in(config.PIN_EPD_BUSY, pull_up=False)
 
-                temp_epd = EPD(spi, cs, dc, rst, busy)
+                temp_epd = EPD(spi, cs, dc, rst, busy, read=self._epd_read)
 
                 # Try to initialize. If it times out, we assume it's missing.
                 # We need to catch if it "failed" - currently it just prints.
@@ -140,10 +173,34 @@ class HardwareAbstractionLayer:
                     self._epd = MockEPD()
                 else:
                     self._epd = temp_epd
+            elif ssd1681:
+                from epaper1in54 import EPD
+                self.epd_emulator = ssd1681.SSD1681()
+                self._epd = EPD(*self.epd_emulator.pins(), read=self.epd_emulator.read)
             else:
                 self._epd = MockEPD()
         return self._epd
 
+    def _epd_read(self, n):
+        """
+        Reads n bytes from the display controller. It answers on its data
+        line, wired to MOSI here, so the clock and data pins are bit-banged
+        for the read and handed back to the SPI peripheral afterwards.
+        """
+        Pin = machine.Pin
+        sck = Pin(config.PIN_EPD_CLK, Pin.OUT, value=0)
+        sda = Pin(config.PIN_EPD_DIN, Pin.IN)
+        data = bytearray(n)
+        for i in range(n):
+            b = 0
+            for _ in range(8):
+                sck.on()
+                b = (b << 1) | sda.value()
+                sck.off()
+            data[i] = b
+        self._epd_spi.init(baudrate=4000000, sck=Pin(config.PIN_EPD_CLK), mosi=Pin(config.PIN_EPD_DIN))
+        return data
+
     # --- Time Management ---
     def set_time(self, unix_timestamp):
         """Sets the system RTC from a unix timestamp."""
@@ -177,6 +234,24 @@ class HardwareAbstractionLayer:
 
         return f"{days}d {hours % 24}h {minutes % 60}m"
 
+    def read_temperature(self):
+        """
+        Returns the temperature in °C, or None. The display's own sensor is
+        used when it can be read, so waveform choices follow the panel;
+        otherwise the RP2040 chip temperature (close to ambient when idle).
+        """
+        epd = getattr(self, "_epd", None)
+        if epd is not None and hasattr(epd, "read_temperature"):
+            temp = epd.read_temperature()
+            if temp is not None:
+                return temp
+        if not IS_MICROPYTHON:
+            return None
+        if self._adc is None:
+            self._adc = machine.ADC(4) # RP2040 internal sensor
+        volts = self._adc.read_u16() * 3.3 / 65535
+        return 27 - (volts - 0.706) / 0.001721
+
     # --- Network ---
     def connect_wifi(self, ssid, password, timeout_s=20):
         if not IS_MICROPYTHON:
@@ -211,61 +286,139 @@ class HardwareAbstractionLayer:
         return self._wlan.config("mac").hex()
 
     # --- HTTP ---
-    def http_post(self, url, headers, json_data):
-
+    def prepare_post(self, url, json_data=None, headers=None):
+        """
+        Builds a POST once, headers and JSON body encoded, for send().
+        Used where the request time matters, such as the ring notification.
+        """
         all_headers = {
             "Authorization": "Apartment " + config.API_KEY,
             "Content-Type": "application/json",
             "X-FW-Version": FW_VERSION,
         }
-        all_headers.update(headers)
-
+        if headers:
+            all_headers.update(headers)
+        if IS_MICROPYTHON:
+            body = ujson.dumps(json_data or {}).encode()
+        else:
+            import json
+            body = json.dumps(json_data or {}).encode()
+        return (url, all_headers, body)
+
+    async def send(self, request):
+        """
+        Sends a request from prepare_post(). Returns the response, or None.
+        Awaits the network, so the other tasks keep running meanwhile.
+        """
+        url, headers, body = request
         if not IS_MICROPYTHON:
-            print(f"[HAL] Mock POST to {url} with {json_data}")
+            print(f"[HAL] Mock POST to {url} with {body}")
             return MockResponse(200, {})
 
         try:
-            r = urequests.post(url, headers=all_headers, json=json_data)
-            return r
+            return await ahttp.request("POST", url, headers, body)
         except Exception as e:
-            print(f"HTTP Error: {e}")
+            print(f"HTTP Error: {e!r}")
             return None
 
-    def http_get(self, url, headers={}):
+    async def http_post(self, url, headers, json_data):
+        return await self.send(self.prepare_post(url, json_data, headers))
+
+    async def http_get(self, url, headers=None):
         all_headers = {
             "Authorization": "Apartment " + config.API_KEY,
             "Content-Type": "application/json",
             "X-FW-Version": FW_VERSION,
         }
-        all_headers.update(headers)
+        if headers:
+            all_headers.update(headers)
         if not IS_MICROPYTHON:
             print(f"[HAL] Mock GET from {url}")
             return MockResponse(200, {})
 
         try:
-            r = urequests.get(url, headers=all_headers)
-            return r
+            return await ahttp.request("GET", url, all_headers)
         except Exception as e:
-            print(f"HTTP Error: {e}")
+            print(f"HTTP Error: {e!r}")
             return None
 
 
 # --- Mocks for Host Testing ---
 class MockPin:
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
     def __init__(self, pin_id, initial_value):
         self.pin_id = pin_id
         self._value = initial_value
+        self._irq_handler = None
+        self._irq_trigger = 0
+        self._irq = MockIRQ()
+        self._edge_us = None # Time of an injected edge
 
     def value(self, val=None):
         if val is not None:
+            old = self._value
             self._value = val
+            if bool(old) != bool(val):
+                self._fire(self.IRQ_RISING if val else self.IRQ_FALLING)
         return self._value
 
+    def _fire(self, flags):
+        flags &= self._irq_trigger
+        if self._irq_handler and flags:
+            self._irq._flags = flags
+            try:
+                self._irq_handler(self)
+            finally:
+                self._irq._flags = 0
+
     def on(self):
-        self._value = 1
+        self.value(1)
 
     def off(self):
-        self._value = 0
+        self.value(0)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        """Sets the IRQ handler; without arguments returns the IRQ, as machine.Pin."""
+        if handler is not None:
+            self._irq_handler = handler
+            self._irq_trigger = trigger
+        return self._irq
+
+    def inject(self, level, t_us):
+        """Sets the level as an edge that happened at t_us (inputs.ticks_us() time)."""
+        self._edge_us = t_us
+        try:
+            self.value(level)
+        finally:
+            self._edge_us = None
+
+    def inject_pulse(self, t_us):
+        """
+        A pulse away from the current level and back, shorter than the IRQ
+        latency: the handler runs once, after both edges, with both flags.
+        """
+        self._value = 1 - self._value
+        self._value = 1 - self._value
+        self._edge_us = t_us
+        try:
+            self._fire(self.IRQ_FALLING | self.IRQ_RISING)
+        finally:
+            self._edge_us = None
+
+    def ticks_us(self):
+        """Time of the edge being handled, for IRQ handlers."""
+        return inputs.ticks_us() if self._edge_us is None else self._edge_us
+
+
+class MockIRQ:
+    """IRQ object of a MockPin; flags() are the edges of the running handler."""
+    def __init__(self):
+        self._flags = 0
+
+    def flags(self):
+        return self._flags
 
 class MockResponse:
     def __init__(self, status_code, json_content):
@@ -303,23 +456,34 @@ class MockEPD:
     def sleep(self):
         print("[HAL] Mock EPD sleep")
 
-    def display(self, image):
+    def is_busy(self):
+        return False
+
+    def display(self, image, rects=None, wait=True, callback=None):
         print("[HAL] Mock EPD display image")
+        if stats.ENABLED:
+            stats.add("refresh_full")
         if framebuf:
             fb = framebuf.FrameBuffer(image, 200, 200, framebuf.MONO_HLSB)
             if hasattr(fb, "show"):
                 fb.show()
             if hasattr(fb, "to_png"):
                 fb.to_png("preview_full.png")
+        if callback:
+            callback(self) # Refresh is instant here
 
-    def display_partial(self, image):
+    def display_partial(self, image, rects=None, wait=True, callback=None, profile=None):
         print("[HAL] Mock EPD display partial")
+        if stats.ENABLED:
+            stats.add("refresh_partial")
         if framebuf:
             fb = framebuf.FrameBuffer(image, 200, 200, framebuf.MONO_HLSB)
             if hasattr(fb, "show"):
                 fb.show()
             if hasattr(fb, "to_png"):
                 fb.to_png("preview_partial.png")
+        if callback:
+            callback(self)
 
     def clear(self, fast=False):
         print("[HAL] Mock EPD clear")
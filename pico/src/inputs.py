@@ -0,0 +1,129 @@
+# inputs.py
+"""
+Interrupt-driven input capture.
+
+Pin IRQs push every edge as (pin_id, level, ticks_us) into an EdgeQueue, so
+no edge is missed however long the app is busy and each one keeps the time
+it happened. A task drains the queue and a Debouncer per input turns the
+raw edges into clean press and release events.
+"""
+
+import time
+from array import array
+
+if hasattr(time, "ticks_us"):
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+else:
+    # Host: the same wrapping 30-bit ticks as MicroPython
+    _TICKS_MAX = 0x3FFFFFFF
+
+    def ticks_us():
+        return int(time.perf_counter() * 1000000) & _TICKS_MAX
+
+    def ticks_diff(a, b):
+        return ((a - b + 0x20000000) & _TICKS_MAX) - 0x20000000
+
+PRESS = 1
+RELEASE = 2
+
+# Pin IRQ trigger flags, as machine.Pin on the RP2040
+IRQ_FALLING = 4
+IRQ_RISING = 8
+
+
+class EdgeQueue:
+    """
+    Ring buffer of edges, allocated once. push() runs in the IRQ handler and
+    never allocates; when the buffer is full new edges are dropped and counted.
+    """
+    def __init__(self, size=32):
+        # One slot stays free, so head == tail means empty without a shared count
+        self._slots = size + 1
+        self._buf = array("i", [0] * (3 * self._slots))
+        self._head = 0 # Next edge to read, moved by pop() only
+        self._tail = 0 # Next free slot, moved by push() only
+        self.dropped = 0
+
+    def __len__(self):
+        return (self._tail - self._head) % self._slots
+
+    def push(self, pin_id, level, t_us):
+        tail = self._tail
+        nxt = tail + 1
+        if nxt == self._slots:
+            nxt = 0
+        if nxt == self._head:
+            self.dropped += 1
+            return
+        i = tail * 3
+        buf = self._buf
+        buf[i] = pin_id
+        buf[i + 1] = level
+        buf[i + 2] = t_us
+        self._tail = nxt # Publish only once the slot is written
+
+    def push_irq(self, pin_id, flags, level, t_us):
+        """
+        Pushes the edges of one pin IRQ. The level comes from the IRQ flags,
+        not from the pin, which may have changed again since the edge. With
+        both flags set a pulse ended before the IRQ ran: both edges are
+        pushed, and the level the pin is at now gives their order.
+        """
+        if flags & IRQ_FALLING and flags & IRQ_RISING:
+            self.push(pin_id, 1 - level, t_us)
+            self.push(pin_id, level, t_us)
+        elif flags & IRQ_FALLING:
+            self.push(pin_id, 0, t_us)
+        elif flags & IRQ_RISING:
+            self.push(pin_id, 1, t_us)
+
+    def pop(self):
+        """Returns the oldest edge as (pin_id, level, t_us), or None."""
+        head = self._head
+        if head == self._tail:
+            return None
+        i = head * 3
+        buf = self._buf
+        edge = (buf[i], buf[i + 1], buf[i + 2])
+        head += 1
+        self._head = 0 if head == self._slots else head
+        return edge
+
+
+class Debouncer:
+    """
+    Debounces one input. The first active edge is a press right away, with
+    the time of that edge. The release follows once the input has stayed
+    inactive for debounce_ms, so bounces and repeats within that time belong
+    to the same press.
+    """
+    def __init__(self, debounce_ms, active=0):
+        self.debounce_us = debounce_ms * 1000
+        self.active = active
+        self.level = 1 - active
+        self.pressed = False
+        self.t_edge = 0 # Time of the last edge
+        self.t_press = 0
+
+    def edge(self, level, t_us):
+        """Feeds an edge. Returns PRESS if it starts a press, else None."""
+        self.level = level
+        self.t_edge = t_us
+        if level == self.active and not self.pressed:
+            self.pressed = True
+            self.t_press = t_us
+            return PRESS
+        return None
+
+    def poll(self, now_us):
+        """Returns RELEASE once the input has settled inactive, else None."""
+        if (self.pressed and self.level != self.active
+                and ticks_diff(now_us, self.t_edge) >= self.debounce_us):
+            self.pressed = False
+            return RELEASE
+        return None
+
+    def held_ms(self, now_us):
+        """How long the current press has lasted."""
+        return ticks_diff(now_us, self.t_press) // 1000 if self.pressed else 0
@@ -1,9 +1,18 @@
-import framebuf
+import sys
 import time
+import aio
 import hal
 import config
+import inputs
+from canvas import FrameBufferPool, dirty_rects, frame_digest, rotate180
+from display_queue import DisplayQueue
 from ota import OTAUpdater
+from refresh import RefreshScheduler
+from rle import RLEImage
+import stats
+from templates import ScreenTemplates
 from version import FW_VERSION
+from widgets import Box, Label, ProgressBar, Screen
 
 # Try to import BLE, but allow failure for host testing if not mocked/available
 try:
@@ -12,13 +21,30 @@ except ImportError:
     BLEProvision = None
 
 class DoorbellApp:
+    # Entering these modes forces a full refresh to clear ghosting
+    FULL_REFRESH_MODES = ("START", "SETUP")
+    # Screens pre-rendered into asset_<name>.py modules by tools/build_assets.py
+    ASSET_SCREENS = ("START", "SETUP", "OPEN")
+    # Partial refresh profile per screen (see epaper1in54.PROFILES)
+    SCREEN_PROFILES = {
+        "LISTEN": "fast-partial",
+        "OPEN": "fast-partial",
+        "OTA": "fast-partial",
+    }
+    # OTA progress bar (x, y, w, h) in upright coordinates, byte aligned so
+    # it maps onto whole bytes of the panel RAM in either rotation
+    OTA_BAR = (16, 145, 168, 16)
+
     def __init__(self, hardware_layer):
         self.hal = hardware_layer
         self.ota = OTAUpdater(self.hal, FW_VERSION, on_progress=self.display_ota_progress)
 
-        # Pins
-        self.pin_btn = self.hal.create_pin_in(config.PIN_BTN_BOOT, pull_up=True)
-        self.pin_ring = self.hal.create_pin_in(config.PIN_RING_IN, pull_up=True) # Input from Optocoupler
+        # Pins. Input edges are captured by IRQ, see input_task()
+        self.edges = inputs.EdgeQueue()
+        self.pin_btn = self.hal.create_pin_in(config.PIN_BTN_BOOT, pull_up=True, edges=self.edges)
+        self.pin_ring = self.hal.create_pin_in(config.PIN_RING_IN, pull_up=True, edges=self.edges) # Input from Optocoupler
+        self.btn_input = inputs.Debouncer(config.BTN_DEBOUNCE_MS)
+        self.ring_input = inputs.Debouncer(config.RING_DEBOUNCE_MS)
         self.pin_door = self.hal.create_pin_out(config.PIN_DOOR_OUT)             # Output to Optocoupler
 
         # We assume LED pin is handled by HAL or machine but HAL.create_pin_out can handle "LED" string if implemented
@@ -34,6 +60,14 @@ class DoorbellApp:
 
         self.ring_ts = 0
         self.status_check_ts = 0
+        self._ring_request = None # Pre-encoded ring POST, built on first use
+        # Latency of each stage of the last ring, in us since its first edge:
+        # detected, sent (POST answered), synced (response applied), displayed
+        self.ring_trace = {}
+        self._trace_display = False
+        # Events between the tasks of run(): "RING", "SETUP"
+        self.events = aio.EventQueue()
+        self.tasks = []
 
         self.api_key = config.API_KEY
         self.wifi_creds = {
@@ -47,135 +81,354 @@ class DoorbellApp:
         self.rotation = 180 # Matches user's mounting
         self._display_last_update = self.hal.get_time_ms()
         self.display_awake = False
+        self.panel_temp = None # °C, see _wake
+        self._panel_temp_ts = None
+        self._fb_pool = None # See fb_pool
+        self._shown_digest = None # Digest of the frame on the panel
+        self.display_skipped = 0 # Refreshes skipped because nothing changed
+        # Refreshes run in the background; the next push waits for the panel
+        self.display_async = True
+        self._sleep_pending = False
+        # Screens requested by request_display(), drawn by display_service()
+        self.display_queue = DisplayQueue(self.hal)
+        self.door_latency_us = 0 # Open command to relay, last door opening
+        self.status_rx_us = 0 # inputs.ticks_us() when the last status response arrived
+        self.refresh_scheduler = RefreshScheduler(self.hal)
+        self._shown_mode = None
+        # Widget trees of all screens; the static widgets are painted once
+        self._build_screens()
+        self.templates = ScreenTemplates(200, 200)
+        for name, screen in self.screens.items():
+            self.templates.register(name, screen.paint_static)
+        self._front_screen = None # Screen drawn in fb_pool.front, if still valid
+        self._back_screen = None
+
+    @property
+    def fb_pool(self):
+        """
+        Front (last shown) and back (being drawn) frames, allocated once on
+        first use, so the boot screen asset is on the panel before them.
+        """
+        if self._fb_pool is None:
+            self._fb_pool = FrameBufferPool(200, 200, rotation=self.rotation)
+        return self._fb_pool
 
-    def draw_scaled_text(self, fb, text, x, y, scale=2):
-        """Draws larger text by scaling up the 8x8 font."""
-        char_buf = bytearray(8)
-        char_fb = framebuf.FrameBuffer(char_buf, 8, 8, framebuf.MONO_HLSB)
-        for i, char in enumerate(text):
-            char_fb.fill(1)
-            char_fb.text(char, 0, 0, 0)
-            for cy in range(8):
-                for cx in range(8):
-                    if char_fb.pixel(cx, cy) == 0:
-                        fb.fill_rect(x + i*8*scale + cx*scale, y + cy*scale, scale, scale, 0)
-
-    def _get_fb(self):
-        """Creates a framebuffer and returns it along with the buffer."""
-        width, height = 200, 200
-        buf = bytearray(width * height // 8)
-        fb = framebuf.FrameBuffer(buf, width, height, framebuf.MONO_HLSB)
-        fb.fill(1) # White
-        return fb, buf
-
-    def _rotate_and_display(self, fb, buf, partial=False, sleep=True):
-        """Handles rotation and pushing to the physical display."""
-        width, height = 200, 200
-        ready_buf = buf
-        if self.rotation == 180:
-            ready_buf = bytearray(len(buf))
-            dst_fb = framebuf.FrameBuffer(ready_buf, width, height, framebuf.MONO_HLSB)
-            dst_fb.fill(1)
-            for y in range(height):
-                for x in range(width):
-                    pixel = fb.pixel(x, y)
-                    dst_fb.pixel(width - 1 - x, height - 1 - y, pixel)
+    def _rotate_and_display(self, fb, buf, full=False, sleep=True, rects=None):
+        """
+        Handles rotation and pushing to the physical display.
+        The refresh scheduler picks partial or full refresh; full=True forces full.
+        rects are the only (panel orientation) areas that can have changed, if
+        the caller knows them; otherwise the frame is compared with the last one.
+        """
+        if self.rotation == 180 and getattr(fb, "rotation", 0) != 180:
+            # Drawn upright: rotate in place, no second buffer
+            rotate180(buf, 200, 200)
 
         epd = self.hal.get_epd()
         if not epd.is_functional:
             return
 
-        if not self.display_awake:
-            epd.init()
-            self.display_awake = True
+        t_push = stats.ticks_us() if stats.ENABLED else 0
+        pool = self.fb_pool
+        digest = frame_digest(buf)
+        if pool.front_valid and digest == self._shown_digest:
+            # Identical to what the panel shows: skip wake-up, SPI transfer and refresh
+            self.display_skipped += 1
+            self._front_screen = self._back_screen
+            if stats.ENABLED:
+                stats.add("frames_skipped")
+            if sleep and self.display_awake:
+                self._display_sleep(epd)
+            return
 
-        if partial:
-            epd.display_partial(ready_buf)
-        else:
-            epd.clear(fast=False)
-            epd.display(ready_buf)
+        self._wake(epd)
+        if buf is not pool.back.buf:
+            # Drawn outside the pool: keep the pool in sync with the panel
+            pool.back.buf[:] = buf
+
+        # Only the areas that changed since the last frame go over SPI.
+        # The controller RAM keeps the last frame, so this holds for full refreshes too.
+        if not pool.front_valid:
+            rects = None
+        elif rects is None:
+            rects = dirty_rects(buf, pool.front.buf, 200, 200)
+
+        self._push(epd, buf, rects, full)
+        pool.swap()
+        self._front_screen = self._back_screen
+        self._shown_digest = digest
+        if stats.ENABLED:
+            stats.add("frames_pushed")
+            stats.add_since("push_us", t_push) # Digest, dirty rects, wake-up and SPI
 
         if sleep:
-            epd.sleep()
-            self.display_awake = False
+            self._display_sleep(epd)
         self._display_last_update = self.hal.get_time_ms()
 
-    def display_update(self, partial=False):
-        """Redraws the screen based on current app_mode."""
-        if not self.hal.get_epd().is_functional:
-            return
+    @staticmethod
+    def asset_module(name):
+        """Name of the module holding the pre-rendered screen name."""
+        return "asset_" + name.lower()
+
+    def display_asset(self, name, full=False, sleep=True):
+        """
+        Streams a pre-rendered screen from its asset module to the panel,
+        without drawing a frame. Returns False if there is no usable asset.
+        The module is only loaded while it is streamed.
+        """
+        module = self.asset_module(name)
+        try:
+            asset = __import__(module)
+        except ImportError:
+            return False
+        try:
+            return self._push_asset(asset, full, sleep)
+        finally:
+            del sys.modules[module] # Let the frame data be collected
 
-        fb, buf = self._get_fb()
+    def _push_asset(self, asset, full, sleep):
+        if asset.FW_VERSION != FW_VERSION or asset.ROTATION != self.rotation:
+            return False # Stale asset: draw the screen instead
+
+        epd = self.hal.get_epd()
+        if not epd.is_functional:
+            return True
 
-        # Header (Common)
-        self.draw_scaled_text(fb, "PICOBELL", 10, 15, scale=3)
-        fb.rect(2, 2, 196, 196, 0)
+        digest = asset.DIGEST
+        if digest == self._shown_digest:
+            self.display_skipped += 1
+            if stats.ENABLED:
+                stats.add("frames_skipped")
+            if sleep and self.display_awake:
+                self._display_sleep(epd)
+            return True
 
-        if self.app_mode == "LISTEN":
-            self.draw_listen_screen(fb)
-        elif self.app_mode == "SETUP":
-            self.draw_setup_screen(fb)
-        elif self.app_mode == "OPEN":
-            self.draw_open_screen(fb)
-        elif self.app_mode == "START":
-            self.draw_scaled_text(fb, "BOOTING...", 10, 80, scale=2)
+        t_push = stats.ticks_us() if stats.ENABLED else 0
+        self._wake(epd)
+        self._push(epd, RLEImage(asset.DATA), None, full)
+        if stats.ENABLED:
+            stats.add("frames_pushed")
+            stats.add("asset_frames")
+            stats.add_since("push_us", t_push)
+        # The panel no longer shows the pool's front frame
+        if self._fb_pool is not None:
+            self._fb_pool.front_valid = False
+        self._shown_digest = digest
 
-        self.draw_scaled_text(fb, f"v{FW_VERSION}", 160, 185, scale=1)
-        self._rotate_and_display(fb, buf, partial=partial)
+        if sleep:
+            self._display_sleep(epd)
+        self._display_last_update = self.hal.get_time_ms()
+        return True
 
-    def draw_listen_screen(self, fb):
-        ssid = str(self.wifi_creds.get("ssid") or "NONE")
-        if not self.hal.is_wifi_connected():
-            wifi_str = "OFF"
+    def _wake(self, epd):
+        self._sleep_pending = False
+        if not self.display_awake:
+            epd.init()
+            self.display_awake = True
+            ts = self._panel_temp_ts
+            if ts is None or self.hal.time_diff(ts) > config.EPD_TEMP_INTERVAL_S * 1000:
+                self.panel_temp = self.hal.read_temperature()
+                self._panel_temp_ts = self.hal.get_time_ms()
+
+    def _push(self, epd, image, rects, full):
+        """Writes image to the panel; the refresh scheduler picks partial or full."""
+        scheduler = self.refresh_scheduler
+        full = scheduler.needs_full(full)
+        scheduler.start(full)
+        wait = not self.display_async
+        if full:
+            epd.display(image, rects, wait=wait, callback=scheduler.finish)
         else:
-            wifi_str = ssid[:10]
-
-        self.draw_scaled_text(fb, "READY", 10, 60, scale=3)
-        self.draw_scaled_text(fb, f"WIFI: {wifi_str}", 10, 100, scale=2)
-        self.draw_scaled_text(fb, "LAST CALL:", 10, 130, scale=2)
-        self.draw_scaled_text(fb, self.last_call_str, 10, 155, scale=2)
+            epd.display_partial(image, rects, wait=wait, callback=scheduler.finish,
+                                profile=self._partial_profile())
+
+    def _partial_profile(self):
+        """Picks the partial refresh profile for the screen being shown."""
+        profile = self.SCREEN_PROFILES.get(self._shown_mode, "builtin-partial")
+        if profile == "fast-partial":
+            temp = self.panel_temp
+            if temp is not None and temp < config.EPD_LOW_TEMP_C:
+                return "low-temp"
+        return profile
+
+    def _display_sleep(self, epd):
+        """Puts the panel to sleep, or defers it until a running refresh is done."""
+        if epd.is_busy():
+            self._sleep_pending = True
+            return
+        epd.sleep()
+        self.display_awake = False
+        self._sleep_pending = False
 
-    def draw_setup_screen(self, fb, status="WAITING"):
-        self.draw_scaled_text(fb, "SETUP MODE", 10, 55, scale=2)
+    def request_display(self, mode=None, delay_ms=0, hold=False):
+        """
+        Asks for the screen of mode, delay_ms from now, without waiting for
+        the panel: display_service() draws it once the panel is free. Screens
+        that would show for less than DISPLAY_MIN_DWELL_MS are skipped, unless
+        requested with hold=True. mode=None redraws the last requested screen,
+        e.g. after a data change.
+        """
+        if mode is None:
+            mode = self.display_queue.last() or self.app_mode
+        self.display_queue.post(mode, delay_ms, hold)
 
-        if status == "SAVED":
-            self.draw_scaled_text(fb, "WIFI SAVED!", 10, 95, scale=2)
-            self.draw_scaled_text(fb, "REBOOTING...", 10, 130, scale=2)
+    def display_service(self):
+        """Completes deferred display work. Called regularly from the main loops."""
+        epd = self.hal.get_epd()
+        mode = self.display_queue.next() if not epd.is_busy() else None
+        if mode:
+            self.app_mode = mode
+            self.display_update()
+            if self._trace_display:
+                self._trace_display = False
+                self._ring_stage("displayed")
+        if self._sleep_pending:
+            self._display_sleep(epd)
+
+    def display_idle(self):
+        """True when no display work is left to do."""
+        return not (len(self.display_queue) or self._sleep_pending)
+
+    def display_update(self, full=False):
+        """Redraws the screen based on current app_mode. full=True forces a full refresh."""
+        if not self.hal.get_epd().is_functional:
+            return
+        if stats.ENABLED:
+            stats.add("display_updates")
+
+        mode = self.app_mode
+        if mode != self._shown_mode:
+            if mode in self.FULL_REFRESH_MODES:
+                full = True
+            if self._shown_mode == "START":
+                self.templates.release("START") # Only shown at boot
+        self._shown_mode = mode
+
+        if mode in self.ASSET_SCREENS and self.display_asset(mode, full=full):
             return
+        fb, buf, rects = self._render(mode)
+        self._rotate_and_display(fb, buf, full=full, rects=rects)
 
-        # Instructions
-        self.draw_scaled_text(fb, "1. OPEN APP", 10, 85, scale=1)
-        self.draw_scaled_text(fb, "2. SCAN QR", 10, 105, scale=1)
-        self.draw_scaled_text(fb, "3. CONNECT", 10, 125, scale=1)
+    def render_screen(self, mode):
+        """Draws the screen of mode into the back buffer and returns (fb, buf)."""
+        fb, buf, _ = self._render(mode)
+        return fb, buf
+
+    def _render(self, mode):
+        """
+        Draws the screen of mode into the back buffer. Returns (fb, buf, rects),
+        rects being the changed areas in panel orientation, or None if unknown.
+        If the panel shows this screen already, only dirty widgets are redrawn.
+        """
+        t_render = stats.ticks_us() if stats.ENABLED else 0
+        screen = self.screens[mode]
+        screen.update()
+        template = self.templates.get(mode, self.rotation)
+        pool = self.fb_pool
+        if (pool.front_valid and self._front_screen == mode
+                and pool.front.rotation == self.rotation):
+            fb = pool.acquire(self.rotation, pool.front.buf)
+            rects = [self._panel_rect(r) for r in screen.render(fb, template)]
+        else:
+            screen.invalidate()
+            fb = pool.acquire(self.rotation, template)
+            screen.render(fb)
+            rects = None
+        self._back_screen = mode
+        if stats.ENABLED:
+            stats.add_since("render_us", t_render)
+        return fb, fb.buf, rects
+
+    # --- Screens ---
+
+    def _build_screens(self):
+        """Declares the widgets of every screen. Dynamic ones are bound to app state."""
+        version = f"v{FW_VERSION}"
+        common = (
+            Label(10, 15, "PICOBELL", 24),
+            Box(2, 2, 196, 196),
+            Label(190, 187, version, 8, right=True),
+        )
+        # Widths reach the screen edge, so no text can overflow its bounds
+        self.wifi_label = Label(10, 100, "WIFI: ", 16, w=190)
+        self.last_call_label = Label(10, 155, self.last_call_str, 16, w=190)
+        self.setup_status = Label(20, 155, "WAITING", 16, w=160)
+        self.ota_bar = ProgressBar(*self.OTA_BAR)
+        self.ota_rebooting = Label(10, 175, "REBOOTING", 16)
+        self.ota_rebooting.set_visible(False)
+
+        self.screens = {
+            "LISTEN": Screen(common + (
+                Label(10, 60, "READY", 24),
+                Label(10, 130, "LAST CALL:", 16),
+            ), (self.wifi_label, self.last_call_label), bind=self._bind_listen),
+            "SETUP": Screen(common + (
+                Label(10, 55, "SETUP MODE", 16),
+                # Instructions
+                Label(10, 85, "1. OPEN APP", 8),
+                Label(10, 105, "2. SCAN QR", 8),
+                Label(10, 125, "3. CONNECT", 8),
+                # Status Box
+                Box(10, 145, 180, 35),
+            ), (self.setup_status,)),
+            "SETUP_SAVED": Screen(common + (
+                Label(10, 55, "SETUP MODE", 16),
+                Label(10, 95, "WIFI SAVED!", 16),
+                Label(10, 130, "REBOOTING...", 16),
+            )),
+            "OPEN": Screen(common + (
+                Label(10, 80, "OPENING", 24),
+                Label(10, 120, "DOOR...", 24),
+            )),
+            "START": Screen(common + (
+                Label(10, 80, "BOOTING...", 16),
+            )),
+            "OTA": Screen((
+                Label(10, 15, "PICOBELL", 24),
+                Label(10, 70, "UPDATING", 24),
+                Label(10, 105, "SOFTWARE", 24),
+            ), (self.ota_bar, self.ota_rebooting)),
+        }
 
-        # Status Box
-        fb.rect(10, 145, 180, 35, 0)
-        self.draw_scaled_text(fb, status, 20, 155, scale=2)
+    def _bind_listen(self):
+        if not self.hal.is_wifi_connected():
+            wifi_str = "OFF"
+        else:
+            wifi_str = str(self.wifi_creds.get("ssid") or "NONE")[:10]
+        self.wifi_label.set_text("WIFI: " + wifi_str)
+        self.last_call_label.set_text(self.last_call_str)
 
-    def draw_open_screen(self, fb):
-        self.draw_scaled_text(fb, "OPENING", 10, 80, scale=3)
-        self.draw_scaled_text(fb, "DOOR...", 10, 120, scale=3)
+    def _panel_rect(self, rect):
+        """Maps an upright (x, y, w, h) rectangle to panel orientation."""
+        x, y, w, h = rect
+        if self.rotation == 180:
+            return (200 - x - w, 200 - y - h, w, h)
+        return rect
 
     def display_ota_progress(self, current, total, is_done=False):
-        """Displays OTA progress on the E-Ink screen."""
-        if not self.hal.get_epd().is_functional:
+        """
+        Displays OTA progress on the E-Ink screen. The first step shows the
+        whole screen with a full refresh; after that only the progress bar
+        window goes to the panel, as a partial refresh that runs while the
+        next file downloads. Steps arriving while the panel is still busy are
+        skipped, the next step fills the bar up to its own position anyway.
+        """
+        epd = self.hal.get_epd()
+        if not epd.is_functional:
             print(f"[OTA] Progress: {current}/{total}")
             return
 
-        fb, buf = self._get_fb()
-        self.draw_scaled_text(fb, "PICOBELL", 10, 15, scale=3)
-        self.draw_scaled_text(fb, "UPDATING", 10, 70, scale=3)
-        self.draw_scaled_text(fb, "SOFTWARE", 10, 105, scale=3)
-
-        dots = "." * current
-        self.draw_scaled_text(fb, dots, 10, 145, scale=2)
-
-        if is_done:
-            self.draw_scaled_text(fb, "REBOOTING", 10, 175, scale=2)
+        first = current == 1 or self._shown_mode != "OTA"
+        if not first and not is_done and epd.is_busy():
+            return # Never hold up the download for the display
 
-        # Partial if current > 1.
-        # Only sleep if done to avoid redundant wake cycles during fast updates.
-        self._rotate_and_display(fb, buf, partial=(current > 1), sleep=is_done)
+        self.ota_bar.set_value(current, total)
+        self.ota_rebooting.set_visible(is_done)
+        self._shown_mode = "OTA"
+        # Only the bar (and REBOOTING when done) goes to the panel. It stays
+        # awake until done, a wake-up costs a reset and init.
+        fb, buf, rects = self._render("OTA")
+        self._rotate_and_display(fb, buf, full=first, sleep=is_done, rects=rects)
 
     def led_update(self):
         now = self.hal.get_time_ms()
@@ -211,18 +464,18 @@ class DoorbellApp:
         print("Wi-Fi Connection Failed")
         return False
 
-    def start_ble_provisioning(self, timeout_ms=600000):
+    async def start_ble_provisioning(self, timeout_ms=600000):
         """
         Starts BLE provisioning mode.
         Default timeout is 10 minutes (600000 ms).
+        The LED and display tasks keep running meanwhile.
         """
         print(f"Starting BLE Provisioning (Timeout: {timeout_ms/600000} mins)...")
         if not BLEProvision:
             print("BLE module not available")
             return
 
-        self.app_mode = "SETUP"
-        self.display_update()
+        self.request_display("SETUP")
 
         self.led_mode = 2
         # Initialize BLEProvision with self.hal
@@ -233,7 +486,7 @@ class DoorbellApp:
         while True:
             if prov.is_provisioned:
                 print("Provisioned! Rebooting...")
-                self.hal.sleep(1.0) # Give time for BLE to finish notification
+                await aio.sleep_ms(1000) # Give time for BLE to finish notification
                 self.hal.reset_device()
 
             # Check timeout
@@ -241,17 +494,22 @@ class DoorbellApp:
                 print("BLE Provisioning Timeout. Returning to normal operation.")
                 self.led_mode = 0 # Turn off LED animation
                 self.pin_led.off()
-                self.display_update()
+                self.request_display("LISTEN")
                 break
 
-            self.led_update()
-            self.hal.sleep_ms(100)
+            await aio.sleep_ms(100)
 
-    def send_ring_event(self):
-        url = config.URL_RING
+    def ring_request(self):
+        if self._ring_request is None:
+            self._ring_request = self.hal.prepare_post(config.URL_RING)
+        return self._ring_request
 
+    async def send_ring_event(self):
         print("Sending RING event...")
-        r = self.hal.http_post(url, {}, {})
+        self.handle_ring_response(await self.hal.send(self.ring_request()))
+
+    def handle_ring_response(self, r):
+        """Applies the time sync of a ring response; the redraw follows from display_service()."""
         if r:
             try:
                 data = r.json()
@@ -274,11 +532,12 @@ class DoorbellApp:
             except Exception as e:
                 print(f"Error parsing ring response: {e}")
 
-        self.display_update()
+        self.request_display()
 
-    def check_open_status(self):
+    async def check_open_status(self):
         url = config.URL_STATUS
-        r = self.hal.http_post(url, {}, {})
+        r = await self.hal.http_post(url, {}, {})
+        self.status_rx_us = inputs.ticks_us()
         if r:
             try:
                 data = r.json()
@@ -288,105 +547,165 @@ class DoorbellApp:
                 pass
         return False
 
-    def pulse_door(self):
-        print("OPENING DOOR")
-        self.app_mode = "OPEN"
-        self.display_update()
-
-        self.pin_door.on()
-        self.hal.sleep(config.DOOR_PULSE_S)
-        self.pin_door.off()
-
-        self.app_mode = "LISTEN"
-        self.display_update()
+    def pulse_door(self, t_cmd=None):
+        """
+        Opens the door. The relay pulse starts first and a timer ends it, so
+        nothing waits for it. OPEN is requested with hold, so it is shown for
+        at least DISPLAY_MIN_DWELL_MS even though the pulse is shorter, then
+        LISTEN once the pulse is over.
+        t_cmd is the inputs.ticks_us() time of the open command.
+        """
+        if t_cmd is None:
+            t_cmd = inputs.ticks_us()
+        if self.pin_door.value():
+            return # Pulse already running
+        pulse_ms = int(config.DOOR_PULSE_S * 1000)
+        self.hal.pulse_pin(self.pin_door, pulse_ms)
+        self.door_latency_us = inputs.ticks_diff(inputs.ticks_us(), t_cmd)
+        if stats.ENABLED:
+            stats.add("door_opens")
+            stats.add("door_latency_us", self.door_latency_us)
+
+        print(f"OPENING DOOR ({self.door_latency_us} us)")
+        self.request_display("OPEN", hold=True)
+        self.request_display("LISTEN", pulse_ms)
 
     def run(self):
+        aio.run(self.main())
+
+    async def main(self):
         print(f"Booting Firmware {FW_VERSION}")
-        # Note: We wait to display until WiFi or BLE mode is ready
+        # Boot screen, streamed from a pre-rendered asset when available
+        self.display_update()
+        self.start_tasks()
         if not self.wifi_creds or not self.wifi_creds.get("ssid"):
             print("No Wi-Fi credentials found.")
-            self.start_ble_provisioning()
+            await self.start_ble_provisioning()
         else:
             if self.connect_wifi():
                 self.led_mode = 1
-                self.app_mode = "LISTEN"
-                self.display_update()
-                # Check OTA
-                if self.ota.check_for_updates():
-                    if self.ota.update_firmware():
-                        # Wait a few seconds before reboot as requested
-                        print("[OTA] Update successful. Waiting 5s before reboot...")
-                        self.hal.sleep(5.0)
-                        self.hal.reset_device()
+                self.request_display("LISTEN")
+                self.tasks.append(aio.create_task(self.ota_task()))
             else:
                 print("Could not connect to Wi-Fi. Returning to Setup.")
-                self.app_mode = "SETUP"
-                self.display_update()
-                self.start_ble_provisioning()
+                await self.start_ble_provisioning()
 
-        # 2. Main Loop
         print("Entering Main Loop")
-        while True:
-            # LED Animation
-            self.led_update()
+        await self.event_task()
+
+    def start_tasks(self):
+        """Starts the input, LED, display and status tasks. main() handles their events."""
+        for coro in (self.led_task(), self.display_task(), self.input_task(),
+                     self.status_task()):
+            self.tasks.append(aio.create_task(coro))
 
-            # Button handling (Manual Door Open vs BLE Setup)
-            if self.pin_btn.value() == 0:
-                # Button pressed
-                t_press = self.hal.get_time_ms()
-                is_long_press = False
-
-                # Check for hold
-                while self.pin_btn.value() == 0:
-                    self.hal.sleep_ms(100)
-                    if self.hal.time_diff(t_press) > 10000: # 10 sec hold
-                         is_long_press = True
-                         print("Button Hold (10s) -> BLE Provisioning")
-                         self.start_ble_provisioning()
-                         break
-
-                if not is_long_press:
-                    # Short press (<10s) -> Open Door
-                    # Debounce check
-                    if self.hal.time_diff(t_press) > 50:
-                        self.pulse_door()
-
-                # Wait for release to avoid re-triggering
-                while self.pin_btn.value() == 0:
-                    self.hal.sleep_ms(100)
-
-            # Ring Pin: Input (normally HIGH, LOW when pressed/active if pullup)
-            # Optocoupler input: If opto closes to GND, then LOW.
-            if self.pin_ring.value() == 0:
-                # Debounce
-                self.hal.sleep_ms(50)
-                if self.pin_ring.value() == 0:
+    async def event_task(self):
+        while True:
+            event = await self.events.get()
+            if event == "RING":
+                if self.led_mode == 1: # Only if wifi connected
+                    await self.ring()
+                else:
                     print("RING Detected")
-                    if self.led_mode == 1: # Only if wifi connected
-                         self.send_ring_event()
-                         self.ring_ts = self.hal.get_time_ms() # Start checking window
-                         self.status_check_ts = self.hal.get_time_ms()
+            elif event == "SETUP":
+                await self.start_ble_provisioning()
 
-                    # Wait for release to avoid multiple triggers
-                    while self.pin_ring.value() == 0:
-                        self.hal.sleep_ms(100)
+    async def ring(self):
+        """
+        Ring pipeline. The notification goes out first, as a pre-encoded POST,
+        and the status window starts with it; parsing the response, time sync
+        and the redraw come after. Stage times go to ring_trace.
+        """
+        self.ring_trace.clear()
+        self._ring_stage("detected")
+        self.ring_ts = self.hal.get_time_ms() # Start checking window
+        self.status_check_ts = self.ring_ts
+        r = await self.hal.send(self.ring_request())
+        self._ring_stage("sent")
+
+        print("RING sent")
+        self.handle_ring_response(r)
+        self._ring_stage("synced")
+        self._trace_display = True
+        print("RING latency (us):", self.ring_trace)
+
+    def _ring_stage(self, name):
+        us = inputs.ticks_diff(inputs.ticks_us(), self.ring_input.t_press)
+        self.ring_trace[name] = us
+        if stats.ENABLED:
+            stats.add("ring_" + name + "_us", us)
+
+    # --- Tasks ---
+
+    async def led_task(self):
+        while True:
+            self.led_update()
+            await aio.sleep_ms(50)
 
-            # Check for open command if within window
-            if self.ring_ts > 0:
-                # Window: 5 mins
-                if self.hal.time_diff(self.ring_ts) > config.STATUS_CHECK_DURATION_S * 1000:
-                    self.ring_ts = 0 # Window expired
+    async def display_task(self):
+        """Draws requested screens and puts the panel to sleep, when the panel is free."""
+        while True:
+            self.display_service()
+            await aio.sleep_ms(50)
 
-                else:
-                    # Check every 10s
-                    if self.hal.time_diff(self.status_check_ts) > config.STATUS_CHECK_INTERVAL_S * 1000:
-                        self.status_check_ts = self.hal.get_time_ms()
-                        print("Checking door status...")
-                        if self.check_open_status():
-                            self.pulse_door()
-                            self.ring_ts = 0 # Stop checking after open
-
-            self.hal.sleep_ms(50)
+    async def input_task(self):
+        """
+        Turns the captured ring and button edges into events. A ring counts
+        from its first edge; a button press opens the door on its first edge,
+        bounces after it are locked out by the Debouncer. Holding it for 10 s
+        also starts BLE provisioning.
+        """
+        edges = self.edges
+        ring = self.ring_input
+        btn = self.btn_input
+        long_press = False
+        while True:
+            edge = edges.pop()
+            while edge is not None:
+                pin_id, level, t_us = edge
+                if pin_id == config.PIN_RING_IN:
+                    if ring.edge(level, t_us) == inputs.PRESS:
+                        self.events.put("RING")
+                elif pin_id == config.PIN_BTN_BOOT:
+                    if btn.edge(level, t_us) == inputs.PRESS:
+                        self.pulse_door(t_us) # The command is the press edge
+                edge = edges.pop()
+
+            now = inputs.ticks_us()
+            ring.poll(now)
+            if btn.pressed and not long_press and btn.held_ms(now) > 10000: # 10 sec hold
+                long_press = True
+                print("Button Hold (10s) -> BLE Provisioning")
+                self.events.put("SETUP")
+            if btn.poll(now) == inputs.RELEASE:
+                long_press = False
+            await aio.sleep_ms(10)
+
+    async def status_task(self):
+        """Checks for the open command while the window after a ring is open."""
+        while True:
+            await aio.sleep_ms(100)
+            if self.ring_ts <= 0:
+                continue
+            # Window: 5 mins
+            if self.hal.time_diff(self.ring_ts) > config.STATUS_CHECK_DURATION_S * 1000:
+                self.ring_ts = 0 # Window expired
+            # Check every 10s
+            elif self.hal.time_diff(self.status_check_ts) > config.STATUS_CHECK_INTERVAL_S * 1000:
+                self.status_check_ts = self.hal.get_time_ms()
+                print("Checking door status...")
+                if await self.check_open_status():
+                    self.pulse_door(self.status_rx_us)
+                    self.ring_ts = 0 # Stop checking after open
+
+    async def ota_task(self):
+        if not await self.ota.check_for_updates():
+            return
+        if await self.ota.update_firmware():
+            # Wait a few seconds before reboot as requested
+            print("[OTA] Update successful. Waiting 5s before reboot...")
+            await aio.sleep_ms(5000)
+            self.hal.reset_device()
 
 
 if __name__ == "__main__":
@@ -9,10 +9,10 @@ class OTAUpdater:
         self.files_to_update = []
         self.on_progress = on_progress
 
-    def check_for_updates(self):
+    async def check_for_updates(self):
         """Checks server for a newer version. Returns True if update available."""
         print(f"[OTA] Checking for updates... (Current: {self.current_version})")
-        response = self.hal.http_get(config.URL_OTA_VERSION)
+        response = await self.hal.http_get(config.URL_OTA_VERSION)
         if not response:
             print("[OTA] Failed to fetch version info")
             return False
@@ -38,7 +38,7 @@ class OTAUpdater:
 
                 # Fetch file list from separate endpoint
                 print(f"[OTA] Fetching file list for version {latest_version}...")
-                response_files = self.hal.http_get(config.URL_OTA_FILES) # Need to add this to config
+                response_files = await self.hal.http_get(config.URL_OTA_FILES) # Need to add this to config
                 if response_files:
                      try:
                          self.files_to_update = response_files.json()
@@ -57,7 +57,7 @@ class OTAUpdater:
 
         return False
 
-    def update_firmware(self):
+    async def update_firmware(self):
         """Downloads files and overwrites them."""
         if not self.new_version or not self.files_to_update:
             print("[OTA] No update to apply")
@@ -82,7 +82,7 @@ class OTAUpdater:
             if self.on_progress:
                 self.on_progress(i + 1, total, False)
 
-            if not self._download_and_save(url, filename):
+            if not await self._download_and_save(url, filename):
                 print(f"[OTA] Failed to download {filename}")
                 success = False
                 break
@@ -96,8 +96,8 @@ class OTAUpdater:
             print("[OTA] Update failed.")
             return False
 
-    def _download_and_save(self, url, filename):
-        response = self.hal.http_get(url)
+    async def _download_and_save(self, url, filename):
+        response = await self.hal.http_get(url)
         if not response:
             return False
 
@@ -110,14 +110,15 @@ class OTAUpdater:
             # For simplicity, we write to root.
 
             # Note: response.text or response.content depends on implementation.
-            # urequests response object has .text and .content
-            content = response.text
-
-            with open(filename, "w") as f:
-                f.write(content)
+            # ahttp response object has .text and .content
+            self._save(filename, response.text)
             return True
         except Exception as e:
             print(f"[OTA] Write error: {e}")
             return False
         finally:
             response.close()
+
+    def _save(self, filename, content):
+        with open(filename, "w") as f:
+            f.write(content)
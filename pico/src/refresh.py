@@ -0,0 +1,53 @@
+# refresh.py
+"""
+E-paper refresh scheduling.
+
+Partial refreshes are fast and flicker-free, but leave ghosting behind that
+builds up over time. The scheduler uses partial refreshes by default and
+asks for a single full refresh only after a number of partials, after some
+time has passed, or when the caller forces one (e.g. on a mode change).
+"""
+
+import config
+
+
+class RefreshScheduler:
+    def __init__(self, hal, max_partials=None, max_age_s=None):
+        self.hal = hal
+        self.max_partials = config.EPD_MAX_PARTIALS if max_partials is None else max_partials
+        self.max_age_s = config.EPD_FULL_REFRESH_S if max_age_s is None else max_age_s
+
+        # Counters
+        self.full_count = 0
+        self.partial_count = 0
+        self.busy_ms = 0 # Total time the panel spent refreshing
+
+        self._partials_since_full = 0
+        self._last_full_ts = None
+        self._start_ts = None
+
+    def needs_full(self, force=False):
+        """Returns True if the next refresh should be a full one."""
+        if force or self._last_full_ts is None:
+            return True
+        if self._partials_since_full >= self.max_partials:
+            return True
+        return self.hal.time_diff(self._last_full_ts) > self.max_age_s * 1000
+
+    def start(self, full):
+        """Records the start of a refresh."""
+        now = self.hal.get_time_ms()
+        self._start_ts = now
+        if full:
+            self.full_count += 1
+            self._partials_since_full = 0
+            self._last_full_ts = now
+        else:
+            self.partial_count += 1
+            self._partials_since_full += 1
+
+    def finish(self, epd=None):
+        """Refresh completion callback (also usable as EPD callback)."""
+        if self._start_ts is not None:
+            self.busy_ms += self.hal.time_diff(self._start_ts)
+            self._start_ts = None
@@ -0,0 +1,84 @@
+# rle.py
+"""
+Run-length encoded 1bpp frames (PackBits).
+
+The data is a sequence of runs, each starting with a header byte h:
+- h < 128: the next h + 1 bytes are copied literally
+- h > 128: the next byte is repeated 257 - h times
+- h == 128: no-op
+
+E-paper frames are mostly white, so a whole screen packs into a few hundred
+bytes. RLEImage streams the decoded bytes through a small scratch buffer,
+so a frame can go to the display RAM without building a framebuffer.
+"""
+
+
+def pack(data):
+    """Encodes bytes with PackBits. Used by the build tools on host."""
+    out = bytearray()
+    n = len(data)
+    i = 0
+    while i < n:
+        # Repeat run
+        j = i + 1
+        while j < n and j - i < 128 and data[j] == data[i]:
+            j += 1
+        if j - i >= 2:
+            out.append(257 - (j - i))
+            out.append(data[i])
+            i = j
+            continue
+
+        # Literal run, up to the next repeat of 2+ bytes
+        j = i + 1
+        while j < n and j - i < 128 and not (j + 1 < n and data[j] == data[j + 1]):
+            j += 1
+        out.append(j - i - 1)
+        out.extend(data[i:j])
+        i = j
+    return bytes(out)
+
+
+class RLEImage:
+    """A PackBits encoded frame, usable as image for the EPD driver."""
+    def __init__(self, data):
+        self.data = data
+
+    def stream(self, write, scratch):
+        """
+        Decodes into scratch (at least 128 bytes) and passes each filled part
+        to write() as a memoryview.
+        """
+        data = self.data
+        src = memoryview(data)
+        out = memoryview(scratch)
+        room = len(scratch)
+        fill = 0
+        i = 0
+        n = len(data)
+        while i < n:
+            h = data[i]
+            i += 1
+            if h == 128:
+                continue
+            count = h + 1 if h < 128 else 257 - h
+            if fill + count > room:
+                write(out[:fill])
+                fill = 0
+            if h < 128:
+                scratch[fill:fill + count] = src[i:i + count]
+                i += count
+            else:
+                value = data[i]
+                i += 1
+                for k in range(fill, fill + count):
+                    scratch[k] = value
+            fill += count
+        if fill:
+            write(out[:fill])
+
+    def decode(self):
+        """Returns the whole decoded frame."""
+        out = bytearray()
+        self.stream(out.extend, bytearray(128))
+        return out
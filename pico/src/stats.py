@@ -0,0 +1,55 @@
+# stats.py
+"""
+Display instrumentation counters.
+
+Counts draw calls, SPI bytes, time spent waiting for the panel and
+refreshes by type, so on-device and host runs can be compared directly.
+
+Disabled by default (config.STATS_ENABLED). Every call site is guarded with
+`if stats.ENABLED:`, so a disabled build only pays for that test; nothing
+is counted, timed or allocated.
+
+    stats.enable()
+    app.display_update()
+    print(stats.snapshot())
+"""
+
+import time
+
+import config
+
+ENABLED = getattr(config, "STATS_ENABLED", False)
+
+_counters = {}
+
+
+def enable(on=True):
+    global ENABLED
+    ENABLED = on
+
+
+def add(name, n=1):
+    _counters[name] = _counters.get(name, 0) + n
+
+
+def snapshot():
+    """Returns a copy of all counters. Durations are in microseconds (*_us)."""
+    return dict(_counters)
+
+
+def reset():
+    _counters.clear()
+
+
+def ticks_us():
+    if hasattr(time, "ticks_us"):
+        return time.ticks_us()
+    return int(time.perf_counter() * 1000000)
+
+
+def add_since(name, t0):
+    """Adds the microseconds since t0 (from ticks_us()) to counter name."""
+    if hasattr(time, "ticks_diff"):
+        add(name, time.ticks_diff(time.ticks_us(), t0))
+    else:
+        add(name, ticks_us() - t0)
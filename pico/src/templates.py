@@ -0,0 +1,47 @@
+# templates.py
+"""
+Static screen templates.
+
+Most of a screen never changes between redraws: header, border, labels and
+instructions. Each template is painted once, on first use, into a frame of
+its own. A redraw then starts by copying the template into the back buffer
+(one slice assignment) and only draws the dynamic fields on top.
+"""
+
+from canvas import Canvas
+
+
+class ScreenTemplates:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.renders = 0 # Number of templates painted so far
+        self._painters = {}
+        self._frames = {} # name -> (rotation, frame)
+
+    def __contains__(self, name):
+        return name in self._painters
+
+    def register(self, name, painter):
+        """Registers painter(canvas), which draws the static content of screen name."""
+        self._painters[name] = painter
+        self._frames.pop(name, None)
+
+    def get(self, name, rotation=0):
+        """Returns the template frame of screen name, painting it if needed."""
+        entry = self._frames.get(name)
+        if entry is not None and entry[0] == rotation:
+            return entry[1]
+
+        # Repaint into the existing frame if only the rotation changed
+        frame = entry[1] if entry is not None else bytearray((self.width >> 3) * self.height)
+        canvas = Canvas(frame, self.width, self.height, rotation)
+        canvas.fill(1)
+        self._painters[name](canvas)
+        self._frames[name] = (rotation, frame)
+        self.renders += 1
+        return frame
+
+    def release(self, name):
+        """Frees the frame of a template that is not needed any more."""
+        self._frames.pop(name, None)
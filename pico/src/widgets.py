@@ -0,0 +1,243 @@
+# widgets.py
+"""
+Retained-mode UI widgets.
+
+A Screen is a declarative list of widgets with bounds (x, y, w, h) in
+upright coordinates. Static widgets are painted once into the screen
+template. Dynamic widgets keep their properties and setting a property to
+a new value marks only that widget dirty. Screen.render() then restores
+just the dirty areas from the template, redraws the widgets there and
+returns the changed rectangles, so only those go to the display.
+
+Widgets must draw inside their own bounds.
+"""
+
+import fonts
+from canvas import rotate180
+from glyphs import blit
+
+
+class Widget:
+    def __init__(self, x, y, w, h):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.visible = True
+        self.dirty = True
+        self._drawn = None # Bounds at the last render
+
+    def bounds(self):
+        return (self.x, self.y, self.w, self.h)
+
+    def dirty_bounds(self):
+        """The area to redraw: the current bounds and those last drawn, if they differ."""
+        b = self.bounds()
+        d = self._drawn
+        if d is None or d == b:
+            return b
+        x = min(b[0], d[0])
+        y = min(b[1], d[1])
+        return (x, y, max(b[0] + b[2], d[0] + d[2]) - x, max(b[1] + b[3], d[1] + d[3]) - y)
+
+    def set_visible(self, visible):
+        if visible != self.visible:
+            self.visible = visible
+            self.dirty = True
+
+    def render(self, canvas):
+        if self.visible:
+            self.draw(canvas)
+        self._drawn = self.bounds()
+        self.dirty = False
+
+    def draw(self, canvas):
+        pass
+
+
+class Label(Widget):
+    """
+    Text in the bitmap font of the given height. w is the widest the text
+    can get; by default the width of the current text, so a shorter text
+    also clears what the previous one covered. With right=True, x is the
+    right edge of the text.
+    """
+    def __init__(self, x, y, text="", size=16, w=None, c=0, right=False):
+        super().__init__(x, y, w, size)
+        self.text = text
+        self.size = size
+        self.c = c
+        self.right = right
+
+    def bounds(self):
+        w = self.w
+        if w is None:
+            w = fonts.get(self.size).measure(self.text)
+        return (self.x - w if self.right else self.x, self.y, w, self.h)
+
+    def set_text(self, text):
+        if text != self.text:
+            self.text = text
+            self.dirty = True
+
+    def draw(self, canvas):
+        font = fonts.get(self.size)
+        x = self.x - font.measure(self.text) if self.right else self.x
+        canvas.write(self.text, x, self.y, font, self.c)
+
+
+class Box(Widget):
+    """Rectangle outline, or filled with fill=True."""
+    def __init__(self, x, y, w, h, fill=False, c=0):
+        super().__init__(x, y, w, h)
+        self.fill = fill
+        self.c = c
+
+    def set_fill(self, fill):
+        if fill != self.fill:
+            self.fill = fill
+            self.dirty = True
+
+    def draw(self, canvas):
+        if self.fill:
+            canvas.fill_rect(self.x, self.y, self.w, self.h, self.c)
+        else:
+            canvas.rect(self.x, self.y, self.w, self.h, self.c)
+
+
+class ProgressBar(Widget):
+    """Outlined bar, filled in proportion to value / total."""
+    def __init__(self, x, y, w, h, value=0, total=1):
+        super().__init__(x, y, w, h)
+        self.value = value
+        self.total = total
+
+    def set_value(self, value, total=None):
+        if total is None:
+            total = self.total
+        if value != self.value or total != self.total:
+            self.value = value
+            self.total = total
+            self.dirty = True
+
+    def draw(self, canvas):
+        canvas.rect(self.x, self.y, self.w, self.h, 0)
+        value = min(max(self.value, 0), self.total)
+        fill = (self.w - 4) * value // self.total if self.total else 0
+        if fill > 0:
+            canvas.fill_rect(self.x + 2, self.y + 2, fill, self.h - 4, 0)
+
+
+class Icon(Widget):
+    """A packed 1bpp bitmap (MONO_HLSB rows, set bit = ink), w x h pixels."""
+    def __init__(self, x, y, bitmap, w, h, c=0):
+        super().__init__(x, y, w, h)
+        self.bitmap = bitmap
+        self.c = c
+        self._rotated = None # Bitmap rotated by 180 degrees, made on first use
+
+    def set_bitmap(self, bitmap):
+        if bitmap is not self.bitmap:
+            self.bitmap = bitmap
+            self._rotated = None
+            self.dirty = True
+
+    def draw(self, canvas):
+        if canvas.rotation == 180:
+            gw = (self.w + 7) & ~7 # Rotated bitmap is padded on the left
+            if self._rotated is None:
+                self._rotated = bytearray(self.bitmap[:(gw >> 3) * self.h])
+                rotate180(self._rotated, gw, self.h)
+            blit(canvas.buf, canvas.width, canvas.height, self._rotated, gw, self.h,
+                 canvas.width - self.x - gw, canvas.height - self.y - self.h, self.c)
+        else:
+            blit(canvas.buf, canvas.width, canvas.height, self.bitmap, self.w, self.h,
+                 self.x, self.y, self.c)
+
+
+def _overlaps(a, b):
+    return (a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and
+            a[1] < b[1] + b[3] and b[1] < a[1] + a[3])
+
+
+def _add_rect(rects, r):
+    """Adds r to a list of disjoint rects, merging overlapping ones into their bounding box."""
+    i = 0
+    while i < len(rects):
+        o = rects[i]
+        if _overlaps(o, r):
+            x = min(o[0], r[0])
+            y = min(o[1], r[1])
+            r = (x, y, max(o[0] + o[2], r[0] + r[2]) - x, max(o[1] + o[3], r[1] + r[3]) - y)
+            rects.pop(i)
+            i = 0 # The grown rect may overlap earlier ones
+        else:
+            i += 1
+    rects.append(r)
+
+
+class Screen:
+    """
+    Static and dynamic widgets of one screen. bind(), if given, copies the
+    current app state into the dynamic widgets (see update()).
+    """
+    def __init__(self, static=(), widgets=(), bind=None):
+        self.static = static
+        self.widgets = widgets
+        self.bind = bind
+
+    def update(self):
+        if self.bind:
+            self.bind()
+
+    def paint_static(self, canvas):
+        """Template painter: draws the static widgets."""
+        for widget in self.static:
+            widget.render(canvas)
+
+    def invalidate(self):
+        """Marks every dynamic widget dirty, e.g. when the frame was replaced."""
+        for widget in self.widgets:
+            widget.dirty = True
+
+    def render(self, canvas, template=None):
+        """
+        Draws the dynamic widgets into canvas.
+
+        Without template, canvas holds a fresh copy of the static content:
+        all widgets are drawn and None is returned (changes unknown).
+
+        With template (the static frame), canvas holds the last frame of
+        this screen. The dirty widget areas (see Widget.dirty_bounds),
+        widened to whole bytes, are restored from the template and every widget there is redrawn.
+        Returns the restored rectangles (upright coordinates, disjoint).
+        """
+        if template is None:
+            for widget in self.widgets:
+                widget.render(canvas)
+            return None
+
+        rects = []
+        for widget in self.widgets:
+            if widget.dirty:
+                x, y, w, h = widget.dirty_bounds()
+                x0 = max(0, x & ~7)
+                x1 = min(canvas.width, (x + w + 7) & ~7)
+                y0 = max(0, y)
+                y1 = min(canvas.height, y + h)
+                if x1 > x0 and y1 > y0:
+                    _add_rect(rects, (x0, y0, x1 - x0, y1 - y0))
+                else:
+                    widget.dirty = False # Off screen
+
+        for r in rects:
+            canvas.restore(template, *r)
+        for widget in self.widgets:
+            if widget.dirty:
+                widget.render(canvas)
+                continue
+            for r in rects:
+                if _overlaps(widget.bounds(), r):
+                    widget.render(canvas)
+                    break
+        return rects
@@ -0,0 +1,68 @@
+# epd_mock.py
+class RecordingSPI:
+    """Records every SPI write together with the DC level (0=command, 1=data)."""
+    def __init__(self, dc):
+        self.dc = dc
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append((self.dc.value(), bytes(data)))
+
+    def commands(self):
+        return [data[0] for dc, data in self.writes if dc == 0]
+
+    def data_after(self, command):
+        """Returns all data bytes sent after each occurrence of command."""
+        chunks = []
+        current = None
+        for dc, data in self.writes:
+            if dc == 0:
+                current = bytearray() if data[0] == command else None
+                if current is not None:
+                    chunks.append(current)
+            elif current is not None:
+                current.extend(data)
+        return [bytes(c) for c in chunks]
+
+
+class RecordingEPD:
+    """Functional stand-in for epaper1in54.EPD that records calls."""
+    def __init__(self, keep_images=True):
+        self.is_functional = True
+        self.keep_images = keep_images
+        self.busy = False # Set to simulate a refresh still running
+        self.calls = []
+        self.profiles = [] # Profile of each partial refresh
+
+    def _image(self, image):
+        if not self.keep_images:
+            return None
+        if hasattr(image, "stream"): # rle.RLEImage
+            return bytes(image.decode())
+        return bytes(image)
+
+    def is_busy(self):
+        return self.busy
+
+    def init(self):
+        self.calls.append(("init",))
+
+    def sleep(self):
+        self.calls.append(("sleep",))
+
+    def clear(self, fast=False):
+        self.calls.append(("clear", fast))
+
+    def display(self, image, rects=None, wait=True, callback=None):
+        self.calls.append(("display", self._image(image), rects))
+        if callback:
+            callback(self)
+
+    def display_partial(self, image, rects=None, wait=True, callback=None, profile=None):
+        self.calls.append(("display_partial", self._image(image), rects))
+        self.profiles.append(profile)
+        if callback:
+            callback(self)
+
+    def names(self):
+        return [c[0] for c in self.calls]
@@ -0,0 +1,143 @@
+# framebuf_scenes.py
+"""
+Drawing scenes for the framebuf golden-image regression tests
+(tests/test_framebuf.py). The goldens in tests/framebuf_golden were
+rendered by the host mock:
+
+    cd tests/framebuf_golden && python ../framebuf_scenes.py
+
+Uses nothing but the framebuf API, so it runs on MicroPython too, e.g. to
+compare the mock with MicroPython's framebuf by hand (unix port, standard
+variant: `micropython ../framebuf_scenes.py`). Each image records the
+implementation that rendered it in its header. text() is left out: the
+host mock has its own font.
+"""
+import sys
+
+import framebuf
+
+WIDTH = 61 # Not a multiple of 8, to cover row padding and clipping
+HEIGHT = 37
+
+
+def scene_rects(fb):
+    fb.fill_rect(-4, -3, 12, 9, 1)
+    fb.fill_rect(55, 30, 20, 20, 1)
+    fb.rect(10, 4, 17, 11, 1)
+    fb.rect(30, 4, 9, 9, 1, True)
+    fb.rect(12, 6, 13, 7, 0, True)
+    fb.hline(-5, 20, 30, 1)
+    fb.vline(44, -2, 50, 1)
+    fb.fill_rect(46, 18, 0, 5, 1) # Empty
+    fb.pixel(60, 36, 1)
+    fb.pixel(61, 36, 1) # Off screen
+
+
+def scene_lines(fb):
+    cx, cy = 30, 18
+    for dx, dy in ((25, 3), (7, 17), (-9, 16), (-26, 5), (-22, -12), (-4, -17), (11, -15), (27, -8)):
+        fb.line(cx, cy, cx + dx, cy + dy, 1)
+    fb.line(-10, 36, 70, 30, 1)
+    fb.line(5, 2, 5, 2, 1)
+    fb.line(58, 0, 48, 0, 1)
+
+
+def scene_ellipses(fb):
+    fb.ellipse(14, 12, 12, 8, 1)
+    fb.ellipse(40, 12, 6, 10, 1, True)
+    fb.ellipse(14, 30, 9, 5, 1, True, 0b0101)
+    fb.ellipse(40, 30, 10, 4, 1, False, 0b1010)
+    fb.ellipse(58, 2, 7, 7, 1, True) # Clipped
+    fb.ellipse(55, 30, 0, 0, 1)
+    fb.ellipse(52, 20, 0, 6, 1)
+
+
+def scene_polys(fb):
+    tri = bytearray((0, 0, 15, 4, 4, 14))
+    fb.poly(2, 2, tri, 1)
+    fb.poly(20, 2, tri, 1, True)
+    star = bytearray((10, 0, 13, 7, 20, 7, 14, 11, 17, 18, 10, 14, 3, 18, 6, 11, 0, 7, 7, 7))
+    fb.poly(38, 1, star, 1, True)
+    fb.poly(2, 18, star, 1)
+    square = bytearray((0, 0, 10, 0, 10, 10, 0, 10))
+    fb.poly(25, 22, square, 1, True)
+    fb.poly(55, 30, square, 1, True) # Clipped
+
+
+def _sprite():
+    buf = bytearray(3 * 8) # 20x8 MONO_HLSB, stride 24
+    sprite = framebuf.FrameBuffer(buf, 20, 8, framebuf.MONO_HLSB)
+    sprite.rect(0, 0, 20, 8, 1)
+    sprite.line(0, 0, 19, 7, 1)
+    sprite.fill_rect(3, 5, 4, 2, 1)
+    return buf, sprite
+
+
+def scene_blit(fb):
+    buf, sprite = _sprite()
+    fb.fill_rect(0, 0, 61, 12, 1)
+    fb.blit(sprite, 2, 2, 1) # Copy only the 0 pixels
+    fb.blit(sprite, 30, 16)
+    fb.blit(sprite, -6, 26)
+    fb.blit(sprite, 50, 32)
+    pal = framebuf.FrameBuffer(bytearray(1), 2, 1, framebuf.MONO_HLSB)
+    pal.pixel(0, 0, 1) # Invert
+    fb.blit(sprite, 30, 26, -1, pal)
+    fb.blit((buf, 20, 8, framebuf.MONO_HLSB), 38, 2, 0)
+
+
+def scene_scroll(fb):
+    for i in range(0, 61, 6):
+        fb.vline(i, 0, 37, 1)
+    fb.fill_rect(10, 10, 20, 10, 1)
+    fb.ellipse(45, 25, 8, 6, 0, True)
+    fb.scroll(3, -2)
+    fb.scroll(-7, 5)
+    fb.scroll(61, 0) # No-op
+
+
+SCENES = {
+    "rects": scene_rects,
+    "lines": scene_lines,
+    "ellipses": scene_ellipses,
+    "polys": scene_polys,
+    "blit": scene_blit,
+    "scroll": scene_scroll,
+}
+
+FORMATS = {
+    "MONO_VLSB": (framebuf.MONO_VLSB, ((HEIGHT + 7) // 8) * WIDTH),
+    "MONO_HLSB": (framebuf.MONO_HLSB, ((WIDTH + 7) // 8) * HEIGHT),
+    "MONO_HMSB": (framebuf.MONO_HMSB, ((WIDTH + 7) // 8) * HEIGHT),
+}
+
+
+def render(name, fmt=framebuf.MONO_HLSB, size=((WIDTH + 7) // 8) * HEIGHT):
+    fb = framebuf.FrameBuffer(bytearray(size), WIDTH, HEIGHT, fmt)
+    fb.fill(0)
+    SCENES[name](fb)
+    return fb
+
+
+def source():
+    """The Python implementation running the scenes, e.g. "micropython 1.23.0"."""
+    impl = sys.implementation
+    return impl.name + " " + ".".join(str(v) for v in impl.version[:3])
+
+
+def to_pbm(fb):
+    """Plain PBM (P1) text, 1 = set pixel."""
+    lines = ["P1", "# " + source(), f"{WIDTH} {HEIGHT}"]
+    for y in range(HEIGHT):
+        lines.append("".join("1" if fb.pixel(x, y) else "0" for x in range(WIDTH)))
+    return "\n".join(lines) + "\n"
+
+
+def main(path=""):
+    for name in SCENES:
+        with open(path + name + ".pbm", "w") as f:
+            f.write(to_pbm(render(name)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# tests/test_ahttp.py
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import ahttp
+import aio
+import hal
+
+
+class SlowServer:
+    """Local HTTP server that answers after delay_ms, or never if delay_ms is None."""
+    def __init__(self, delay_ms, body=b'{"open": true}'):
+        self.delay_ms = delay_ms
+        self.body = body
+        self.requests = []
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def handle(self, reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in head.split(b"\r\n"):
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        self.requests.append((head.split(b"\r\n")[0], await reader.readexactly(length)))
+        if self.delay_ms is None:
+            await asyncio.sleep(60)
+        await aio.sleep_ms(self.delay_ms)
+        writer.write(f"HTTP/1.0 200 OK\r\nContent-Length: {len(self.body)}\r\n\r\n".encode() + self.body)
+        await writer.drain()
+        writer.close()
+
+    def close(self):
+        self.server.close()
+
+
+class TestAsyncHTTP(unittest.TestCase):
+    def test_split_url(self):
+        self.assertEqual(ahttp.split_url("https://picobell.no/doorbell/ring"),
+                         ("picobell.no", 443, "/doorbell/ring", True))
+        self.assertEqual(ahttp.split_url("http://192.168.1.10:8080"),
+                         ("192.168.1.10", 8080, "/", False))
+
+    def test_slow_server_does_not_stall_other_tasks(self):
+        ticks = []
+        server = SlowServer(200)
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await aio.sleep_ms(10)
+
+        async def scenario():
+            url = await server.start()
+            task = aio.create_task(ticker())
+            try:
+                r = await ahttp.request("POST", url + "/doorbell/status",
+                                        {"Content-Type": "application/json"}, b"{}")
+            finally:
+                task.cancel()
+                server.close()
+            return r
+
+        r = aio.run(scenario())
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json(), {"open": True})
+        self.assertEqual(server.requests, [(b"POST /doorbell/status HTTP/1.0", b"{}")])
+        self.assertGreater(len(ticks), 10) # Ran while the request was in flight
+
+    def test_timeout(self):
+        server = SlowServer(None)
+
+        async def scenario():
+            url = await server.start()
+            try:
+                await ahttp.request("GET", url, timeout_ms=50)
+            finally:
+                server.close()
+
+        with self.assertRaises(aio.TimeoutError):
+            aio.run(scenario())
+
+    @mock.patch.object(hal.config, "API_KEY", "1234abcd")
+    def test_prepare_post_headers_are_not_shared(self):
+        h = hal.HardwareAbstractionLayer()
+        _, headers, _ = h.prepare_post("http://x/a", None, {"X-Test": "1"})
+        _, defaults, body = h.prepare_post("http://x/b")
+        self.assertEqual(headers["X-Test"], "1")
+        self.assertNotIn("X-Test", defaults)
+        self.assertIsNot(defaults, h.prepare_post("http://x/b")[1])
+        self.assertEqual(body, b"{}")
+
+    def test_hal_device_path_returns_none_on_timeout(self):
+        server = SlowServer(None)
+        h = hal.HardwareAbstractionLayer()
+
+        async def scenario():
+            url = await server.start()
+            try:
+                with mock.patch.object(hal, "IS_MICROPYTHON", True), \
+                        mock.patch.object(hal.config, "HTTP_TIMEOUT_MS", 50):
+                    return await h.send((url, {}, b"{}"))
+            finally:
+                server.close()
+
+        self.assertIsNone(aio.run(scenario()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/test_canvas.py
+import os
+import sys
+import unittest
+
+# Add src and the host framebuf mock to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools/lib')))
+
+import framebuf
+
+import fonts
+from canvas import BIT_REVERSE, Canvas, dirty_rects, rotate180
+
+WIDTH, HEIGHT = 200, 200
+
+
+def draw_sample(fb):
+    fb.fill(1)
+    fb.rect(2, 2, 196, 196, 0)
+    fb.fill_rect(10, 140, 37, 11, 0)
+    fb.write("PICOBELL", 10, 15, fonts.get(24))
+    fb.write("LAST CALL:", 10, 130, fonts.get(16))
+    fb.write("v0.0.11", 141, 185, fonts.get(8))
+    fb.pixel(199, 0, 0)
+
+
+class TestRotation(unittest.TestCase):
+    def test_bit_reverse_table(self):
+        self.assertEqual(BIT_REVERSE[0x01], 0x80)
+        self.assertEqual(BIT_REVERSE[0xF0], 0x0F)
+        self.assertEqual(BIT_REVERSE[0b10110000], 0b00001101)
+
+    def test_rotate180_matches_per_pixel_rotation(self):
+        buf = bytearray(WIDTH * HEIGHT // 8)
+        draw_sample(Canvas(buf, WIDTH, HEIGHT))
+
+        ref = bytearray(len(buf))
+        src_fb = framebuf.FrameBuffer(buf, WIDTH, HEIGHT, framebuf.MONO_HLSB)
+        dst_fb = framebuf.FrameBuffer(ref, WIDTH, HEIGHT, framebuf.MONO_HLSB)
+        for y in range(HEIGHT):
+            for x in range(WIDTH):
+                dst_fb.pixel(WIDTH - 1 - x, HEIGHT - 1 - y, src_fb.pixel(x, y))
+
+        rotate180(buf, WIDTH, HEIGHT)
+        self.assertEqual(buf, ref)
+
+    def test_rotate180_twice_is_identity(self):
+        buf = bytearray(range(256)) * 2
+        orig = bytearray(buf)
+        rotate180(buf, 64, 64)
+        self.assertNotEqual(buf, orig)
+        rotate180(buf, 64, 64)
+        self.assertEqual(buf, orig)
+
+    def test_rotated_canvas_matches_rotating_afterwards(self):
+        upright = bytearray(WIDTH * HEIGHT // 8)
+        draw_sample(Canvas(upright, WIDTH, HEIGHT))
+        rotate180(upright, WIDTH, HEIGHT)
+
+        direct = bytearray(WIDTH * HEIGHT // 8)
+        canvas = Canvas(direct, WIDTH, HEIGHT, rotation=180)
+        draw_sample(canvas)
+        self.assertEqual(direct, upright)
+        self.assertEqual(canvas.pixel(199, 0), 0)
+
+
+class TestDirtyRects(unittest.TestCase):
+    def test_identical_frames_have_no_dirty_rects(self):
+        buf = bytearray(b"\xff" * 5000)
+        self.assertEqual(dirty_rects(buf, bytearray(buf), WIDTH, HEIGHT), [])
+
+    def test_single_change_is_byte_aligned(self):
+        old = bytearray(b"\xff" * 5000)
+        new = bytearray(old)
+        Canvas(new, WIDTH, HEIGHT).pixel(13, 7, 0)
+        self.assertEqual(dirty_rects(new, old, WIDTH, HEIGHT), [(8, 7, 8, 1)])
+
+    def test_separate_bands(self):
+        old = bytearray(5000)
+        draw_sample(Canvas(old, WIDTH, HEIGHT))
+        new = bytearray(old)
+        canvas = Canvas(new, WIDTH, HEIGHT)
+        canvas.fill_rect(20, 40, 30, 5, 0)
+        canvas.fill_rect(100, 100, 2, 20, 0)
+
+        rects = dirty_rects(new, old, WIDTH, HEIGHT)
+        self.assertEqual(rects, [(16, 40, 40, 5), (96, 100, 8, 20)])
+
+        # Copying just the rects over the old frame reproduces the new one
+        for x, y, w, h in rects:
+            for row in range(y, y + h):
+                start = row * 25 + x // 8
+                old[start:start + w // 8] = new[start:start + w // 8]
+        self.assertEqual(old, new)
+
+
+if __name__ == '__main__':
+    unittest.main()
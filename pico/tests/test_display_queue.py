@@ -0,0 +1,170 @@
+# tests/test_display_queue.py
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# Add tests to path for mocks
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from epd_mock import RecordingEPD
+
+import aio
+import config
+import hal
+from display_queue import DisplayQueue
+from main import DoorbellApp
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000
+
+    def get_time_ms(self):
+        return self.now
+
+    def time_diff(self, t_start):
+        return self.now - t_start
+
+
+class SkewClock:
+    """The hal clock, plus a skew tests can move forward."""
+    def __init__(self, hal):
+        self.hal = hal
+        self.skew = 0
+
+    def get_time_ms(self):
+        return self.hal.get_time_ms() + self.skew
+
+    def time_diff(self, t_start):
+        return self.hal.time_diff(t_start) + self.skew
+
+
+class TestDisplayQueue(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.q = DisplayQueue(self.clock, min_dwell_ms=1000, size=4)
+
+    def test_single_request(self):
+        self.q.post("LISTEN")
+        self.assertEqual(self.q.next(), "LISTEN")
+        self.assertIsNone(self.q.next())
+        self.assertEqual(self.q.collapsed, 0)
+
+    def test_only_the_last_due_request_is_drawn(self):
+        for mode in ("OPEN", "LISTEN", "OPEN", "LISTEN"):
+            self.q.post(mode)
+        self.assertEqual(self.q.next(), "LISTEN")
+        self.assertEqual(self.q.collapsed, 3)
+        self.assertEqual(len(self.q), 0)
+
+    def test_short_dwell_is_skipped(self):
+        self.q.post("OPEN")
+        self.q.post("LISTEN", 300)
+        self.assertIsNone(self.q.next()) # OPEN would show for 300 ms only
+        self.assertEqual(self.q.collapsed, 1)
+        self.clock.now += 299
+        self.assertIsNone(self.q.next())
+        self.clock.now += 1
+        self.assertEqual(self.q.next(), "LISTEN")
+
+    def test_long_dwell_is_drawn(self):
+        self.q.post("OPEN")
+        self.q.post("LISTEN", 3000)
+        self.assertEqual(self.q.next(), "OPEN")
+        self.clock.now += 3000
+        self.assertEqual(self.q.next(), "LISTEN")
+        self.assertEqual(self.q.collapsed, 0)
+
+    def test_held_request_is_shown_for_the_dwell_time(self):
+        self.q.post("OPEN", hold=True)
+        self.q.post("LISTEN", 300)
+        self.clock.now += 500 # Panel was busy: LISTEN is due already
+        self.q.post("LISTEN")
+        self.assertEqual(self.q.next(), "OPEN")
+        self.clock.now += 999
+        self.assertIsNone(self.q.next())
+        self.clock.now += 1
+        self.assertEqual(self.q.next(), "LISTEN")
+        self.assertEqual(self.q.collapsed, 1)
+
+    def test_full_queue_drops_oldest(self):
+        for i in range(5):
+            self.q.post(f"M{i}", i)
+        self.assertEqual(len(self.q), 4)
+        self.assertEqual(self.q.last(), "M4")
+        self.clock.now += 10
+        self.assertEqual(self.q.next(), "M4")
+        self.assertEqual(self.q.collapsed, 4)
+
+
+class TestRingOpenCycle(unittest.TestCase):
+    def setUp(self):
+        self._api_key = config.API_KEY
+        config.API_KEY = "1234abcd"
+        self.hal = hal.HardwareAbstractionLayer()
+        self.epd = RecordingEPD()
+        self.hal._epd = self.epd
+        self.hal.send = self.send
+        self.app = DoorbellApp(self.hal)
+        self.clock = SkewClock(self.hal)
+        self.app.display_queue.hal = self.clock
+        self.app.app_mode = "LISTEN"
+        self.app.display_update()
+        del self.epd.calls[:]
+
+    async def send(self, request):
+        return hal.MockResponse(200, {"display_time": "JAN 10 14:30"})
+
+    def tearDown(self):
+        config.API_KEY = self._api_key
+
+    def settle(self):
+        """Runs the display service until the queue is empty, 50 ms of queue time per step. Returns the screens shown and when."""
+        shown = []
+        while not self.app.display_idle():
+            self.app.display_service()
+            if not shown or shown[-1][0] != self.app.app_mode:
+                shown.append((self.app.app_mode, self.clock.get_time_ms()))
+            self.hal.sleep_ms(5)
+            self.clock.skew += 50
+        return shown
+
+    def refreshes(self):
+        return [n for n in self.epd.names() if n.startswith("display")]
+
+    def test_open_is_shown_for_the_dwell_time(self):
+        # Default configuration: the pulse is much shorter than the dwell time
+        self.assertLess(config.DOOR_PULSE_S * 1000, config.DISPLAY_MIN_DWELL_MS)
+        self.app.pulse_door()
+        shown = self.settle()
+        self.assertEqual([mode for mode, t in shown], ["OPEN", "LISTEN"])
+        self.assertGreaterEqual(shown[1][1] - shown[0][1], config.DISPLAY_MIN_DWELL_MS)
+        self.assertEqual(len(self.refreshes()), 2)
+
+    def test_ring_then_open_folds_ring_redraw_into_open(self):
+        self.epd.busy = True # Previous refresh still running
+        aio.run(self.app.send_ring_event())
+        self.app.pulse_door()
+        self.epd.busy = False
+        self.assertEqual([mode for mode, t in self.settle()], ["OPEN", "LISTEN"])
+        self.assertEqual(len(self.refreshes()), 2) # No LISTEN in between for the ring
+        self.assertEqual(self.app.last_call_str, "JAN 10 14:30")
+
+    def test_sync_during_open_does_not_cut_it_short(self):
+        self.app.pulse_door()
+        self.app.display_service() # OPEN drawn
+        self.app.handle_ring_response(None) # Late ring redraw
+        self.assertEqual([mode for mode, t in self.settle()], ["OPEN", "LISTEN"])
+        self.assertEqual(len(self.refreshes()), 2)
+
+    def test_dwell_zero_shows_open(self):
+        self.app.display_queue.min_dwell_ms = 0
+        self.app.pulse_door()
+        self.settle()
+        self.assertEqual(len(self.refreshes()), 2) # OPEN, then LISTEN
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,249 @@
+# tests/test_epaper.py
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# Add tests to path for mocks
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from epd_mock import RecordingSPI
+
+import epaper1in54
+import hal
+
+
+def make_epd(busy=None):
+    dc = hal.MockPin("dc", 0)
+    spi = RecordingSPI(dc)
+    busy = busy or hal.MockPin("busy", 0)
+    cs = hal.MockPin("cs", 1)
+    # Count CS transactions
+    spi.transactions = 0
+    def on_cs(pin):
+        spi.transactions += 1
+    cs.irq(handler=on_cs, trigger=cs.IRQ_FALLING)
+    epd = epaper1in54.EPD(spi, cs, dc, hal.MockPin("rst", 1), busy)
+    return epd, spi
+
+
+class NoSleepTestCase(unittest.TestCase):
+    """Skips the driver's busy-wait sleeps."""
+    def setUp(self):
+        self._sleep = epaper1in54.time.sleep
+        epaper1in54.time.sleep = lambda s: None
+
+    def tearDown(self):
+        epaper1in54.time.sleep = self._sleep
+
+
+class PollOnlyPin:
+    """Input pin without IRQ support."""
+    def __init__(self, value=0):
+        self._value = value
+
+    def value(self, val=None):
+        if val is not None:
+            self._value = val
+        return self._value
+
+
+class TestEPDWindowedWrites(NoSleepTestCase):
+    def test_full_write_without_rects(self):
+        epd, spi = make_epd()
+        image = bytes(range(200)) * 25
+        epd.display_partial(image)
+        self.assertEqual(spi.data_after(0x24), [image])
+
+    def test_windowed_write_sends_only_rect(self):
+        epd, spi = make_epd()
+        image = bytearray(5000)
+        for i in range(len(image)):
+            image[i] = i & 0xFF
+
+        epd.display_partial(image, [(16, 10, 24, 3)])
+
+        # Window 16..39 px -> bytes 2..4, rows 10..12, then restored to full screen
+        self.assertEqual(spi.data_after(0x44), [bytes([2, 4]), bytes([0, 24])])
+        self.assertEqual(spi.data_after(0x45), [bytes([10, 0, 12, 0]), bytes([0, 0, 199, 0])])
+        # Rect address, then the whole previous-image bank after the refresh
+        self.assertEqual(spi.data_after(0x4E), [bytes([2]), bytes([0])])
+        self.assertEqual(spi.data_after(0x4F), [bytes([10, 0]), bytes([0, 0])])
+
+        expected = b"".join(bytes(image[y*25 + 2:y*25 + 5]) for y in range(10, 13))
+        self.assertEqual(spi.data_after(0x24), [expected])
+        commands = spi.commands()
+        self.assertLess(commands.index(0x24), commands.index(0x20))
+
+
+class TestEPDPreviousBank(NoSleepTestCase):
+    def test_first_refresh_syncs_whole_bank(self):
+        epd, spi = make_epd()
+        image = bytes(range(200)) * 25
+        epd.display_partial(image, [(16, 10, 24, 3)])
+        # Bank content was unknown, so all of it is written after the refresh
+        self.assertEqual(spi.data_after(0x26), [image])
+        commands = spi.commands()
+        self.assertLess(commands.index(0x20), commands.index(0x26))
+
+    def test_dirty_region_synced_after_refresh(self):
+        epd, spi = make_epd()
+        image = bytearray(5000)
+        epd.display(image)
+        for i in range(len(image)):
+            image[i] = i & 0xFF
+        epd.display_partial(image, [(16, 10, 24, 3)])
+
+        expected = b"".join(bytes(image[y*25 + 2:y*25 + 5]) for y in range(10, 13))
+        self.assertEqual(spi.data_after(0x26), [bytes(5000), expected])
+        self.assertEqual(spi.data_after(0x24)[-1], expected)
+
+    def test_async_sync_waits_for_refresh(self):
+        busy = hal.MockPin("busy", 0)
+        epd, spi = make_epd(busy)
+        epd.display_partial(bytearray(5000), wait=False)
+        busy.value(1)
+        self.assertTrue(epd.is_busy())
+        busy.value(0) # IRQ handler must not touch the bus
+        self.assertEqual(spi.data_after(0x26), [])
+
+        self.assertFalse(epd.is_busy())
+        self.assertEqual(spi.data_after(0x26), [bytes(5000)])
+
+    def test_clear_fills_previous_bank(self):
+        epd, spi = make_epd()
+        epd.clear()
+        image = bytearray(b"\xff" * 5000)
+        image[0] = 0
+        epd.display_partial(image, [(0, 0, 8, 1)])
+        self.assertEqual(spi.data_after(0x26)[-1], b"\x00")
+
+
+class TestEPDTransport(NoSleepTestCase):
+    def test_init_sequence(self):
+        epd, spi = make_epd()
+        epd.init()
+        self.assertEqual(spi.commands(), [0x12, 0x01, 0x11, 0x44, 0x45, 0x3C, 0x18, 0x4E, 0x4F])
+        self.assertEqual(spi.data_after(0x01), [bytes([0xC7, 0x00, 0x00])])
+        self.assertEqual(spi.data_after(0x45), [bytes([0x00, 0x00, 0xC7, 0x00])])
+        self.assertEqual(spi.data_after(0x18), [bytes([0x80])])
+        # Soft reset plus one transaction for the whole table
+        self.assertEqual(spi.transactions, 2)
+
+    def test_refresh_is_one_transaction(self):
+        epd, spi = make_epd()
+        epd._refresh(0xF7)
+        self.assertEqual(spi.commands(), [0x22, 0x20])
+        self.assertEqual(spi.data_after(0x22), [bytes([0xF7])])
+        self.assertEqual(spi.transactions, 1)
+
+    def test_clear_streams_each_bank_in_one_transaction(self):
+        epd, spi = make_epd()
+        epd._write_ram_all(0xFF)
+        self.assertEqual(spi.data_after(0x24), [b"\xff" * 5000])
+        self.assertEqual(spi.data_after(0x26), [b"\xff" * 5000])
+        # Address + bank data, twice
+        self.assertEqual(spi.transactions, 4)
+
+
+class TestEPDProfiles(NoSleepTestCase):
+    def test_fast_partial_uploads_lut_once(self):
+        epd, spi = make_epd()
+        image = bytearray(5000)
+        epd.display_partial(image, profile="fast-partial")
+        epd.display_partial(image, profile="fast-partial")
+
+        luts = spi.data_after(0x32)
+        self.assertEqual(luts, [epaper1in54.LUT_PARTIAL[:153]])
+        self.assertEqual(spi.data_after(0x04), [epaper1in54.LUT_PARTIAL[155:158]])
+        self.assertEqual(spi.data_after(0x2C), [epaper1in54.LUT_PARTIAL[158:159]])
+        self.assertEqual(spi.data_after(0x22), [bytes([0xCF])] * 2)
+
+    def test_full_refresh_restores_otp_waveform(self):
+        epd, spi = make_epd()
+        image = bytearray(5000)
+        epd.display_partial(image, profile="fast-partial")
+        epd.display(image)
+        self.assertIsNone(epd.lut_loaded)
+        self.assertEqual(spi.data_after(0x22)[-1], bytes([0xF7]))
+        self.assertEqual(spi.data_after(0x3C)[-1], bytes([0x01]))
+
+        epd.display_partial(image, profile="fast-partial")
+        self.assertEqual(len(spi.data_after(0x32)), 2)
+
+    def test_low_temp_profile_has_longer_drive_phase(self):
+        fast = epaper1in54.LUT_PARTIAL
+        slow = epaper1in54.LUT_PARTIAL_LOW_TEMP
+        self.assertEqual(len(slow), len(fast))
+        self.assertGreater(slow[60], fast[60])
+
+
+class TestEPDAsyncRefresh(NoSleepTestCase):
+    def test_busy_falling_edge_completes_refresh(self):
+        busy = hal.MockPin("busy", 0)
+        epd, _ = make_epd(busy)
+        done = []
+
+        epd.display_partial(bytearray(5000), wait=False, callback=done.append)
+        busy.value(1) # Controller starts the refresh
+        self.assertTrue(epd.is_busy())
+        self.assertEqual(done, [])
+
+        busy.value(0) # ...and finishes it
+        self.assertFalse(epd.is_busy())
+        self.assertEqual(done, [epd])
+
+    def test_stale_edge_does_not_complete_refresh(self):
+        busy = hal.MockPin("busy", 0)
+        epd, _ = make_epd(busy)
+        done = []
+
+        epd.display_partial(bytearray(5000), wait=False, callback=done.append)
+        epd._busy_edge(busy) # Late falling edge of an earlier operation
+        self.assertTrue(epd.is_busy())
+        self.assertEqual(done, [])
+
+        busy.value(1)
+        busy.value(0)
+        self.assertEqual(done, [epd])
+
+    def test_edges_before_activation_are_ignored(self):
+        busy = hal.MockPin("busy", 0)
+        epd, _ = make_epd(busy)
+        done = []
+        # Controller raises and drops BUSY while the sequence is sent
+        epd.transport.sequence = lambda seq: (busy.value(1), busy.value(0))
+
+        epd.display_partial(bytearray(5000), wait=False, callback=done.append)
+        self.assertTrue(epd.refreshing)
+        busy.value(1)
+        busy.value(0)
+        self.assertEqual(done, [epd])
+
+    def test_next_push_waits_for_running_refresh(self):
+        busy = hal.MockPin("busy", 0)
+        epd, spi = make_epd(busy)
+        epd.display(bytearray(5000), wait=False)
+        busy.value(1)
+
+        # Controller finishes while the driver sleeps in wait_refresh()
+        epaper1in54.time.sleep = lambda s: busy.value(0)
+        writes = len(spi.writes)
+        epd.display_partial(bytearray(5000), wait=False)
+        self.assertGreater(len(spi.writes), writes)
+        self.assertTrue(epd.refreshing)
+
+    def test_polls_pin_without_irq(self):
+        busy = PollOnlyPin()
+        epd, _ = make_epd(busy)
+        epd.display_partial(bytearray(5000), wait=False)
+        busy.value(1)
+        epd._refresh_t0 -= 200
+        self.assertTrue(epd.is_busy())
+        busy.value(0)
+        self.assertFalse(epd.is_busy())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+# tests/test_epd_emulator.py
+import os
+import sys
+import time
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import ssd1681
+
+import aio
+import config
+import epaper1in54
+import hal
+from main import DoorbellApp
+
+
+def make_epd(time_scale=0.001, read=False):
+    emu = ssd1681.SSD1681(time_scale=time_scale)
+    return epaper1in54.EPD(*emu.pins(), read=emu.read if read else None), emu
+
+
+class TestSSD1681Emulator(unittest.TestCase):
+    def setUp(self):
+        self._sleep = epaper1in54.time.sleep
+        epaper1in54.time.sleep = lambda s: None
+
+    def tearDown(self):
+        epaper1in54.time.sleep = self._sleep
+
+    def test_full_refresh_shows_image(self):
+        epd, emu = make_epd()
+        epd.init()
+        image = bytes(range(200)) * 25
+        epd.display(image)
+
+        self.assertEqual(bytes(emu.panel), image)
+        # Previous-image bank synced by the driver after the refresh
+        self.assertEqual(bytes(emu.ram[0x26]), image)
+        self.assertEqual(emu.refreshes["full"], 1)
+        self.assertEqual(emu.errors, [])
+
+    def test_windowed_write_lands_in_rect(self):
+        epd, emu = make_epd()
+        epd.init()
+        epd.display(bytes(b"\xff" * 5000))
+        image = bytearray(b"\xff" * 5000)
+        for y in range(10, 13):
+            image[y * 25 + 2:y * 25 + 5] = b"\x00\x0f\xf0"
+
+        epd.display_partial(image, [(16, 10, 24, 3)])
+
+        self.assertEqual(bytes(emu.panel), bytes(image))
+        self.assertEqual(emu.window, (0, 24, 0, 199)) # Restored afterwards
+        self.assertEqual(emu.errors, [])
+
+    def test_stale_previous_bank_leaves_stale_pixels(self):
+        epd, emu = make_epd()
+        epd.init()
+        epd.display(bytes(5000)) # Black, 0x26 synced
+        emu.ram[0x26][:] = b"\xff" * 5000 # Pretend the sync was skipped
+
+        white = bytes(b"\xff" * 5000)
+        epd.display_partial(white)
+
+        # Mode 2 sees no difference between the banks, so nothing is driven
+        self.assertEqual(bytes(emu.panel), bytes(5000))
+
+    def test_busy_durations(self):
+        epd, emu = make_epd()
+        epd.init()
+        image = bytes(b"\xff" * 5000)
+        epd.display(image)
+        epd.display_partial(image, profile="fast-partial")
+        epd.display_partial(image, profile="low-temp")
+        epd.display_partial(image)
+
+        refreshes = [(op, ms) for t, op, ms in emu.log if op in ("full", "partial", "lut")]
+        fast = ssd1681.BUSY_MS["lut_overhead"] + 17 * ssd1681.BUSY_MS["lut_frame"]
+        self.assertEqual(refreshes[0], ("full", ssd1681.BUSY_MS["full"]))
+        self.assertEqual(refreshes[1], ("lut", fast))
+        self.assertGreater(refreshes[2][1], fast) # Longer drive phase in the cold
+        self.assertEqual(refreshes[3], ("partial", ssd1681.BUSY_MS["partial"]))
+
+    def test_busy_pin_irq_completes_async_refresh(self):
+        epd, emu = make_epd(time_scale=0.01) # Full refresh: 20 ms
+        epd.init()
+        done = []
+        epd.display(bytes(5000), wait=False, callback=done.append)
+        self.assertTrue(epd.is_busy())
+        self.assertEqual(emu.busy.value(), 1)
+
+        t0 = time.monotonic()
+        while epd.is_busy() and time.monotonic() - t0 < 1:
+            pass
+        self.assertEqual(done, [epd])
+        self.assertEqual(bytes(emu.ram[0x26]), bytes(5000))
+        self.assertEqual(emu.errors, [])
+
+    def test_commands_in_deep_sleep_are_reported(self):
+        epd, emu = make_epd()
+        epd.init()
+        epd.sleep()
+        epd.display(bytes(5000))
+        self.assertTrue(emu.errors)
+        self.assertTrue(all("deep sleep" in e for e in emu.errors))
+
+        emu.errors.clear()
+        epd.init() # Hardware reset wakes the controller
+        epd.display(bytes(5000))
+        self.assertEqual(emu.errors, [])
+        self.assertEqual(bytes(emu.panel), bytes(5000))
+
+
+    def test_reads_panel_temperature(self):
+        epd, emu = make_epd(read=True)
+        epd.init()
+        emu.temperature = -3.5
+        self.assertEqual(epd.read_temperature(), -3.5)
+        emu.temperature = 21.25
+        self.assertEqual(epd.read_temperature(), 21.25)
+        epd.sleep()
+        self.assertIsNone(epd.read_temperature()) # Deep sleep: no SPI traffic
+        self.assertEqual(emu.errors, [])
+
+        epd, emu = make_epd() # Board cannot read back
+        epd.init()
+        self.assertIsNone(epd.read_temperature())
+
+
+class TestEmulatedScenarios(unittest.TestCase):
+    def setUp(self):
+        self._sleep = epaper1in54.time.sleep
+        epaper1in54.time.sleep = lambda s: None
+        self.hal = hal.HardwareAbstractionLayer()
+        self.epd = self.hal.get_epd()
+        self.emu = self.hal.epd_emulator
+        self.emu.time_scale = 0.001
+        self.app = DoorbellApp(self.hal)
+        self.app.wifi_creds = {"ssid": "test", "pwd": "test"}
+        self.app.app_mode = "LISTEN"
+        config.API_KEY = "1234abcd"
+
+    def tearDown(self):
+        epaper1in54.time.sleep = self._sleep
+
+    def test_host_hal_uses_emulated_display(self):
+        self.assertTrue(self.epd.is_functional)
+        self.app.display_update()
+        self.emu.wait_idle()
+        self.epd.wait_refresh()
+        self.assertEqual(bytes(self.emu.panel), bytes(self.app.fb_pool.front.buf))
+
+    def test_cold_panel_uses_low_temp_profile(self):
+        self.emu.temperature = 2 # Measured at the first wake-up
+        self.app.display_update()
+        self.app.last_call_str = "JAN 10 14:30"
+        self.app.display_update()
+        self.assertEqual(self.epd.lut_loaded, "low-temp") # Measured by the panel
+        self.emu.wait_idle()
+        self.epd.wait_refresh()
+        self.assertEqual(self.emu.errors, [])
+
+    def test_ring_display_door(self):
+        self.app.display_update()
+        aio.run(self.app.send_ring_event())
+        self.app.pulse_door()
+        self.assertEqual(self.app.pin_door.value(), 1) # Relay first
+        self.assertLess(self.app.door_latency_us, 50000)
+        while not self.app.display_idle():
+            self.app.display_service()
+            time.sleep(0.002)
+
+        self.assertEqual(self.emu.errors, [])
+        # Panel shows LISTEN again, and went to sleep
+        self.assertEqual(bytes(self.emu.panel), bytes(self.app.fb_pool.front.buf))
+        self.assertTrue(self.emu.asleep)
+        busy = sum(ms for t, op, ms in self.emu.log)
+        self.assertGreater(busy, ssd1681.BUSY_MS["full"])
+
+    def test_ota_progress_bar_steps(self):
+        self.app.display_ota_progress(1, 5)
+        self.emu.wait_idle()
+        self.epd.wait_refresh()
+        spi_bytes = self.emu.spi_bytes
+        self.app.display_ota_progress(2, 5)
+        # Bar window (21 bytes x 16 rows) plus commands, not the whole frame
+        self.assertLess(self.emu.spi_bytes - spi_bytes, 21 * 16 + 200)
+
+        for i in range(3, 6):
+            self.emu.wait_idle()
+            self.epd.wait_refresh()
+            self.app.display_ota_progress(i, 5, is_done=(i == 5))
+        self.emu.wait_idle()
+        self.epd.wait_refresh()
+        self.assertEqual(self.emu.errors, [])
+        self.assertEqual(bytes(self.emu.panel), bytes(self.app.fb_pool.front.buf))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# tests/test_fonts.py
+import os
+import sys
+import unittest
+
+# Add src and the host framebuf mock to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools/lib')))
+
+import fonts
+from canvas import Canvas, rotate180
+
+WIDTH, HEIGHT = 200, 200
+
+
+class TestFonts(unittest.TestCase):
+    def test_tables_are_consistent(self):
+        for size in fonts.SIZES:
+            font = fonts.get(size)
+            self.assertEqual(font.height, size)
+            self.assertEqual(len(font.widths), len(font.chars))
+            self.assertEqual(len(font.offsets), 2 * len(font.chars))
+            total = sum(((w + 7) >> 3) * size for w in font.widths)
+            self.assertEqual(len(font.data), total)
+
+    def test_loaded_lazily_and_once(self):
+        fonts._loaded.pop(24, None)
+        sys.modules.pop("font24", None)
+        self.assertNotIn("font24", sys.modules)
+        font = fonts.get(24)
+        self.assertIn("font24", sys.modules)
+        self.assertIs(fonts.get(24), font)
+
+    def test_proportional_layout(self):
+        font = fonts.get(16)
+        self.assertLess(font.measure("I"), font.measure("W"))
+        self.assertEqual(font.measure("WIFI: "), sum(font.measure(c) for c in "WIFI: "))
+
+        buf = bytearray(b"\xff" * 5000)
+        end = Canvas(buf, WIDTH, HEIGHT).write("WIFI", 10, 20, font)
+        self.assertEqual(end, 10 + font.measure("WIFI"))
+        self.assertNotEqual(buf, bytearray(b"\xff" * 5000))
+
+    def test_unknown_char_falls_back(self):
+        font = fonts.get(24) # No lowercase
+        self.assertEqual(font.measure("a"), font.measure("?"))
+
+    def test_rotated_matches_rotating_afterwards(self):
+        for size in fonts.SIZES:
+            font = fonts.get(size)
+            upright = bytearray(b"\xff" * 5000)
+            Canvas(upright, WIDTH, HEIGHT).write("Door 12:30", 13, 41, font)
+            rotate180(upright, WIDTH, HEIGHT)
+
+            direct = bytearray(b"\xff" * 5000)
+            Canvas(direct, WIDTH, HEIGHT, rotation=180).write("Door 12:30", 13, 41, font)
+            self.assertEqual(direct, upright)
+
+    def test_rotated_glyph_cache_is_bounded(self):
+        font = fonts.Font(__import__("font16"))
+        text = font.chars[:fonts.ROTATED_CACHE + 10]
+        upright = bytearray(b"\xff" * 5000)
+        Canvas(upright, WIDTH, HEIGHT).write(text[:12], 3, 7, font)
+        rotate180(upright, WIDTH, HEIGHT)
+
+        Canvas(bytearray(5000), WIDTH, HEIGHT, rotation=180).write(text, 3, 90, font)
+        self.assertEqual(len(font._rotated), fonts.ROTATED_CACHE)
+
+        direct = bytearray(b"\xff" * 5000)
+        Canvas(direct, WIDTH, HEIGHT, rotation=180).write(text[:12], 3, 7, font) # Evicted first
+        self.assertEqual(direct, upright)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# tests/test_framebuf.py
+import os
+import sys
+import unittest
+
+# Add src and the host framebuf mock to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools/lib')))
+# Add tests to path for the scenes
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+import framebuf
+import framebuf_scenes
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "framebuf_golden")
+
+W, H = 40, 24
+
+
+def get_pixel(buf, x, y, w=W):
+    """Reference MONO_HLSB pixel read."""
+    return (buf[(y * w + x) >> 3] >> (7 - (x & 7))) & 1
+
+
+def make(fill=0):
+    buf = bytearray([0xFF if fill else 0] * (W * H // 8))
+    return buf, framebuf.FrameBuffer(buf, W, H, framebuf.MONO_HLSB)
+
+
+class TestHostFrameBuffer(unittest.TestCase):
+    def test_fill_rect_is_clipped(self):
+        buf, fb = make()
+        fb.fill_rect(35, -3, 10, 6, 1)
+        for y in range(H):
+            for x in range(W):
+                self.assertEqual(get_pixel(buf, x, y), int(x >= 35 and y < 3), (x, y))
+
+    def test_rect_outline_and_lines(self):
+        buf, fb = make(1)
+        fb.rect(3, 2, 10, 5, 0)
+        fb.hline(0, 20, 40, 0)
+        fb.vline(39, 0, 24, 0)
+        self.assertEqual(get_pixel(buf, 3, 2), 0)
+        self.assertEqual(get_pixel(buf, 12, 6), 0)
+        self.assertEqual(get_pixel(buf, 5, 4), 1) # Inside stays
+        self.assertEqual(sum(1 - get_pixel(buf, x, 20) for x in range(W)), W)
+        self.assertEqual(sum(1 - get_pixel(buf, 39, y) for y in range(H)), H)
+
+    def test_pixel_roundtrip(self):
+        buf, fb = make()
+        fb.pixel(9, 3, 1)
+        self.assertEqual(fb.pixel(9, 3), 1)
+        self.assertEqual(buf[(3 * W + 9) >> 3], 0x40)
+        fb.pixel(9, 3, 0)
+        self.assertEqual(fb.pixel(9, 3), 0)
+
+    def test_text_matches_font(self):
+        buf, fb = make()
+        fb.text("H1", 5, 7, 1)
+        for i, char in enumerate("H1"):
+            glyph = framebuf._FONT[char]
+            for gy in range(8):
+                for gx in range(8):
+                    expected = (glyph[gy] >> (7 - gx)) & 1
+                    self.assertEqual(get_pixel(buf, 5 + 8 * i + gx, 7 + gy), expected)
+
+    def test_blit_with_key(self):
+        buf, fb = make()
+        src_buf = bytearray(2) # 8x2, one pixel set
+        src = framebuf.FrameBuffer(src_buf, 8, 2, framebuf.MONO_HLSB)
+        src.pixel(1, 1, 1)
+        fb.fill_rect(0, 0, 8, 2, 1)
+        fb.blit(src, 0, 0, 1) # Key 1: only the 0 pixels are copied
+        self.assertEqual(get_pixel(buf, 1, 1), 1)
+        self.assertEqual(get_pixel(buf, 0, 0), 0)
+
+        fb.blit(src, 36, 23) # Clipped at the corner
+        self.assertEqual(get_pixel(buf, 37, 23), 0)
+
+    def test_to_pil_matches_pixels(self):
+        buf, fb = make(1)
+        fb.text("OK", 1, 1, 0)
+        img = fb.to_pil()
+        for y in range(H):
+            for x in range(W):
+                # Rotated by 180 degrees
+                white = img.getpixel((W - 1 - x, H - 1 - y)) != 0
+                self.assertEqual(white, bool(get_pixel(buf, x, y)))
+
+
+def read_pbm(path):
+    """Returns (source from the header comment or None, rows of pixels)."""
+    source = None
+    values = []
+    with open(path) as f:
+        for line in f:
+            if line.startswith("#"):
+                source = source or line[1:].strip()
+            else:
+                values.extend(line.split())
+    h = int(values[2])
+    rows = values[3:]
+    return source, [[int(ch) for ch in row] for row in rows[:h]]
+
+
+def packed_bit(fmt, buf, x, y, width):
+    """Reference bit layout of each mono format."""
+    if fmt == framebuf.MONO_VLSB:
+        return (buf[(y >> 3) * width + x] >> (y & 7)) & 1
+    index = (y * ((width + 7) & ~7) + x) >> 3
+    if fmt == framebuf.MONO_HLSB:
+        return (buf[index] >> (7 - (x & 7))) & 1
+    return (buf[index] >> (x & 7)) & 1
+
+
+class TestGoldenScenes(unittest.TestCase):
+    """
+    Regression tests of the mock: scenes from framebuf_scenes.py against
+    golden images it rendered, in every mono format, plus the bit layout
+    of each format.
+    """
+    def test_scenes_match_golden_images(self):
+        for name in framebuf_scenes.SCENES:
+            source, ref = read_pbm(os.path.join(GOLDEN_DIR, name + ".pbm"))
+            for fmt_name, (fmt, size) in framebuf_scenes.FORMATS.items():
+                fb = framebuf_scenes.render(name, fmt, size)
+                for y in range(framebuf_scenes.HEIGHT):
+                    for x in range(framebuf_scenes.WIDTH):
+                        expected = ref[y][x]
+                        self.assertEqual(fb.pixel(x, y), expected,
+                                         f"{name} {fmt_name} ({x}, {y}), golden from {source}")
+                        self.assertEqual(packed_bit(fmt, fb.buffer, x, y, framebuf_scenes.WIDTH),
+                                         expected, f"{name} {fmt_name} layout ({x}, {y})")
+
+    def test_out_of_bounds_pixel_is_none(self):
+        _, fb = make()
+        self.assertIsNone(fb.pixel(W, 0))
+        self.assertIsNone(fb.pixel(0, -1))
+
+    def test_fill_keeps_row_padding(self):
+        buf = bytearray(b"\x00" * 8)
+        fb = framebuf.FrameBuffer(buf, 5, 8, framebuf.MONO_HLSB)
+        fb.fill(1)
+        self.assertEqual(buf, bytearray(b"\xf8" * 8))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# tests/test_glyphs.py
+import os
+import sys
+import unittest
+
+# Add src and the host framebuf mock to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../tools/lib')))
+
+import framebuf
+
+from glyphs import blit
+
+WIDTH, HEIGHT = 200, 200
+
+# 11 x 3 glyph, rows of 2 bytes: a frame with a dot in the middle
+GLYPH = bytes([0xFF, 0xE0, 0x84, 0x20, 0xFF, 0xE0])
+GW, GH = 11, 3
+
+
+def pixel_blit(fb, glyph, w, h, x, y, c):
+    """Reference: the same glyph drawn pixel by pixel."""
+    stride = (w + 7) // 8
+    for gy in range(h):
+        for gx in range(w):
+            if glyph[gy * stride + gx // 8] & (0x80 >> (gx & 7)):
+                fb.pixel(x + gx, y + gy, c)
+
+
+class TestBlit(unittest.TestCase):
+    def blit_both(self, x, y, c=0, fill=1):
+        ref = bytearray(WIDTH * HEIGHT // 8)
+        fb = framebuf.FrameBuffer(ref, WIDTH, HEIGHT, framebuf.MONO_HLSB)
+        fb.fill(fill)
+        buf = bytearray(ref)
+        pixel_blit(fb, GLYPH, GW, GH, x, y, c)
+        blit(buf, WIDTH, HEIGHT, GLYPH, GW, GH, x, y, c)
+        return ref, buf
+
+    def test_matches_per_pixel_drawing(self):
+        for x in range(9):
+            ref, out = self.blit_both(40 + x, 17)
+            self.assertEqual(ref, out, f"Mismatch at x={40 + x}")
+        ref, out = self.blit_both(13, 5, c=1, fill=0)
+        self.assertEqual(ref, out)
+
+    def test_clips_at_buffer_edges(self):
+        for x, y in [(-5, -1), (195, 198), (-10, 100), (199, 0)]:
+            ref, out = self.blit_both(x, y)
+            self.assertEqual(ref, out, f"Mismatch at ({x}, {y})")
+
+    def test_offset_selects_glyph_rows(self):
+        ref, _ = self.blit_both(20, 31)
+        out = bytearray(b"\xff" * (WIDTH * HEIGHT // 8))
+        blit(out, WIDTH, HEIGHT, bytes(4) + GLYPH, GW, GH, 20, 31, 0, offset=4)
+        self.assertEqual(ref, out)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# tests/test_inputs.py
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import hal
+from inputs import IRQ_FALLING, IRQ_RISING, PRESS, RELEASE, Debouncer, EdgeQueue
+
+
+def ms(t):
+    return t * 1000
+
+
+class TestEdgeQueue(unittest.TestCase):
+    def test_fifo_wrap_and_overflow(self):
+        q = EdgeQueue(3)
+        for i in range(5): # Wraps the ring twice
+            q.push(12, i & 1, ms(i))
+            self.assertEqual(q.pop(), (12, i & 1, ms(i)))
+        self.assertIsNone(q.pop())
+
+        for i in range(4):
+            q.push(15, 0, i)
+        self.assertEqual(len(q), 3)
+        self.assertEqual(q.dropped, 1)
+        self.assertEqual([q.pop()[2] for _ in range(3)], [0, 1, 2])
+
+    def test_pin_irq_pushes_injected_edges(self):
+        q = EdgeQueue()
+        pin = hal.HardwareAbstractionLayer().create_pin_in(12, pull_up=True, edges=q)
+        pin.inject(1, 1000)
+        pin.inject(0, 1250)
+        pin.inject(0, 1300) # No edge
+        pin.value(1)
+        self.assertEqual(q.pop(), (12, 1, 1000))
+        self.assertEqual(q.pop(), (12, 0, 1250))
+        self.assertEqual(q.pop()[:2], (12, 1))
+        self.assertIsNone(q.pop())
+
+    def test_pulse_shorter_than_irq_latency(self):
+        q = EdgeQueue()
+        pin = hal.HardwareAbstractionLayer().create_pin_in(12, pull_up=True, edges=q)
+        pin.value(1) # Idle high
+        q.pop()
+        pin.inject_pulse(2000) # Low and back before the handler ran
+        self.assertEqual(pin.value(), 1)
+        self.assertEqual(q.pop(), (12, 0, 2000))
+        self.assertEqual(q.pop(), (12, 1, 2000))
+        self.assertIsNone(q.pop())
+
+    def test_level_comes_from_irq_flags(self):
+        q = EdgeQueue()
+        q.push_irq(15, IRQ_FALLING, 1, 100) # Pin already back high
+        q.push_irq(15, IRQ_RISING, 0, 200)
+        q.push_irq(15, IRQ_FALLING | IRQ_RISING, 0, 300) # Rise, then fall
+        self.assertEqual([q.pop() for _ in range(4)],
+                         [(15, 0, 100), (15, 1, 200), (15, 1, 300), (15, 0, 300)])
+
+
+class TestDebouncer(unittest.TestCase):
+    def feed(self, d, edges, until):
+        """Feeds (level, t_ms) edges, polling every ms, and returns the (event, t_ms) seen."""
+        out = []
+        edges = list(edges)
+        for t in range(until):
+            while edges and edges[0][1] <= t:
+                level, t_edge = edges.pop(0)
+                if d.edge(level, ms(t_edge)) == PRESS:
+                    out.append((PRESS, t))
+            if d.poll(ms(t)) == RELEASE:
+                out.append((RELEASE, t))
+        return out
+
+    def test_bouncy_press_is_one_event(self):
+        d = Debouncer(300)
+        bounces = [(0, 10), (1, 11), (0, 12), (1, 14), (0, 15), # Contact bounce
+                   (1, 400), (0, 402), (1, 403)]                 # and on release
+        self.assertEqual(self.feed(d, bounces, 1000), [(PRESS, 10), (RELEASE, 703)])
+
+    def test_short_pulse_is_not_missed(self):
+        d = Debouncer(300)
+        self.assertEqual(self.feed(d, [(0, 5), (1, 6)], 400), [(PRESS, 5), (RELEASE, 306)])
+
+    def test_repeat_within_debounce_is_the_same_press(self):
+        d = Debouncer(300)
+        edges = [(0, 0), (1, 100), (0, 250), (1, 300), # Second ring 150 ms later
+                 (0, 700), (1, 800)]                   # Third one after the gap
+        events = self.feed(d, edges, 1200)
+        self.assertEqual(events, [(PRESS, 0), (RELEASE, 600), (PRESS, 700), (RELEASE, 1100)])
+
+    def test_held_and_wrapping_ticks(self):
+        d = Debouncer(50)
+        t0 = 0x3FFFFFFF - ms(5) # Ticks wrap during the press
+        d.edge(0, t0)
+        now = (t0 + ms(20)) & 0x3FFFFFFF
+        self.assertEqual(d.held_ms(now), 20)
+        d.edge(1, now)
+        self.assertIsNone(d.poll((now + ms(49)) & 0x3FFFFFFF))
+        self.assertEqual(d.poll((now + ms(50)) & 0x3FFFFFFF), RELEASE)
+        self.assertEqual(d.held_ms(now), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
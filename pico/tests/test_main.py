@@ -1,14 +1,24 @@
 # tests/test_main.py
 import unittest
+from unittest import mock
 import sys
 import os
+import tracemalloc
 
 # Add src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# Add tests to path for mocks
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 import hal
+import aio
 import config
 from main import DoorbellApp
+from canvas import Canvas, frame_digest
+from rle import RLEImage
+import fonts
+from version import FW_VERSION
+from epd_mock import RecordingEPD
 
 class TestDoorbellApp(unittest.TestCase):
     def setUp(self):
@@ -40,7 +50,7 @@ class TestDoorbellApp(unittest.TestCase):
         # Ideally we refactor run() to be testable step-by-step or call internal checks
         # Here we mimic the run loop check:
         if self.app.pin_ring.value() == 0:
-             self.app.send_ring_event()
+             aio.run(self.app.send_ring_event())
              self.app.ring_ts = self.hal.get_time_ms()
 
         # Verify HTTP post was called (via print mock in HAL or we can inspect HAL if we improved it)
@@ -52,8 +62,225 @@ class TestDoorbellApp(unittest.TestCase):
         """Test door pulse logic."""
         self.app.pin_door.off()
         self.app.pulse_door()
+        # Relay driven before anything else, without waiting for the pulse
+        self.assertEqual(self.app.pin_door.value(), 1)
+        self.assertLess(self.app.door_latency_us, 50000)
+        self.assertEqual(len(self.app.display_queue), 2) # OPEN, LISTEN after the pulse
+
         # Mock Pin should be back to 0 after pulse
+        self.hal.sleep(config.DOOR_PULSE_S + 0.1)
         self.assertEqual(self.app.pin_door.value(), 0)
+        self.app.display_service()
+        self.assertEqual(self.app.app_mode, "OPEN") # Held for the dwell time, past the pulse
+        self.assertEqual(self.app.display_queue.collapsed, 0)
+        self.assertEqual(self.app.display_queue.last(), "LISTEN")
+
+class TestMockEPD(unittest.TestCase):
+    @mock.patch.object(hal, "framebuf", None) # No preview window or PNG
+    def test_refresh_calls_callback(self):
+        epd = hal.MockEPD()
+        done = []
+        epd.display(bytearray(5000), wait=False, callback=done.append)
+        epd.display_partial(bytearray(5000), wait=False, callback=done.append)
+        self.assertEqual(done, [epd, epd])
+
+class TestDisplayPath(unittest.TestCase):
+    def setUp(self):
+        self.hal = hal.HardwareAbstractionLayer()
+        self.epd = RecordingEPD()
+        self.hal._epd = self.epd
+        self.app = DoorbellApp(self.hal)
+        self.app.app_mode = "LISTEN"
+
+    def test_partial_update_sends_only_dirty_rects(self):
+        self.app.display_update()
+        self.app.last_call_str = "JAN 10 14:30"
+        self.app.display_update()
+
+        name, _, rects = self.epd.calls[-2]
+        self.assertEqual(name, "display_partial")
+        self.assertEqual(len(rects), 1)
+        _, y, w, h = rects[0]
+        # LAST CALL value line (y=155..170 upright) only, in panel orientation
+        self.assertGreaterEqual(y, 200 - 171)
+        self.assertLessEqual(y + h, 200 - 155)
+        self.assertLess(w * h // 8, 5000 // 10)
+
+    def test_first_update_is_single_full_refresh(self):
+        self.app.display_update()
+        self.assertEqual(self.epd.names(), ["init", "display", "sleep"])
+        self.assertIsNone(self.epd.calls[1][2]) # Whole frame written
+        self.assertEqual(self.app.refresh_scheduler.full_count, 1)
+
+    def test_scheduler_forces_full_after_max_partials(self):
+        scheduler = self.app.refresh_scheduler
+        scheduler.max_partials = 3
+        self.app.display_update()
+        for i in range(4):
+            self.app.last_call_str = f"CALL {i}"
+            self.app.display_update()
+
+        refreshes = [n for n in self.epd.names() if n.startswith("display")]
+        self.assertEqual(refreshes, ["display", "display_partial", "display_partial",
+                                     "display_partial", "display"])
+        self.assertEqual((scheduler.full_count, scheduler.partial_count), (2, 3))
+
+    def test_mode_change_to_setup_forces_full(self):
+        self.app.display_update()
+        self.app.app_mode = "OPEN"
+        self.app.display_update()
+        self.assertEqual(self.epd.names()[-2], "display_partial")
+
+        self.app.app_mode = "SETUP"
+        self.app.display_update()
+        self.assertEqual(self.epd.names()[-2], "display")
+
+    def test_sleep_deferred_until_refresh_done(self):
+        self.epd.busy = True
+        self.app.display_update()
+        self.assertNotIn("sleep", self.epd.names())
+
+        self.app.display_service()
+        self.assertNotIn("sleep", self.epd.names())
+
+        self.epd.busy = False
+        self.app.display_service()
+        self.assertEqual(self.epd.names()[-1], "sleep")
+        self.assertFalse(self.app.display_awake)
+
+    def test_unchanged_frame_skips_refresh(self):
+        self.app.display_update()
+        calls = len(self.epd.calls)
+
+        self.app.display_update()
+        self.app.display_update()
+        self.assertEqual(len(self.epd.calls), calls)
+        self.assertEqual(self.app.display_skipped, 2)
+
+        self.app.last_call_str = "JAN 10 14:30"
+        self.app.display_update()
+        self.assertIn("display_partial", self.epd.names()[calls:])
+        self.assertEqual(self.app.display_skipped, 2)
+
+    def test_partial_profile_per_screen(self):
+        self.app.display_update()
+        self.app.last_call_str = "JAN 10 14:30"
+        self.app.display_update()
+        self.assertEqual(self.epd.profiles[-1], "fast-partial")
+
+        # Measured at wake-up, at most every EPD_TEMP_INTERVAL_S
+        reads = []
+        self.hal.read_temperature = lambda: reads.append(1) or -3
+        self.app.last_call_str = "JAN 10 14:31"
+        self.app.display_update()
+        self.assertEqual(self.epd.profiles[-1], "fast-partial")
+        self.assertEqual(reads, [])
+
+        self.app._panel_temp_ts -= config.EPD_TEMP_INTERVAL_S * 1000 + 1
+        self.app.last_call_str = "JAN 10 14:32"
+        self.app.display_update()
+        self.app.last_call_str = "JAN 10 14:33"
+        self.app.display_update()
+        self.assertEqual(self.epd.profiles[-1], "low-temp")
+        self.assertEqual(reads, [1])
+
+    def test_template_frame_matches_drawing_from_scratch(self):
+        self.hal.is_wifi_connected = lambda: True
+        self.app.wifi_creds = {"ssid": "HOMENET", "pwd": "x"}
+        self.app.display_update()
+
+        expected = bytearray(5000)
+        fb = Canvas(expected, 200, 200, rotation=180)
+        fb.fill(1)
+        fb.write("PICOBELL", 10, 15, fonts.get(24))
+        fb.rect(2, 2, 196, 196, 0)
+        fb.write("READY", 10, 60, fonts.get(24))
+        fb.write("WIFI: HOMENET", 10, 100, fonts.get(16))
+        fb.write("LAST CALL:", 10, 130, fonts.get(16))
+        fb.write("_________", 10, 155, fonts.get(16))
+        version = f"v{FW_VERSION}"
+        fb.write(version, 190 - fonts.get(8).measure(version), 187, fonts.get(8))
+        self.assertEqual(self.epd.calls[1][1], bytes(expected))
+
+    def test_templates_painted_once(self):
+        self.app.display_update()
+        for i in range(3):
+            self.app.last_call_str = f"CALL {i}"
+            self.app.display_update()
+        self.assertEqual(self.app.templates.renders, 1)
+
+        self.app.display_ota_progress(1, 3)
+        self.app.display_update()
+        self.assertEqual(self.app.templates.renders, 2)
+
+    def test_asset_screens_are_up_to_date(self):
+        for name in self.app.ASSET_SCREENS:
+            asset = __import__(self.app.asset_module(name))
+            self.assertEqual(asset.FW_VERSION, FW_VERSION)
+            _, buf = self.app.render_screen(name)
+            self.assertEqual(RLEImage(asset.DATA).decode(), buf,
+                             f"{name} asset is stale, run tools/build_assets.py")
+            self.assertEqual(asset.DIGEST, frame_digest(buf))
+
+    def test_boot_screen_streamed_from_asset(self):
+        self.app.app_mode = "START"
+        self.app.display_update()
+        self.assertEqual(self.epd.names(), ["init", "display", "sleep"])
+        self.assertEqual(self.app.templates.renders, 0) # Nothing drawn
+        self.assertIsNone(self.app._fb_pool) # Frames allocated after the boot screen
+        self.assertNotIn("asset_start", sys.modules) # Unloaded once streamed
+
+        # The pool does not know the panel content, next frame goes out whole
+        self.app.app_mode = "LISTEN"
+        self.app.display_update()
+        self.assertIsNone(self.epd.calls[-2][2])
+        self.assertNotEqual(self.epd.calls[-2][1], self.epd.calls[1][1])
+
+    def test_ota_progress_sends_only_the_bar(self):
+        self.app.display_update()
+        self.app.display_ota_progress(1, 4)
+        self.app.display_ota_progress(2, 4)
+
+        name, _, rects = self.epd.calls[-1]
+        self.assertEqual(name, "display_partial")
+        self.assertEqual(rects, [(16, 39, 168, 16)]) # OTA_BAR in panel orientation
+        self.assertNotIn("sleep", self.epd.names()[-3:])
+
+    def test_ota_progress_never_waits_for_the_panel(self):
+        self.app.display_ota_progress(1, 4)
+        self.epd.busy = True
+        pushes = len(self.epd.calls)
+        self.app.display_ota_progress(2, 4)
+        self.assertEqual(len(self.epd.calls), pushes) # Skipped, bar catches up next step
+
+        self.epd.busy = False
+        self.app.display_ota_progress(3, 4)
+        self.epd.busy = True
+        self.app.display_ota_progress(4, 4, is_done=True) # Last step always shown
+        self.assertEqual(self.epd.names()[-1], "display_partial")
+        self.assertEqual(len(self.epd.calls[-1][2]), 2) # Bar and REBOOTING
+
+    def test_no_framebuffer_allocations_after_warm_up(self):
+        def redraw():
+            self.app.display_update()
+            self.app.last_call_str = "JAN 10 14:30"
+            self.app.display_update()
+            self.app.last_call_str = "_________"
+            self.app.display_ota_progress(2, 3)
+
+        self.epd.keep_images = False
+        redraw() # Warm-up (glyph cache, pool)
+
+        tracemalloc.start()
+        try:
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            redraw()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak - base, 5000)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,7 @@ import requests
 # Add src to path so we can import modules
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
+import aio
 import config
 import ota
 from hal import HardwareAbstractionLayer
@@ -21,7 +22,10 @@ class RealPcHal(HardwareAbstractionLayer):
     def __init__(self):
         super().__init__()
 
-    def http_get(self, url, headers={}):
+    async def http_get(self, url, headers={}):
+        return self.get(url, headers)
+
+    def get(self, url, headers):
         all_headers = {
             "Authorization": "Apartment " + config.API_KEY,
             "Content-Type": "application/json",
@@ -104,7 +108,7 @@ class TestOtaIntegration(unittest.TestCase):
 
         # 1. Check for updates
         print("1. Checking for updates...")
-        has_update = self.updater.check_for_updates()
+        has_update = aio.run(self.updater.check_for_updates())
 
         if not has_update:
             print("WARNING: No update found. Ensure server/firmware/latest has files and version > 0.0.0")
@@ -115,7 +119,7 @@ class TestOtaIntegration(unittest.TestCase):
 
         # 2. Update firmware
         print("2. Downloading firmware...")
-        success = self.updater.update_firmware()
+        success = aio.run(self.updater.update_firmware())
         self.assertTrue(success, "Firmware update should succeed")
 
         # 3. Verify files exist in the temp directory
@@ -0,0 +1,63 @@
+# tests/test_rle.py
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# Add tests to path for mocks
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from epd_mock import RecordingSPI
+
+import epaper1in54
+import hal
+import rle
+
+
+class TestPackBits(unittest.TestCase):
+    def test_round_trip(self):
+        samples = [
+            b"",
+            b"\x00",
+            b"\xff" * 5000,
+            bytes(range(256)) * 3,
+            b"\xff" * 130 + b"\x01\x02\x02\x03" + b"\x00" * 3,
+        ]
+        for data in samples:
+            packed = rle.pack(data)
+            self.assertEqual(rle.RLEImage(packed).decode(), data)
+
+    def test_white_frame_is_tiny(self):
+        self.assertLess(len(rle.pack(b"\xff" * 5000)), 100)
+
+    def test_stream_in_small_chunks(self):
+        data = bytes(range(200)) + b"\xaa" * 300 + bytes(range(50))
+        chunks = []
+        rle.RLEImage(rle.pack(data)).stream(lambda mv: chunks.append(bytes(mv)), bytearray(128))
+        self.assertEqual(b"".join(chunks), data)
+        self.assertTrue(all(len(c) <= 128 for c in chunks))
+
+
+class TestEPDStream(unittest.TestCase):
+    def setUp(self):
+        self._sleep = epaper1in54.time.sleep
+        epaper1in54.time.sleep = lambda s: None
+
+    def tearDown(self):
+        epaper1in54.time.sleep = self._sleep
+
+    def test_epd_streams_rle_image_into_both_banks(self):
+        dc = hal.MockPin("dc", 0)
+        spi = RecordingSPI(dc)
+        epd = epaper1in54.EPD(spi, hal.MockPin("cs", 1), dc, hal.MockPin("rst", 1), hal.MockPin("busy", 0))
+        frame = bytes(range(200)) * 25
+        epd.display(rle.RLEImage(rle.pack(frame)), rects=[(0, 0, 8, 1)])
+        self.assertEqual(spi.data_after(0x24), [frame])
+        self.assertEqual(spi.data_after(0x26), [frame])
+        # Decoded through the scratch buffer, never as a whole frame
+        self.assertTrue(all(len(d) <= 200 for c, d in spi.writes))
+
+
+if __name__ == '__main__':
+    unittest.main()
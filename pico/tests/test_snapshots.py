@@ -0,0 +1,117 @@
+# tests/test_snapshots.py
+"""
+Golden-image snapshots of every screen. Render times are measured by
+tools/time_scenarios.py, not here.
+
+Frames are rendered headlessly and compared bit for bit against the PNGs in
+tests/golden (stored upright). On a mismatch a diff image (red = pixel
+differs) is written to tests/snapshot_diffs.
+
+    UPDATE_SNAPSHOTS=1 python -m pytest tests/test_snapshots.py   # rewrite goldens
+"""
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# Add tests to path for mocks
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from epd_mock import RecordingEPD
+from PIL import Image
+
+import hal
+from canvas import rotate180
+from main import DoorbellApp
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "golden")
+DIFF_DIR = os.path.join(os.path.dirname(__file__), "snapshot_diffs")
+UPDATE = os.environ.get("UPDATE_SNAPSHOTS") == "1"
+
+
+def make_app():
+    hw = hal.HardwareAbstractionLayer()
+    hw._epd = RecordingEPD(keep_images=False)
+    hw.is_wifi_connected = lambda: True
+    app = DoorbellApp(hw)
+    app.wifi_creds = {"ssid": "HomeNet-5G", "pwd": "x"}
+    app.last_call_str = "JAN 10 14:30"
+    return app
+
+
+def listen_offline(app):
+    app.hal.is_wifi_connected = lambda: False
+    app.last_call_str = "_________"
+    return app.render_screen("LISTEN")
+
+
+def ota_step(current, total, is_done=False):
+    def draw(app):
+        # Same widgets as display_ota_progress, without the push
+        app.ota_bar.set_value(current, total)
+        app.ota_rebooting.set_visible(is_done)
+        return app.render_screen("OTA")
+    return draw
+
+
+# Snapshot name -> draw(app) returning (fb, buf) in panel orientation
+SCREENS = {
+    "listen": lambda app: app.render_screen("LISTEN"),
+    "listen_offline": listen_offline,
+    "setup": lambda app: app.render_screen("SETUP"),
+    "setup_saved": lambda app: app.render_screen("SETUP_SAVED"),
+    "open": lambda app: app.render_screen("OPEN"),
+    "start": lambda app: app.render_screen("START"),
+    "ota_1": ota_step(1, 5),
+    "ota_3": ota_step(3, 5),
+    "ota_done": ota_step(5, 5, True),
+}
+
+
+def to_image(buf):
+    """Upright 1bpp image of a panel-orientation frame (set bit = white)."""
+    upright = bytearray(buf)
+    rotate180(upright, 200, 200)
+    return Image.frombytes("1", (200, 200), bytes(upright))
+
+
+def write_diff(name, actual, golden):
+    os.makedirs(DIFF_DIR, exist_ok=True)
+    diff = Image.new("RGB", actual.size)
+    a, g = actual.load(), golden.load()
+    px = diff.load()
+    for y in range(actual.height):
+        for x in range(actual.width):
+            if a[x, y] != g[x, y]:
+                px[x, y] = (255, 0, 0)
+            else:
+                px[x, y] = (255, 255, 255) if a[x, y] else (0, 0, 0)
+    path = os.path.join(DIFF_DIR, name + "_diff.png")
+    diff.save(path)
+    actual.save(os.path.join(DIFF_DIR, name + "_actual.png"))
+    return path
+
+
+class TestScreenSnapshots(unittest.TestCase):
+    def test_screens_match_golden_images(self):
+        for name, draw in SCREENS.items():
+            with self.subTest(screen=name):
+                _, buf = draw(make_app())
+                actual = to_image(buf)
+                path = os.path.join(GOLDEN_DIR, name + ".png")
+                if UPDATE or not os.path.exists(path):
+                    os.makedirs(GOLDEN_DIR, exist_ok=True)
+                    actual.save(path)
+                    if not UPDATE:
+                        self.fail(f"No golden image for {name}, wrote {path}")
+                    continue
+
+                golden = Image.open(path).convert("1")
+                if actual.tobytes() != golden.tobytes():
+                    diff = write_diff(name, actual, golden)
+                    self.fail(f"{name} differs from its golden image, see {diff}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# tests/test_stats.py
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import epaper1in54
+import hal
+import stats
+from main import DoorbellApp
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        self._sleep = epaper1in54.time.sleep
+        epaper1in54.time.sleep = lambda s: None
+        stats.reset()
+        self.hal = hal.HardwareAbstractionLayer()
+        self.epd = self.hal.get_epd()
+        self.emu = self.hal.epd_emulator
+        self.emu.time_scale = 0.001
+        self.app = DoorbellApp(self.hal)
+        self.app.app_mode = "LISTEN"
+
+    def tearDown(self):
+        stats.enable(False)
+        stats.reset()
+        epaper1in54.time.sleep = self._sleep
+
+    def _updates(self):
+        self.app.display_update()
+        self.app.last_call_str = "JAN 10 14:30"
+        self.app.display_update()
+        self.app.display_update() # Unchanged
+        self.epd.wait_refresh()
+
+    def test_disabled_counts_nothing(self):
+        self._updates()
+        self.assertEqual(stats.snapshot(), {})
+
+    def test_counters_match_emulated_controller(self):
+        stats.enable()
+        self._updates()
+        snap = stats.snapshot()
+
+        self.assertEqual(snap["spi_bytes"], self.emu.spi_bytes)
+        self.assertEqual(snap["refresh_full"], self.emu.refreshes["full"])
+        self.assertEqual(snap["refresh_partial"], self.emu.refreshes["partial"] + self.emu.refreshes["lut"])
+        self.assertEqual(snap["display_updates"], 3)
+        self.assertEqual(snap["frames_pushed"], 2)
+        self.assertEqual(snap["frames_skipped"], 1)
+        self.assertEqual(snap["profile_fast-partial"], 1)
+        self.assertEqual(snap["lut_uploads"], 1)
+        self.assertGreater(snap["draw_calls"], 0)
+        for name in ("render_us", "push_us", "epd_wait_us"):
+            self.assertGreater(snap[name], 0, name)
+
+    def test_snapshot_is_a_copy(self):
+        stats.enable()
+        stats.add("x")
+        snap = stats.snapshot()
+        stats.add("x")
+        self.assertEqual(snap, {"x": 1})
+        stats.reset()
+        self.assertEqual(stats.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
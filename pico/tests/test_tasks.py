@@ -0,0 +1,225 @@
+# tests/test_tasks.py
+import os
+import sys
+import time
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# Add tests to path for mocks
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from epd_mock import RecordingEPD
+
+import aio
+import config
+import hal
+import inputs
+from main import DoorbellApp
+
+
+def block_loop(seconds):
+    """Holds up every task, as a long synchronous draw would."""
+    time.sleep(seconds)
+
+
+class TestEventQueue(unittest.TestCase):
+    def test_fifo_and_overflow(self):
+        q = aio.EventQueue(2)
+        self.assertTrue(q.put("A"))
+        self.assertTrue(q.put("B"))
+        self.assertFalse(q.put("C"))
+        self.assertEqual(q.dropped, 1)
+        self.assertEqual(q.get_nowait(), "A")
+        self.assertTrue(q.put("D"))
+        self.assertEqual([q.get_nowait(), q.get_nowait(), q.get_nowait()], ["B", "D", None])
+
+    def test_get_waits_for_put(self):
+        async def scenario():
+            q = aio.EventQueue()
+            getter = aio.create_task(q.get())
+            await aio.sleep_ms(10)
+            self.assertFalse(getter.done())
+            q.put("RING")
+            return await getter
+        self.assertEqual(aio.run(scenario()), "RING")
+
+
+class TestAppTasks(unittest.TestCase):
+    def setUp(self):
+        self._config = (config.API_KEY, config.STATUS_CHECK_INTERVAL_S, config.DOOR_PULSE_S)
+        config.API_KEY = "1234abcd"
+        config.STATUS_CHECK_INTERVAL_S = 0
+        config.DOOR_PULSE_S = 0.01
+
+        self.hal = hal.HardwareAbstractionLayer()
+        self.hal._epd = RecordingEPD(keep_images=False)
+        self.posts = []
+        self.open_after_ring = True
+        self.hal.send = self.send
+        self.app = DoorbellApp(self.hal)
+        self.app.app_mode = "LISTEN"
+        self.app.led_mode = 1
+        # Inputs idle (pulled up)
+        self.app.pin_btn.value(1)
+        self.app.pin_ring.value(1)
+        self.door = []
+        self.app.pin_door.irq(lambda pin: self.door.append(pin.value()))
+
+    def tearDown(self):
+        config.API_KEY, config.STATUS_CHECK_INTERVAL_S, config.DOOR_PULSE_S = self._config
+
+    async def send(self, request):
+        url = request[0]
+        self.posts.append(url)
+        if url == config.URL_RING:
+            await aio.sleep_ms(200) # Slow server
+            return hal.MockResponse(200, {"display_time": "JAN 10 14:30"})
+        return hal.MockResponse(200, {"open": self.open_after_ring})
+
+    def run_tasks(self, scenario):
+        async def main():
+            self.app.start_tasks()
+            self.app.tasks.append(aio.create_task(self.app.event_task()))
+            try:
+                await scenario()
+            finally:
+                for task in self.app.tasks:
+                    task.cancel()
+        aio.run(main())
+
+    def test_ring_then_open_command(self):
+        async def scenario():
+            self.app.pin_ring.value(0)
+            await aio.sleep_ms(150)
+            self.app.pin_ring.value(1)
+            await aio.sleep_ms(500)
+
+        self.run_tasks(scenario)
+        self.assertEqual(self.posts[:2], [config.URL_RING, config.URL_STATUS])
+        self.assertEqual(self.app.last_call_str, "JAN 10 14:30")
+        self.assertEqual(self.door, [1, 0])
+        self.assertLess(self.app.door_latency_us, 50000) # Status response to relay
+        self.assertGreater(self.app.status_rx_us, 0)
+        self.assertEqual(self.app.ring_ts, 0) # Window closed after open
+
+    def test_slow_http_does_not_stall_other_tasks(self):
+        self.open_after_ring = False
+        led_updates = []
+        self.app.led_update = lambda: led_updates.append(self.hal.get_time_ms())
+
+        async def scenario():
+            self.app.pin_ring.value(0)
+            await aio.sleep_ms(20)
+            self.app.pin_ring.value(1)
+            await aio.sleep_ms(20) # Ring POST in flight
+            n = len(led_updates)
+            self.app.pin_btn.value(0) # Short press while waiting for the server
+            await aio.sleep_ms(60)
+            self.app.pin_btn.value(1)
+            await aio.sleep_ms(70)
+            self.assertGreater(len(led_updates), n + 2)
+            self.assertEqual(self.door[:1], [1]) # Opened before the ring POST returned
+            self.assertEqual(self.app.last_call_str, "_________")
+            await aio.sleep_ms(200)
+
+        self.run_tasks(scenario)
+        self.assertEqual(self.door, [1, 0])
+        self.assertEqual(self.posts[0], config.URL_RING)
+
+    def test_ring_pipeline_stages(self):
+        self.open_after_ring = False
+
+        async def scenario():
+            now = inputs.ticks_us()
+            self.app.pin_ring.inject(0, now)
+            self.app.pin_ring.inject(1, now + 5000)
+            await aio.sleep_ms(100) # POST in flight
+            self.assertGreater(self.app.ring_ts, 0) # Status window already open
+            self.assertEqual(self.app.ring_trace.keys(), {"detected"})
+            await aio.sleep_ms(250)
+
+        self.run_tasks(scenario)
+        trace = self.app.ring_trace
+        self.assertEqual(list(trace), ["detected", "sent", "synced", "displayed"])
+        self.assertLess(trace["detected"], 50000)
+        self.assertGreaterEqual(trace["sent"], 200000) # Server time
+        self.assertTrue(trace["detected"] < trace["sent"] <= trace["synced"] <= trace["displayed"])
+        self.assertEqual(self.app.last_call_str, "JAN 10 14:30")
+        self.assertIs(self.app.ring_request(), self.app.ring_request()) # Encoded once
+
+    def test_short_ring_pulse_while_busy_is_caught(self):
+        self.open_after_ring = False
+
+        async def scenario():
+            await aio.sleep_ms(20)
+            now = inputs.ticks_us()
+            self.app.pin_ring.inject(0, now) # 2 ms pulse while the loop is busy
+            self.app.pin_ring.inject(1, now + 2000)
+            block_loop(0.1)
+            await aio.sleep_ms(300)
+
+        self.run_tasks(scenario)
+        self.assertEqual(self.posts[0], config.URL_RING)
+
+    def test_door_latency_counts_from_press_edge(self):
+        async def scenario():
+            now = inputs.ticks_us()
+            self.app.pin_btn.inject(0, now - 200000) # Pressed 200 ms ago
+            self.app.pin_btn.inject(1, now - 100000)
+            await aio.sleep_ms(50)
+
+        self.run_tasks(scenario)
+        self.assertEqual(self.door[:1], [1])
+        self.assertGreaterEqual(self.app.door_latency_us, 200000)
+
+    def test_door_opens_on_press_edge(self):
+        relay_us = []
+        self.app.pin_door.irq(lambda pin: relay_us.append(inputs.ticks_us()) if pin.value() else None)
+
+        async def scenario():
+            await aio.sleep_ms(20)
+            t_press = inputs.ticks_us()
+            self.app.pin_btn.inject(0, t_press) # Held: no release yet
+            await aio.sleep_ms(config.BTN_DEBOUNCE_MS)
+            self.assertEqual(len(relay_us), 1)
+            self.assertLess(inputs.ticks_diff(relay_us[0], t_press), config.BTN_DEBOUNCE_MS * 1000)
+            self.app.pin_btn.value(1)
+            await aio.sleep_ms(100)
+
+        self.run_tasks(scenario)
+        self.assertLess(self.app.door_latency_us, config.BTN_DEBOUNCE_MS * 1000)
+
+    def test_button_bounce_opens_once(self):
+        async def scenario():
+            now = inputs.ticks_us()
+            for i, level in enumerate([0, 1, 0, 1, 0]): # Contact bounce
+                self.app.pin_btn.inject(level, now + i * 1000)
+            await aio.sleep_ms(100)
+            self.app.pin_btn.value(1)
+            await aio.sleep_ms(100)
+
+        self.run_tasks(scenario)
+        self.assertEqual(self.door, [1, 0])
+
+    def test_long_press_starts_provisioning(self):
+        started = []
+
+        async def provisioning(timeout_ms=600000):
+            started.append(True)
+        self.app.start_ble_provisioning = provisioning
+
+        async def scenario():
+            now = inputs.ticks_us()
+            self.app.pin_btn.inject(0, now - 10500000) # Held for 10.5 s
+            await aio.sleep_ms(50)
+            self.app.pin_btn.value(1)
+            await aio.sleep_ms(100)
+
+        self.run_tasks(scenario)
+        self.assertEqual(started, [True])
+        self.assertEqual(self.door, [1, 0]) # Opened on the press, as any press
+
+
+if __name__ == '__main__':
+    unittest.main()
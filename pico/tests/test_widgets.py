@@ -0,0 +1,146 @@
+# tests/test_widgets.py
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# Add tests to path for mocks
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from epd_mock import RecordingEPD
+
+import hal
+from canvas import Canvas
+from main import DoorbellApp
+from widgets import Box, Label, ProgressBar, Screen
+
+
+def make_canvas(rotation=180):
+    return Canvas(bytearray(5000), 200, 200, rotation=rotation)
+
+
+class TestScreen(unittest.TestCase):
+    def setUp(self):
+        self.title = Label(10, 15, "TITLE", 24)
+        self.a = Label(10, 60, "A", 16, w=100)
+        self.b = Label(10, 100, "B", 16, w=100)
+        self.bar = ProgressBar(16, 145, 168, 16)
+        self.screen = Screen((self.title, Box(2, 2, 196, 196)), (self.a, self.b, self.bar))
+
+        template = make_canvas()
+        template.fill(1)
+        self.screen.paint_static(template)
+        self.template = template.buf
+
+    def full_render(self):
+        fb = make_canvas()
+        fb.buf[:] = self.template
+        self.screen.invalidate()
+        self.assertIsNone(self.screen.render(fb))
+        return fb
+
+    def test_setters_mark_only_changed_widgets_dirty(self):
+        self.full_render()
+        self.a.set_text("A")
+        self.bar.set_value(0)
+        self.assertFalse(self.a.dirty or self.b.dirty or self.bar.dirty)
+
+        self.a.set_text("CHANGED")
+        self.assertTrue(self.a.dirty)
+        self.assertFalse(self.b.dirty or self.bar.dirty)
+
+    def test_incremental_render_matches_full_render(self):
+        fb = self.full_render()
+        self.a.set_text("CHANGED")
+        self.bar.set_value(2, 3)
+        rects = self.screen.render(fb, self.template)
+
+        self.assertEqual(rects, [(8, 60, 104, 16), (16, 145, 168, 16)])
+        self.assertEqual(fb.buf, self.full_render().buf)
+
+    def test_nothing_dirty_restores_nothing(self):
+        fb = self.full_render()
+        self.assertEqual(self.screen.render(fb, self.template), [])
+
+    def test_overlapping_widgets_are_merged_and_redrawn(self):
+        self.b.y = 70 # Overlaps a
+        fb = self.full_render()
+
+        self.b.set_text("BB")
+        rects = self.screen.render(fb, self.template)
+        self.assertEqual(rects, [(8, 70, 104, 16)])
+        self.assertEqual(fb.buf, self.full_render().buf) # a drawn again, not erased
+
+    def test_hidden_widget_is_erased(self):
+        fb = self.full_render()
+        self.bar.set_visible(False)
+        self.screen.render(fb, self.template)
+        self.assertEqual(fb.buf, self.full_render().buf)
+        self.assertEqual(fb.buf[39 * 25:55 * 25], self.template[39 * 25:55 * 25]) # Bar rows, panel orientation
+
+    def test_shorter_text_clears_previous_text(self):
+        label = Label(10, 60, "A LONG TEXT", 16)
+        self.screen = Screen((Box(2, 2, 196, 196),), (label,))
+        template = make_canvas()
+        template.fill(1)
+        self.screen.paint_static(template)
+        self.template = template.buf
+        fb = self.full_render()
+
+        x, y, w, h = label.bounds()
+        label.set_text("T")
+        self.assertEqual(self.screen.render(fb, self.template), [(8, y, (x + w + 7 & ~7) - 8, h)])
+        self.assertEqual(fb.buf, self.full_render().buf)
+
+        label.x = 190
+        label.right = True
+        label.set_text("RIGHT")
+        self.screen.render(fb, self.template)
+        self.assertEqual(fb.buf, self.full_render().buf) # Moved: the old position is cleared
+
+    def test_right_aligned_label_bounds(self):
+        label = Label(190, 187, "v1", 8, right=True)
+        x, _, w, _ = label.bounds()
+        self.assertEqual(x + w, 190)
+
+
+class TestAppScreens(unittest.TestCase):
+    def setUp(self):
+        self.hal = hal.HardwareAbstractionLayer()
+        self.epd = RecordingEPD()
+        self.hal._epd = self.epd
+        self.hal.is_wifi_connected = lambda: True
+        self.app = DoorbellApp(self.hal)
+        self.app.wifi_creds = {"ssid": "test", "pwd": "test"}
+        self.app.app_mode = "LISTEN"
+
+    def test_last_call_change_sends_only_its_label(self):
+        self.app.display_update()
+        self.app.last_call_str = "JAN 10 14:30"
+        self.app.display_update()
+
+        name, image, rects = self.epd.calls[-2]
+        self.assertEqual(name, "display_partial")
+        self.assertEqual(rects, [self.app._panel_rect((8, 155, 192, 16))])
+
+        # Same frame as drawing the screen from scratch
+        other = DoorbellApp(self.hal)
+        other.wifi_creds = self.app.wifi_creds
+        other.last_call_str = "JAN 10 14:30"
+        _, buf = other.render_screen("LISTEN")
+        self.assertEqual(image, bytes(buf))
+
+    def test_other_screen_in_between_redraws_everything(self):
+        self.app.display_update()
+        self.app.display_ota_progress(1, 3)
+        self.app.display_update()
+
+        other = DoorbellApp(self.hal)
+        other.wifi_creds = self.app.wifi_creds
+        _, buf = other.render_screen("LISTEN")
+        self.assertEqual(self.epd.calls[-2][1], bytes(buf))
+
+
+if __name__ == '__main__':
+    unittest.main()
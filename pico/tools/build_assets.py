@@ -0,0 +1,66 @@
+# build_assets.py
+"""
+Pre-renders the fixed screens (DoorbellApp.ASSET_SCREENS) as PackBits
+compressed 1bpp frames in panel orientation, one module per screen
+(src/asset_<name>.py). The firmware imports only the module of the screen
+it shows, streams it straight into the display RAM and unloads it again.
+
+Run after changing any of these screens or bumping the firmware version:
+    python tools/build_assets.py
+"""
+import os
+import sys
+
+# Add src and lib to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "lib")))
+
+import hal
+import rle
+from canvas import frame_digest
+from main import DoorbellApp
+from version import FW_VERSION
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+
+
+def render_assets(app):
+    """Returns {name: (digest, packed frame)} for every asset screen."""
+    assets = {}
+    for name in app.ASSET_SCREENS:
+        _, buf = app.render_screen(name)
+        assets[name] = (frame_digest(buf), rle.pack(buf))
+    return assets
+
+
+def module_path(name):
+    return os.path.join(SRC, DoorbellApp.asset_module(name) + ".py")
+
+
+def format_module(digest, data, rotation):
+    lines = [
+        "# AUTOGENERATED by tools/build_assets.py – DO NOT EDIT",
+        f'FW_VERSION = "{FW_VERSION}"',
+        f"ROTATION = {rotation}",
+        f"DIGEST = 0x{digest:08x}",
+        "",
+        "# PackBits frame",
+        "DATA = (",
+    ]
+    for i in range(0, len(data), 16):
+        lines.append(f"    {bytes(data[i:i + 16])!r}")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    app = DoorbellApp(hal.HardwareAbstractionLayer())
+    for name, (digest, data) in render_assets(app).items():
+        path = module_path(name)
+        with open(path, "w") as f:
+            f.write(format_module(digest, data, app.rotation))
+        print(f"Wrote {path}: {len(data)} bytes")
+
+
+if __name__ == "__main__":
+    main()
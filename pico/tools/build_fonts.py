@@ -0,0 +1,129 @@
+# build_fonts.py
+"""
+Builds the proportional bitmap fonts in src/font<size>.py from a TrueType
+font (DejaVu Sans Bold by default), rendered without anti-aliasing.
+
+Each size is the glyph height in pixels. Unless given, the TrueType size is
+the largest whose capitals, digits and descenders fit that height (taller
+glyphs such as brackets are clipped). Glyphs are as wide as their advance.
+
+    python tools/build_fonts.py [path/to/font.ttf]
+
+Needs Pillow.
+"""
+import os
+import sys
+
+from PIL import Image, ImageDraw, ImageFont
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+DEFAULT_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+PRINTABLE = "".join(chr(c) for c in range(32, 127))
+UPPER = " !\"#%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[]_"
+
+# Glyphs that must fit the height
+FIT_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789gjpqy"
+
+# Height -> (characters included, TrueType size or None to fit).
+# The small font trades descender room for legible capitals; the large font
+# skips lowercase to save RAM.
+SIZES = {
+    8: (PRINTABLE, 9),
+    16: (PRINTABLE, None),
+    24: (UPPER, None),
+}
+
+
+def _ink_rows(font, chars):
+    """Returns (top, bottom) of the ink of all chars drawn on a common baseline."""
+    top, bottom = None, None
+    for ch in chars:
+        box = font.getbbox(ch, anchor="ls")
+        if box[3] <= box[1]:
+            continue
+        top = box[1] if top is None else min(top, box[1])
+        bottom = box[3] if bottom is None else max(bottom, box[3])
+    return top, bottom
+
+
+def fit_font(path, height, chars):
+    """Largest TrueType size whose chars fit into height rows, and its top row."""
+    size = height * 2
+    while size > 4:
+        font = ImageFont.truetype(path, size)
+        top, bottom = _ink_rows(font, chars)
+        if bottom - top <= height:
+            return font, top
+        size -= 1
+    raise ValueError(f"No size of {path} fits {height} px")
+
+
+def render_glyph(font, ch, top, height):
+    """Renders one glyph as packed MONO_HLSB rows; returns (width, bytes)."""
+    width = max(1, round(font.getlength(ch)))
+    img = Image.new("1", (width, height), 0)
+    draw = ImageDraw.Draw(img)
+    draw.fontmode = "1" # No anti-aliasing
+    draw.text((0, -top), ch, font=font, fill=1, anchor="ls")
+
+    stride = (width + 7) // 8
+    out = bytearray(stride * height)
+    for y in range(height):
+        for x in range(width):
+            if img.getpixel((x, y)):
+                out[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+    return width, bytes(out)
+
+
+def build(path, height, chars, ttf_size=None):
+    if ttf_size:
+        # Capitals at the top of the cell
+        font = ImageFont.truetype(path, ttf_size)
+        top = _ink_rows(font, "ABCDEFGHIJKLMNOPQRSTUVWXYZ")[0]
+    else:
+        font, top = fit_font(path, height, [ch for ch in FIT_CHARS if ch in chars])
+    widths = bytearray()
+    offsets = bytearray()
+    data = bytearray()
+    for ch in chars:
+        width, bitmap = render_glyph(font, ch, top, height)
+        widths.append(width)
+        offsets.extend((len(data) & 0xFF, len(data) >> 8))
+        data.extend(bitmap)
+    return font.size, bytes(widths), bytes(offsets), bytes(data)
+
+
+def _bytes_lines(name, data):
+    lines = [f"{name} = ("]
+    for i in range(0, len(data), 16):
+        lines.append(f"    {data[i:i + 16]!r}")
+    lines.append(")")
+    return lines
+
+
+def format_module(path, height, chars, ttf_size, widths, offsets, data):
+    lines = [
+        "# AUTOGENERATED by tools/build_fonts.py – DO NOT EDIT",
+        f"# {os.path.basename(path)} at {ttf_size} px",
+        f"HEIGHT = {height}",
+        f"CHARS = {chars!r}",
+    ]
+    lines += _bytes_lines("WIDTHS", widths)
+    lines += _bytes_lines("OFFSETS", offsets) # 16 bit little endian offsets into DATA
+    lines += _bytes_lines("DATA", data)
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_FONT
+    for height, (chars, size) in SIZES.items():
+        ttf_size, widths, offsets, data = build(path, height, chars, size)
+        out = os.path.join(SRC, f"font{height}.py")
+        with open(out, "w") as f:
+            f.write(format_module(path, height, chars, ttf_size, widths, offsets, data))
+        print(f"font{height}: {len(chars)} glyphs, {len(data)} bytes ({ttf_size} px)")
+
+
+if __name__ == "__main__":
+    main()
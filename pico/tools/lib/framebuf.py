@@ -1,13 +1,16 @@
 # framebuf.py
-# A mock for MicroPython's framebuf module for use on desktop (host).
+# A mock for MicroPython's framebuf module for use on desktop (host), using NumPy.
 # Includes a Tkinter-based real-time window for UI previewing.
 
 import threading
 import time
 
+import numpy as np
+
+# Same values as MicroPython (only the mono formats are implemented)
 MONO_VLSB = 0
-MONO_HLSB = 1
-MONO_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
 
 # Basic 8x8 font for the .text() method
 _FONT = {
@@ -139,63 +142,314 @@ class EmulatorWindow:
     def set_image(self, pil_img):
         self.q.put(pil_img)
 
+def _cdiv(a, b):
+    """Integer division truncating towards zero, like C."""
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
 class FrameBuffer:
-    def __init__(self, buffer, width, height, format=MONO_HLSB):
+    """
+    Host FrameBuffer for the MONO_VLSB, MONO_HLSB and MONO_HMSB formats,
+    backed by a zero-copy NumPy view of the buffer. Rectangles are filled
+    with byte masks; everything else works on an unpacked bit plane of the
+rows it touches, so there
+    are no per-pixel Python loops except where MicroPython's algorithms
+    (line, ellipse, poly) step pixel by pixel. Results match MicroPython's
+    modframebuf.c pixel for pixel.
+    """
+    def __init__(self, buffer, width, height, format=MONO_HLSB, stride=None):
+        if format not in (MONO_VLSB, MONO_HLSB, MONO_HMSB):
+            raise ValueError("invalid format")
         self.buffer = buffer
         self.width = width
         self.height = height
         self.format = format
+        stride = width if stride is None else stride
+        if format == MONO_VLSB:
+            self.stride = stride
+            shape = ((height + 7) >> 3, stride) # Pages of 8 rows, one byte per column
+        else:
+            self.stride = (stride + 7) & ~7 # Pixels per row, byte aligned
+            shape = (height, self.stride >> 3)
+        # Writable view for bytearray/memoryview, read-only for bytes
+        self._bytes = np.frombuffer(buffer, dtype=np.uint8, count=shape[0] * shape[1]).reshape(shape)
+        self._order = "big" if format == MONO_HLSB else "little"
+
+    # --- Helpers ---
+    def _rows(self, y0, y1):
+        """
+        The bytes holding pixel rows y0..y1-1 (a view), with the offset of
+        row y0 in their unpacked bits: for MONO_VLSB the pages around them.
+        """
+        if self.format == MONO_VLSB:
+            page = y0 >> 3
+            return self._bytes[page:(y1 + 7) >> 3], y0 - (page << 3)
+        return self._bytes[y0:y1], 0
+
+    def _plane(self, y0=0, y1=None):
+        """Pixel rows y0..y1-1 (all by default) as a (rows, width) array of 0/1 (a copy)."""
+        if y1 is None:
+            y1 = self.height
+        rows, offset = self._rows(y0, y1)
+        if self.format == MONO_VLSB:
+            bits = np.unpackbits(rows, axis=0, bitorder="little")
+        else:
+            bits = np.unpackbits(rows, axis=1, bitorder=self._order)
+        return bits[offset:offset + y1 - y0, :self.width]
+
+    def _store(self, plane, y0=0):
+        """Writes the rows of plane back from row y0, keeping any padding bits."""
+        y1 = y0 + plane.shape[0]
+        rows, offset = self._rows(y0, y1)
+        if self.format == MONO_VLSB:
+            bits = np.unpackbits(rows, axis=0, bitorder="little")
+            bits[offset:offset + y1 - y0, :self.width] = plane
+            rows[:] = np.packbits(bits, axis=0, bitorder="little")
+        else:
+            bits = np.unpackbits(rows, axis=1, bitorder=self._order)
+            bits[:, :self.width] = plane
+            rows[:] = np.packbits(bits, axis=1, bitorder=self._order)
 
+    def _paint(self, mask, x, y, c):
+        """Sets the pixels where the bool array mask is True to colour c (clipped)."""
+        h, w = mask.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.width), min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        plane = self._plane(y0, y1) # Only the rows it covers
+        plane[:, x0:x1][mask[y0 - y:y1 - y, x0 - x:x1 - x]] = 1 if c else 0
+        self._store(plane, y0)
+
+    def _setpixel(self, x, y, c):
+        if self.format == MONO_VLSB:
+            index = ((y >> 3), x)
+            bit = 1 << (y & 7)
+        elif self.format == MONO_HLSB:
+            index = (y, x >> 3)
+            bit = 0x80 >> (x & 7)
+        else:
+            index = (y, x >> 3)
+            bit = 1 << (x & 7)
+        if c is None:
+            return 1 if self._bytes[index] & bit else 0
+        if c:
+            self._bytes[index] |= bit
+        else:
+            self._bytes[index] &= ~bit & 0xFF
+
+    def _setpixel_checked(self, x, y, c, mask=1):
+        if mask and 0 <= x < self.width and 0 <= y < self.height:
+            self._setpixel(x, y, c)
+
+    # --- framebuf API ---
     def pixel(self, x, y, c=None):
         if not (0 <= x < self.width and 0 <= y < self.height):
-            return 1 # Default to white/off if out of bounds
+            return None
+        return self._setpixel(x, y, c)
 
-        if self.format == MONO_HLSB:
-            byte_idx = (y * self.width + x) // 8
-            bit_idx = 7 - (x % 8)
-            if c is None:
-                return (self.buffer[byte_idx] >> bit_idx) & 1
+    def fill(self, c):
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        if h < 1 or w < 1 or x + w <= 0 or y + h <= 0 or y >= self.height or x >= self.width:
+            return
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.width), min(y + h, self.height)
+        if self.format == MONO_VLSB:
+            mask = _span_mask(self._bytes.shape[0], y0, y1, "little")[:, None]
+            target = self._bytes[:, x0:x1]
+        else:
+            mask = _span_mask(self.stride >> 3, x0, x1, self._order)
+            target = self._bytes[y0:y1]
+        if c:
+            target |= mask
+        else:
+            target &= ~mask
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        # Bresenham, exactly as modframebuf.c
+        dx = x2 - x1
+        sx = 1 if dx > 0 else -1
+        dx = abs(dx)
+        dy = y2 - y1
+        sy = 1 if dy > 0 else -1
+        dy = abs(dy)
+        steep = dy > dx
+        if steep:
+            x1, y1 = y1, x1
+            dx, dy = dy, dx
+            sx, sy = sy, sx
+        e = 2 * dy - dx
+        for _ in range(dx):
+            if steep:
+                self._setpixel_checked(y1, x1, c)
             else:
-                if c:
-                    self.buffer[byte_idx] |= (1 << bit_idx)
-                else:
-                    self.buffer[byte_idx] &= ~(1 << bit_idx)
-        return 1
+                self._setpixel_checked(x1, y1, c)
+            while e >= 0:
+                y1 += sy
+                e -= 2 * dx
+            x1 += sx
+            e += 2 * dy
+        self._setpixel_checked(x2, y2, c)
 
-    def fill(self, c):
-        val = 0xFF if c else 0x00
-        for i in range(len(self.buffer)):
-            self.buffer[i] = val
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0x0F):
+        # Quadrant mask: bit 0 = Q1 (top right), then counter-clockwise
+        mask = m & 0x0F
+        if xr == 0 and yr == 0:
+            self._setpixel_checked(x, y, c, mask)
+            return
+        two_asquare = 2 * xr * xr
+        two_bsquare = 2 * yr * yr
+
+        def points(px, py):
+            if f:
+                if mask & 1:
+                    self.fill_rect(x, y - py, px + 1, 1, c)
+                if mask & 2:
+                    self.fill_rect(x - px, y - py, px + 1, 1, c)
+                if mask & 4:
+                    self.fill_rect(x - px, y + py, px + 1, 1, c)
+                if mask & 8:
+                    self.fill_rect(x, y + py, px + 1, 1, c)
+            else:
+                self._setpixel_checked(x + px, y - py, c, mask & 1)
+                self._setpixel_checked(x - px, y - py, c, mask & 2)
+                self._setpixel_checked(x - px, y + py, c, mask & 4)
+                self._setpixel_checked(x + px, y + py, c, mask & 8)
+
+        px, py = xr, 0
+        xchange = yr * yr * (1 - 2 * xr)
+        ychange = xr * xr
+        error = 0
+        stoppingx = two_bsquare * xr
+        stoppingy = 0
+        while stoppingx >= stoppingy:
+            points(px, py)
+            py += 1
+            stoppingy += two_asquare
+            error += ychange
+            ychange += two_asquare
+            if 2 * error + xchange > 0:
+                px -= 1
+                stoppingx -= two_bsquare
+                error += xchange
+                xchange += two_bsquare
+
+        px, py = 0, yr
+        xchange = yr * yr
+        ychange = xr * xr * (1 - 2 * yr)
+        error = 0
+        stoppingx = 0
+        stoppingy = two_asquare * yr
+        while stoppingx <= stoppingy:
+            points(px, py)
+            px += 1
+            stoppingx += two_bsquare
+            error += xchange
+            xchange += two_bsquare
+            if 2 * error + ychange > 0:
+                py -= 1
+                stoppingy -= two_asquare
+                error += ychange
+                ychange += two_asquare
+
+    def poly(self, x, y, coords, c, f=False):
+        n = len(coords) // 2
+        if n == 0:
+            return
+        # Edges are walked from the last vertex backwards, as in modframebuf.c
+        edges = []
+        px1, py1 = coords[0], coords[1]
+        for i in range(n - 1, -1, -1):
+            px2, py2 = coords[2 * i], coords[2 * i + 1]
+            edges.append((px1, py1, px2, py2))
+            px1, py1 = px2, py2
+
+        if not f:
+            for px1, py1, px2, py2 in edges:
+                self.line(x + px1, y + py1, x + px2, y + py2, c)
+            return
+
+        ys = coords[1:2 * n:2]
+        for row in range(min(ys), max(ys) + 1):
+            nodes = []
+            for px1, py1, px2, py2 in edges:
+                if py1 != py2 and ((py1 > row >= py2) or (py1 <= row < py2)):
+                    nodes.append(_cdiv(32 * px1 + _cdiv(32 * (px2 - px1) * (row - py1), py2 - py1) + 16, 32))
+                elif row == max(py1, py2):
+                    # Local minima and horizontal edges, missed by the nodes
+                    if py1 < py2:
+                        self._setpixel_checked(x + px2, y + py2, c)
+                    elif py2 < py1:
+                        self._setpixel_checked(x + px1, y + py1, c)
+                    else:
+                        self.line(x + px1, y + py1, x + px2, y + py2, c)
+            nodes.sort()
+            for i in range(0, len(nodes) - 1, 2):
+                self.fill_rect(x + nodes[i], y + row, nodes[i + 1] - nodes[i] + 1, 1, c)
+
+    def scroll(self, xstep, ystep):
+        """Shifts the content; the uncovered area keeps its old pixels."""
+        w, h = self.width, self.height
+        if abs(xstep) >= w or abs(ystep) >= h:
+            return
+        y0, y1 = max(0, ystep), h - max(0, -ystep) # Rows that change
+        plane = self._plane()
+        src = plane[max(0, -ystep):h - max(0, ystep), max(0, -xstep):w - max(0, xstep)]
+        plane[y0:y1, max(0, xstep):w - max(0, -xstep)] = src.copy()
+        self._store(plane[y0:y1], y0)
 
     def text(self, text, x, y, c=1):
-        for i, char in enumerate(text):
-            glyph = _FONT.get(char.upper(), _FONT[' '])
-            for gy in range(8):
-                row = glyph[gy]
-                for gx in range(8):
-                    if (row >> (7 - gx)) & 1:
-                        self.pixel(x + i*8 + gx, y + gy, c)
-
-    def rect(self, x, y, w, h, c):
-        for i in range(x, x + w):
-            self.pixel(i, y, c)
-            self.pixel(i, y + h - 1, c)
-        for j in range(y, y + h):
-            self.pixel(x, j, c)
-            self.pixel(x + w - 1, j, c)
+        if not text:
+            return
+        mask = np.concatenate([_glyph_mask(char) for char in text], axis=1)
+        self._paint(mask, x, y, c)
 
-    def fill_rect(self, x, y, w, h, c):
-        for i in range(x, x + w):
-            for j in range(y, y + h):
-                self.pixel(i, j, c)
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        """Copies fbuf (FrameBuffer or (buffer, width, height, format[, stride])) to (x, y)."""
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        if x >= self.width or y >= self.height or -x >= fbuf.width or -y >= fbuf.height:
+            return
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + fbuf.width, self.width), min(y + fbuf.height, self.height)
+        src = fbuf._plane(y0 - y, y1 - y)[:, x0 - x:x1 - x]
+        if palette is not None:
+            src = np.array([palette.pixel(i, 0) for i in (0, 1)], dtype=np.uint8)[src]
+        plane = self._plane(y0, y1) # Only the rows it covers
+        dst = plane[:, x0:x1]
+        if key == -1:
+            dst[:] = src != 0
+        else:
+            copy = src != key
+            dst[copy] = src[copy] != 0
+        self._store(plane, y0)
 
+    # --- Host only ---
     def to_pil(self):
         from PIL import Image
-        img = Image.new("L", (self.width, self.height), 255)
-        pixels = img.load()
-        for y in range(self.height):
-            for x in range(self.width):
-                pixels[x, y] = 255 if self.pixel(x, y) else 0
+        if self.format == MONO_HLSB:
+            # MONO_HLSB rows are PIL's packed "1" format as is, set bit = white
+            img = Image.frombuffer("1", (self.width, self.height), self._bytes, "raw", "1", self.stride >> 3, 1)
+        else:
+            img = Image.fromarray(self._plane() * 255).convert("1")
         # Physical screen orientation fix
         return img.transpose(Image.ROTATE_180)
 
@@ -210,3 +464,28 @@ class FrameBuffer:
         while not hasattr(win, "canvas") and time.time() - start_time < 5:
             time.sleep(0.1)
         win.set_image(self.to_pil())
+
+
+def _span_mask(count, start, end, bitorder):
+    """Per byte masks of the bits start..end-1 in count packed bytes."""
+    # Not np.packbits: that allocates a few KB of scratch on every call
+    first = np.arange(0, count * 8, 8, dtype=np.int16)
+    lo = np.clip(start - first, 0, 8)
+    hi = np.clip(end - first, 0, 8)
+    if bitorder == "big":
+        mask = (0xFF >> lo) & ~(0xFF >> hi)
+    else:
+        mask = (0xFF << lo) & ~(0xFF << hi)
+    return mask.astype(np.uint8)
+
+
+_GLYPH_MASKS = {}
+
+def _glyph_mask(char):
+    """8x8 bool array of a font character (cached)."""
+    mask = _GLYPH_MASKS.get(char)
+    if mask is None:
+        rows = _FONT.get(char.upper(), _FONT[' '])
+        mask = np.unpackbits(np.array(rows, dtype=np.uint8)).reshape(8, 8).astype(bool)
+        _GLYPH_MASKS[char] = mask
+    return mask
@@ -0,0 +1,361 @@
+# ssd1681.py
+"""
+Host emulator of the SSD1681 e-paper controller (Waveshare 1.54" V2).
+
+It parses the 4-wire SPI stream that epaper1in54.EPD sends and keeps the
+controller state: both RAM banks (0x24 new image, 0x26 previous image),
+the RAM window and address counters, the update control value, the
+uploaded LUT and deep sleep. Activating an update copies RAM to the
+emulated panel the way the controller does: DISPLAY Mode 1 drives every
+pixel, Mode 2 only the pixels where 0x24 differs from 0x26. A stale 0x26
+therefore leaves stale pixels on the panel, just like on the real one.
+
+The BUSY pin stays HIGH for as long as the operation takes on the real
+panel (BUSY_MS) and its falling edge fires the pin IRQ from a timer thread.
+Writes over SPI take the time they need at the configured baud rate.
+time_scale scales all of it (0 = no delays, for tests).
+
+    emu = SSD1681()
+    epd = EPD(*emu.pins(), read=emu.read)
+
+emu.temperature is what the built-in temperature sensor measures; an
+update with the load temperature bit (0x22 bit 5) latches it into the
+temperature register, which 0x1B reads back.
+
+Protocol mistakes (commands while BUSY or in deep sleep, unknown commands)
+are collected in emu.errors; emu.log records every operation with its
+emulated duration.
+"""
+import threading
+import time
+
+WIDTH = 200
+HEIGHT = 200
+STRIDE = WIDTH >> 3
+
+# BUSY HIGH durations in ms. Typical values for this panel at room
+# temperature; tools/trace_epd_v2.py measures them on a real panel and
+# prints a replacement for this table.
+BUSY_MS = {
+    "reset": 2,           # Hardware reset (RST pulse)
+    "soft_reset": 3,      # 0x12
+    "power": 1,           # Update without DISPLAY (clock/analog on or off)
+    "full": 2000,         # DISPLAY Mode 1, OTP waveform
+    "partial": 650,       # DISPLAY Mode 2, OTP waveform
+    "lut_overhead": 40,   # DISPLAY with a custom LUT: fixed part...
+    "lut_frame": 20,      # ...plus this per LUT frame
+}
+
+# Commands taking data that is stored as is
+_REGISTERS = (0x01, 0x03, 0x04, 0x0C, 0x18, 0x21, 0x2C, 0x37, 0x3C, 0x3F)
+
+
+def lut_frames(lut):
+    """Number of frames the waveform in a 153 byte LUT (command 0x32) takes."""
+    frames = 0
+    for group in range(12):
+        tpa, tpb, srab, tpc, tpd, srcd, rp = lut[60 + group * 7:67 + group * 7]
+        frames += ((tpa + tpb) * (srab + 1) + (tpc + tpd) * (srcd + 1)) * (rp + 1)
+    return frames
+
+
+class _OutputPin:
+    """Pin driven by the host (CS, DC, RST)."""
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, emulator, name, value):
+        self._emulator = emulator
+        self.name = name
+        self._value = value
+
+    def value(self, val=None):
+        if val is not None:
+            val = 1 if val else 0
+            if val != self._value:
+                self._value = val
+                self._emulator._pin_changed(self.name, val)
+        return self._value
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+
+class _BusyPin:
+    """BUSY output of the controller, with IRQ support."""
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, emulator):
+        self._emulator = emulator
+        self._handler = None
+        self._trigger = 0
+
+    def value(self, val=None):
+        return 1 if self._emulator.is_busy() else 0
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING):
+        self._handler = handler
+        self._trigger = trigger
+
+    def _edge(self, edge):
+        if self._handler and self._trigger & edge:
+            self._handler(self)
+
+
+class _SPI:
+    def __init__(self, emulator):
+        self._emulator = emulator
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def write(self, data):
+        self._emulator._spi_write(data)
+
+
+class SSD1681:
+    def __init__(self, time_scale=1.0, baudrate=4000000, busy_ms=None):
+        self.time_scale = time_scale
+        self.baudrate = baudrate
+        self.busy_ms = dict(BUSY_MS)
+        if busy_ms:
+            self.busy_ms.update(busy_ms)
+        self.show = False # Push each refresh to the framebuf emulator window
+        self.temperature = 25.0 # Built-in sensor, °C
+
+        self.cs = _OutputPin(self, "cs", 1)
+        self.dc = _OutputPin(self, "dc", 0)
+        self.rst = _OutputPin(self, "rst", 1)
+        self.busy = _BusyPin(self)
+        self.spi = _SPI(self)
+
+        self.ram = {0x24: bytearray(STRIDE * HEIGHT), 0x26: bytearray(STRIDE * HEIGHT)}
+        self.panel = bytearray(b"\xff" * (STRIDE * HEIGHT)) # What the panel shows
+        self.errors = []
+        self.log = [] # (host ms, operation, emulated duration ms)
+        self.refreshes = {"full": 0, "partial": 0, "lut": 0}
+        self.spi_bytes = 0
+        self.spi_ms = 0.0 # Emulated SPI transfer time
+
+        self._lock = threading.Lock()
+        self._busy_until = 0.0
+        self._timer = None
+        self._spi_debt = 0.0
+        self._command = None
+        self._args = bytearray()
+        self.asleep = False
+        self._reset_registers()
+
+    def pins(self):
+        """Returns (spi, cs, dc, rst, busy) as taken by epaper1in54.EPD."""
+        return self.spi, self.cs, self.dc, self.rst, self.busy
+
+    def _reset_registers(self):
+        self.registers = {}
+        self.lut = None # None = OTP waveform
+        self.update_control = 0xFF
+        self.temperature_register = 0 # 12 bit, 1/16 °C
+        self.entry_mode = 0x03
+        self.window = (0, STRIDE - 1, 0, HEIGHT - 1) # x bytes, y rows, inclusive
+        self.x = 0
+        self.y = 0
+
+    # --- Timing ---
+
+    def _now(self):
+        return time.monotonic() * 1000
+
+    def is_busy(self):
+        return self._now() < self._busy_until
+
+    def _start_busy(self, operation, ms):
+        """Drives BUSY HIGH for ms (emulated), then fires the falling edge."""
+        self.log.append((self._now(), operation, ms))
+        scaled = ms * self.time_scale
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._busy_until = self._now() + scaled
+            self._timer = threading.Timer(scaled / 1000, self._busy_done)
+            self._timer.args = (self._timer,)
+            self._timer.daemon = True
+            self._timer.start()
+        self.busy._edge(_BusyPin.IRQ_RISING)
+
+    def _busy_done(self, timer):
+        with self._lock:
+            if timer is not self._timer:
+                return # Superseded by a newer operation
+            self._timer = None
+        self.busy._edge(_BusyPin.IRQ_FALLING)
+
+    def wait_idle(self):
+        """Blocks until BUSY is LOW (for tests and tools)."""
+        while self.is_busy() or self._timer is not None:
+            time.sleep(0.001)
+
+    # --- Pins and SPI ---
+
+    def _pin_changed(self, name, value):
+        if name == "cs" and value:
+            self._finish_command()
+        elif name == "rst" and value:
+            # Rising edge ends the reset pulse
+            self._finish_command()
+            self.asleep = False
+            self._reset_registers()
+            self._start_busy("reset", self.busy_ms["reset"])
+
+    def read(self, n):
+        """Read function for the EPD driver: the controller answering on SDA."""
+        if self.cs.value() or self.dc.value() == 0 or self._command != 0x1B:
+            self._error("Read outside of a register read (0x1B)")
+            return bytearray(n)
+        t = self.temperature_register
+        return bytearray(((t >> 4) & 0xFF, (t << 4) & 0xF0))[:n]
+
+    def _spi_write(self, data):
+        if self.cs.value():
+            return # Not selected
+        n = len(data)
+        self.spi_bytes += n
+        ms = n * 8000 / self.baudrate
+        self.spi_ms += ms
+        if self.time_scale:
+            self._spi_debt += ms * self.time_scale
+            if self._spi_debt >= 1:
+                time.sleep(self._spi_debt / 1000)
+                self._spi_debt = 0.0
+
+        if self.dc.value() == 0:
+            for command in bytes(data):
+                self._finish_command()
+                self._start_command(command)
+        elif self._command in (0x24, 0x26):
+            self._write_ram(self.ram[self._command], data)
+        elif self._command is not None:
+            self._args.extend(data)
+
+    # --- Commands ---
+
+    def _error(self, message):
+        self.errors.append(message)
+
+    def _start_command(self, command):
+        if self.asleep:
+            self._error(f"Command 0x{command:02X} in deep sleep")
+            return
+        if self.is_busy():
+            self._error(f"Command 0x{command:02X} while BUSY")
+        self._command = command
+        self._args = bytearray()
+        if command in (0x24, 0x26) and self.entry_mode != 0x03:
+            self._error(f"Data entry mode 0x{self.entry_mode:02X} not emulated")
+
+    def _finish_command(self):
+        command = self._command
+        if command is None:
+            return
+        self._command = None
+        args = self._args
+
+        if command in (0x24, 0x26):
+            pass # Written while streaming
+        elif command == 0x12:
+            self._reset_registers()
+            self._start_busy("soft_reset", self.busy_ms["soft_reset"])
+        elif command == 0x10:
+            if args and args[0] & 0x03:
+                self.asleep = True
+        elif command == 0x11:
+            self.entry_mode = args[0]
+        elif command == 0x44:
+            self.window = (args[0] & 0x3F, args[1] & 0x3F, self.window[2], self.window[3])
+        elif command == 0x45:
+            self.window = (self.window[0], self.window[1],
+                           args[0] | (args[1] & 1) << 8, args[2] | (args[3] & 1) << 8)
+        elif command == 0x4E:
+            self.x = args[0] & 0x3F
+        elif command == 0x4F:
+            self.y = args[0] | (args[1] & 1) << 8
+        elif command == 0x32:
+            self.lut = bytes(args[:153])
+        elif command == 0x22:
+            self.update_control = args[0]
+        elif command == 0x20:
+            self._activate()
+        elif command == 0x1A:
+            self.temperature_register = (args[0] << 4 | args[1] >> 4) & 0xFFF
+        elif command == 0x1B:
+            pass # Read by read()
+        elif command in _REGISTERS:
+            self.registers[command] = bytes(args)
+        else:
+            self._error(f"Unknown command 0x{command:02X}")
+
+    def _write_ram(self, ram, data):
+        """Writes data at the address counter, wrapping inside the window."""
+        x_start, x_end, y_start, y_end = self.window
+        x, y = self.x, self.y
+        i = 0
+        n = len(data)
+        while i < n:
+            take = min(x_end - x + 1, n - i)
+            if take <= 0 or y >= HEIGHT:
+                self._error("RAM write outside of the window")
+                break
+            offset = y * STRIDE + x
+            ram[offset:offset + take] = data[i:i + take]
+            i += take
+            x += take
+            if x > x_end:
+                x = x_start
+                y = y_start if y >= y_end else y + 1
+        self.x, self.y = x, y
+
+    def _activate(self):
+        """Master activation (0x20): runs the Display Update Control 2 sequence."""
+        control = self.update_control
+        if control & 0x20:
+            self.temperature_register = round(self.temperature * 16) & 0xFFF
+        if control & 0x10:
+            self.lut = None # Loads the OTP waveform
+        if not control & 0x04:
+            self._start_busy("power", self.busy_ms["power"])
+            return
+
+        new = self.ram[0x24]
+        if control & 0x08:
+            # DISPLAY Mode 2: only pixels that differ from the previous image
+            changed = int.from_bytes(new, "big") ^ int.from_bytes(self.ram[0x26], "big")
+            panel = int.from_bytes(self.panel, "big")
+            panel = (panel & ~changed) | (int.from_bytes(new, "big") & changed)
+            self.panel[:] = panel.to_bytes(len(self.panel), "big")
+        else:
+            self.panel[:] = new
+
+        if self.lut is not None:
+            kind = "lut"
+            ms = self.busy_ms["lut_overhead"] + lut_frames(self.lut) * self.busy_ms["lut_frame"]
+        else:
+            kind = "partial" if control & 0x08 else "full"
+            ms = self.busy_ms[kind]
+        self.refreshes[kind] += 1
+        self._start_busy(kind, ms)
+        if self.show:
+            self.framebuffer().show()
+
+    # --- Output ---
+
+    def framebuffer(self):
+        """The panel contents as a (host mock) framebuf.FrameBuffer."""
+        import framebuf
+        return framebuf.FrameBuffer(self.panel, WIDTH, HEIGHT, framebuf.MONO_HLSB)
+
+    def to_png(self, filename):
+        """Saves what the panel shows, as mounted."""
+        self.framebuffer().to_png(filename)
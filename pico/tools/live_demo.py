@@ -15,6 +15,8 @@ def run_live_demo():
     print("The emulator window should appear shortly.")
 
     hw = hal.HardwareAbstractionLayer()
+    hw.get_epd() # Emulated SSD1681, with real refresh times
+    hw.epd_emulator.show = True
     app = DoorbellApp(hw)
 
     # 0. Initial Refresh
@@ -60,10 +62,7 @@ def run_live_demo():
 
     # 7. Setup Success
     print("Step 7: Setup Successful")
-    fb, buf = app._get_fb()
-    app.draw_scaled_text(fb, "PICOBELL", 10, 15, scale=3)
-    fb.rect(2, 2, 196, 196, 0)
-    app.draw_setup_screen(fb, status="SAVED")
+    fb, buf = app.render_screen("SETUP_SAVED")
     app._rotate_and_display(fb, buf)
     time.sleep(4)
 
@@ -0,0 +1,111 @@
+# time_scenarios.py
+"""
+Times end-to-end scenarios on the host against the emulated SSD1681, with
+the refresh times of the real panel (see tools/lib/ssd1681.py BUSY_MS).
+Prints the stats counters of each scenario, to compare with a device run,
+and the host time to draw each screen.
+
+    python tools/time_scenarios.py [time_scale]
+"""
+import os
+import sys
+import time
+
+# Add src and lib to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "lib")))
+
+import aio
+import config
+import hal
+import stats
+from main import DoorbellApp
+
+
+def ring_display_door(app):
+    aio.run(app.send_ring_event())
+    app.pulse_door()
+    print(f"  command -> relay: {app.door_latency_us} us")
+    while not app.display_idle():
+        app.display_service()
+        time.sleep(0.005)
+
+
+# Time to download one file during OTA
+DOWNLOAD_S = 0.5
+
+
+def ota_progress(app):
+    for i in range(1, 6):
+        app.display_ota_progress(i, 5)
+        time.sleep(DOWNLOAD_S)
+    app.display_ota_progress(5, 5, is_done=True)
+
+
+SCENARIOS = {
+    "ring -> display -> door": ring_display_door,
+    "OTA progress (5 files)": ota_progress,
+}
+
+
+def run(name, scenario, time_scale):
+    hw = hal.HardwareAbstractionLayer()
+    epd = hw.get_epd()
+    emu = hw.epd_emulator
+    emu.time_scale = time_scale
+    app = DoorbellApp(hw)
+    app.wifi_creds = {"ssid": "demo", "pwd": "demo"}
+    app.app_mode = "LISTEN"
+    app.display_update()
+    epd.wait_refresh()
+    app.display_service()
+    del emu.log[:]
+    stats.reset()
+
+    t0 = time.monotonic()
+    scenario(app)
+    t_return = time.monotonic()
+    emu.wait_idle()
+    epd.wait_refresh()
+    app.display_service()
+    t_idle = time.monotonic()
+
+    print(f"{name}:")
+    print(f"  returned after {(t_return - t0) * 1000:.0f} ms, panel idle after {(t_idle - t0) * 1000:.0f} ms")
+    for t, op, ms in emu.log:
+        print(f"  {(t / 1000 - t0) * 1000:8.0f} ms  {op:<10} {ms} ms")
+    print("  Counters:", stats.snapshot())
+    if emu.errors:
+        print("  Protocol errors:", emu.errors)
+
+
+# Screens timed by render_times()
+RENDER_SCREENS = ("START", "LISTEN", "SETUP", "SETUP_SAVED", "OPEN", "OTA")
+RENDER_RUNS = 20
+
+
+def render_times():
+    """Average time to redraw each screen into the back buffer, after a first draw."""
+    app = DoorbellApp(hal.HardwareAbstractionLayer())
+    app.wifi_creds = {"ssid": "demo", "pwd": "demo"}
+    print("Render times:")
+    for mode in RENDER_SCREENS:
+        app.render_screen(mode) # Warm-up: templates, fonts, glyph caches
+        t0 = time.perf_counter()
+        for _ in range(RENDER_RUNS):
+            app.render_screen(mode)
+        print(f"  {mode:<12} {(time.perf_counter() - t0) * 1000 / RENDER_RUNS:.3f} ms")
+
+
+def main():
+    time_scale = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    if config.API_KEY is None:
+        config.API_KEY = "demo"
+    stats.enable()
+    for name, scenario in SCENARIOS.items():
+        run(name, scenario, time_scale)
+    render_times()
+
+
+if __name__ == "__main__":
+    main()
@@ -36,7 +36,7 @@ traced_wait("Init Wait")
 
 print("Performing Full Refresh (White)...")
 image = bytearray([0xFF] * (200 * 200 // 8))
-epd.display(image)
+epd.display(image, wait=False)
 duration = traced_wait("Full Display Wait")
 
 if duration < 500:
@@ -47,10 +47,22 @@ else:
 print("Performing Partial Refresh (Dots Simulation)...")
 # Just draw a few dots manually in the buffer
 for i in range(10): image[i] = 0x00
-epd.display_partial(image)
+epd.display_partial(image, wait=False)
 p_duration = traced_wait("Partial Display Wait")
 print(f"Partial duration: {p_duration}ms")
 
+print("Performing Partial Refresh (fast-partial LUT)...")
+for i in range(10, 20): image[i] = 0x00
+epd.display_partial(image, wait=False, profile="fast-partial")
+l_duration = traced_wait("LUT Partial Wait")
+
 print("Testing Sleep...")
 epd.sleep()
+
+# BUSY_MS entries for the host emulator (tools/lib/ssd1681.py), accurate to
+# the 10 ms polling interval. The fast-partial LUT takes 17 frames.
+print("Emulator timings (BUSY_MS):")
+print(f'    "full": {duration},')
+print(f'    "partial": {p_duration},')
+print(f'    "lut_frame": {max(1, (l_duration - 40) // 17)}, # with "lut_overhead": 40')
 print("Done.")